@@ -0,0 +1,36 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from rest_framework.permissions import SAFE_METHODS
+
+
+ASYNC_READ_ROUTES = (
+    'titles-list', 'titles-detail', 'reviews-list', 'comments-list',
+)
+
+
+def async_read_view(view):
+    def run_view(request, *args, **kwargs):
+        try:
+            response = view(request, *args, **kwargs)
+            if callable(getattr(response, 'render', None)):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    @wraps(view)
+    async def async_view(request, *args, **kwargs):
+        return await sync_to_async(
+            run_view, thread_sensitive=request.method not in SAFE_METHODS
+        )(request, *args, **kwargs)
+    async_view.sync_view = view
+    return async_view
+
+
+def with_async_reads(urlpatterns, routes=ASYNC_READ_ROUTES):
+    for pattern in urlpatterns:
+        if pattern.name in routes:
+            pattern.callback = async_read_view(pattern.callback)
+    return urlpatterns
@@ -0,0 +1,22 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from reviews.revoked_tokens import revoked_tokens
+
+
+TOKEN_REVOKED = 'Токен отозван.'
+
+
+def is_revoked(token, user):
+    return revoked_tokens.is_revoked(token['jti']) or (
+        user.tokens_valid_after is not None
+        and token['iat'] < int(user.tokens_valid_after.timestamp())
+    )
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if is_revoked(validated_token, user):
+            raise InvalidToken(TOKEN_REVOKED)
+        return user
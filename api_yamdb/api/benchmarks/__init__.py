@@ -0,0 +1,29 @@
+from statistics import median
+from time import perf_counter
+
+
+SCENARIOS = {
+    'asgi': 'api.benchmarks.asgi.run',
+    'connections': 'api.benchmarks.connections.run',
+    'middleware': 'api.benchmarks.middleware.run',
+    'ordering': 'api.benchmarks.ordering.run',
+    'pagination': 'api.benchmarks.pagination.run',
+    'rankings': 'api.benchmarks.rankings.run',
+    'stats': 'api.benchmarks.stats.run',
+    'user_search': 'api.benchmarks.user_search.run',
+    'validators': 'api.benchmarks.validators.run',
+}
+RESULT_LINE = '{label:<60}{value:>12.3f} мс'
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return median(timings) * 1000
+
+
+def report(stdout, label, value):
+    stdout.write(RESULT_LINE.format(label=label, value=value))
@@ -0,0 +1,87 @@
+import asyncio
+from time import sleep
+
+from asgiref.sync import async_to_sync
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client
+
+from ..async_views import with_async_reads
+from ..urls import router_v1
+from . import measure, report
+from .data import populate
+
+
+TITLES_URL = '/api/v1/titles/'
+REQUEST_PARAMS = {'page_size': 10, 'count': 'false'}
+CONCURRENCY = (1, 10, 50)
+# Network round trip to a database server, which SQLite does not have
+QUERY_LATENCY = 0.005
+# Pool threads keep their connections, as the WSGI worker does
+PERSISTENT_AGE = 60
+
+
+def delay_query(execute, sql, params, many, context):
+    sleep(QUERY_LATENCY)
+    return execute(sql, params, many, context)
+
+
+def add_latency(connection, **kwargs):
+    connection.execute_wrappers.append(delay_query)
+
+
+def set_async_reads(enabled):
+    for pattern in router_v1.urls:
+        pattern.callback = getattr(
+            pattern.callback, 'sync_view', pattern.callback
+        )
+    if enabled:
+        with_async_reads(router_v1.urls)
+
+
+def wsgi_batch(concurrency):
+    client = Client()
+
+    def batch():
+        for _ in range(concurrency):
+            client.get(TITLES_URL, REQUEST_PARAMS)
+    return batch
+
+
+def asgi_batch(concurrency):
+    client = AsyncClient()
+
+    async def requests():
+        await asyncio.gather(*(
+            client.get(TITLES_URL, REQUEST_PARAMS)
+            for _ in range(concurrency)
+        ))
+    return async_to_sync(requests)
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    conn_max_age = connections['default'].settings_dict['CONN_MAX_AGE']
+    connections['default'].settings_dict['CONN_MAX_AGE'] = PERSISTENT_AGE
+    for connection in connections.all():
+        add_latency(connection)
+    connection_created.connect(add_latency)
+    try:
+        for concurrency in CONCURRENCY:
+            report(stdout, f'WSGI, один поток: {concurrency} запросов',
+                   measure(wsgi_batch(concurrency), repeat))
+            for label, enabled in (
+                ('синхронные', False), ('асинхронные', True)
+            ):
+                set_async_reads(enabled)
+                report(
+                    stdout,
+                    f'ASGI, {label} представления: {concurrency} запросов',
+                    measure(asgi_batch(concurrency), repeat)
+                )
+    finally:
+        connection_created.disconnect(add_latency)
+        for connection in connections.all():
+            connection.execute_wrappers.remove(delay_query)
+        set_async_reads(False)
+        connections['default'].settings_dict['CONN_MAX_AGE'] = conn_max_age
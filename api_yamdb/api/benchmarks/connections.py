@@ -0,0 +1,73 @@
+from threading import Thread
+
+from django.db import close_old_connections, connection, connections
+from django.db.utils import load_backend
+from django.test import Client
+
+from . import measure, report
+from .data import populate
+
+
+TITLES_URL = '/api/v1/titles/'
+BACKENDS = (
+    ('без пула', 'django.db.backends.sqlite3'),
+    ('с пулом', 'api_yamdb.db_backends.sqlite3'),
+)
+
+
+def connect_cycle(backend):
+    wrapper = load_backend(backend).DatabaseWrapper(
+        dict(connection.settings_dict), alias=f'benchmark-{backend}'
+    )
+
+    def cycle():
+        with wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        wrapper.close()
+    return cycle
+
+
+def request_cycle(client, conn_max_age):
+    connection.close()
+    connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+
+    def cycle():
+        client.get(TITLES_URL, {'page_size': 1, 'count': 'false'})
+        close_old_connections()
+    return cycle
+
+
+def thread_cycle(client, backend):
+    connections.settings['default']['ENGINE'] = backend
+
+    def request():
+        client.get(TITLES_URL, {'page_size': 1, 'count': 'false'})
+        connections.close_all()
+
+    def cycle():
+        thread = Thread(target=request)
+        thread.start()
+        thread.join()
+    return cycle
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    client = Client()
+    conn_max_age = connection.settings_dict['CONN_MAX_AGE']
+    engine = connections.settings['default']['ENGINE']
+    try:
+        for label, backend in BACKENDS:
+            report(stdout, f'Подключение и SELECT 1 {label}', measure(
+                connect_cycle(backend), repeat
+            ))
+        for max_age in (0, 60):
+            report(stdout, f'GET {TITLES_URL}: CONN_MAX_AGE={max_age}',
+                   measure(request_cycle(client, max_age), repeat))
+        connection.settings_dict['CONN_MAX_AGE'] = 0
+        for label, backend in BACKENDS:
+            report(stdout, f'GET {TITLES_URL} в новом потоке {label}',
+                   measure(thread_cycle(client, backend), repeat))
+    finally:
+        connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+        connections.settings['default']['ENGINE'] = engine
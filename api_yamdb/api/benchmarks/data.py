@@ -0,0 +1,81 @@
+from itertools import islice
+
+from reviews.models import (
+    Category, Comment, Genre, Review, Title, YaMDBUser
+)
+from reviews.stats import rebuild_title_stats
+
+
+BATCH_SIZE = 5000
+CATEGORIES_COUNT = 10
+GENRES_COUNT = 30
+GENRES_PER_TITLE = 3
+
+
+def bulk_insert(model, objects):
+    objects = iter(objects)
+    while True:
+        batch = list(islice(objects, BATCH_SIZE))
+        if not batch:
+            break
+        model.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+
+def populate(titles, reviews_per_title=5, comments_per_review=0):
+    bulk_insert(Category, (
+        Category(id=i, name=f'Категория {i}', slug=f'category-{i}')
+        for i in range(1, CATEGORIES_COUNT + 1)
+    ))
+    bulk_insert(Genre, (
+        Genre(id=i, name=f'Жанр {i}', slug=f'genre-{i}')
+        for i in range(1, GENRES_COUNT + 1)
+    ))
+    bulk_insert(YaMDBUser, (
+        YaMDBUser(
+            id=i, username=f'reader-{i}', email=f'reader-{i}@yamdb.fake'
+        )
+        for i in range(1, reviews_per_title + 1)
+    ))
+    bulk_insert(Title, (
+        Title(
+            id=i,
+            name=f'Произведение {i}',
+            year=1900 + i % 120,
+            description='Описание',
+            category_id=i % CATEGORIES_COUNT + 1
+        )
+        for i in range(1, titles + 1)
+    ))
+    bulk_insert(Title.genre.through, (
+        Title.genre.through(
+            title_id=i, genre_id=(i + shift) % GENRES_COUNT + 1
+        )
+        for i in range(1, titles + 1)
+        for shift in range(GENRES_PER_TITLE)
+    ))
+    bulk_insert(Review, (
+        Review(
+            id=(i - 1) * reviews_per_title + author,
+            title_id=i,
+            author_id=author,
+            text='Отзыв',
+            score=(i + author) % 10 + 1
+        )
+        for i in range(1, titles + 1)
+        for author in range(1, reviews_per_title + 1)
+    ))
+    for start in range(1, titles + 1, BATCH_SIZE):
+        rebuild_title_stats(
+            list(range(start, min(start + BATCH_SIZE, titles + 1)))
+        )
+    reviews = titles * reviews_per_title
+    bulk_insert(Comment, (
+        Comment(
+            id=(i - 1) * comments_per_review + number,
+            review_id=i,
+            author_id=number % reviews_per_title + 1,
+            text='Комментарий'
+        )
+        for i in range(1, reviews + 1)
+        for number in range(1, comments_per_review + 1)
+    ))
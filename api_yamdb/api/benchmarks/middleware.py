@@ -0,0 +1,27 @@
+from unittest import mock
+
+from django.test import Client
+
+from . import measure, report
+from .data import populate
+
+
+URLS = (
+    ('/api/v1/', {}),
+    ('/api/v1/titles/', {'page_size': 1, 'count': 'false'}),
+)
+STACKS = (
+    ('полный стек middleware', '/no-lean-path/'),
+    ('без сессий, CSRF и сообщений', '/api/'),
+)
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    client = Client()
+    for url, params in URLS:
+        for label, prefix in STACKS:
+            with mock.patch('api.middleware.LEAN_PATH_PREFIX', prefix):
+                report(stdout, f'GET {url}: {label}', measure(
+                    lambda: client.get(url, params), repeat
+                ))
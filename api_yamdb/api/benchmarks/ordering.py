@@ -0,0 +1,45 @@
+from django.test import Client
+
+from reviews.models import Title
+
+from ..filters import TITLE_ORDERINGS, TitlesFilter
+from . import measure, report
+from .data import populate
+
+
+TITLES_URL = '/api/v1/titles/'
+FILESORT_MARKERS = ('USE TEMP B-TREE FOR', 'Sort Key', 'filesort')
+PLAN_LINE = '{ordering:<20}{plan}'
+PLAN_INDEX = 'сортировка по индексу'
+PLAN_FILESORT = 'СОРТИРОВКА В ПАМЯТИ'
+
+
+def uses_filesort(ordering):
+    queryset = TitlesFilter(
+        {'ordering': ordering},
+        queryset=Title.objects.select_related('category', 'stats')
+    ).qs
+    plan = queryset[:10].explain()
+    return any(marker in plan for marker in FILESORT_MARKERS)
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    client = Client()
+    deep_page = size // 20
+    orderings = [
+        f'{prefix}{key}' for key in TITLE_ORDERINGS for prefix in ('', '-')
+    ]
+    for ordering in orderings:
+        stdout.write(PLAN_LINE.format(
+            ordering=ordering,
+            plan=PLAN_FILESORT if uses_filesort(ordering) else PLAN_INDEX
+        ))
+    for ordering in orderings:
+        for page in (1, deep_page):
+            params = {'ordering': ordering, 'page': page, 'count': 'false'}
+            report(
+                stdout,
+                f'GET {TITLES_URL}?ordering={ordering}&page={page}',
+                measure(lambda: client.get(TITLES_URL, params), repeat)
+            )
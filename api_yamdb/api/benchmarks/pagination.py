@@ -0,0 +1,53 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db.models import Avg
+from django.test import Client
+
+from reviews.models import Title
+
+from ..counts import strip_for_count
+from ..pagination import PageSizePagination
+from ..views import TitleViewSet
+from . import measure, report
+from .data import populate
+
+
+TITLES_URL = '/api/v1/titles/'
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    client = Client()
+
+    def cold_request(**params):
+        cache.clear()
+        client.get(TITLES_URL, params)
+
+    report(stdout, 'COUNT(*) по запросу с Avg и сортировкой', measure(
+        Title.objects.annotate(
+            rating=Avg('reviews__score')
+        ).order_by(*Title._meta.ordering).count,
+        repeat
+    ))
+    report(stdout, 'COUNT(*) без аннотаций и сортировки', measure(
+        strip_for_count(Title.objects.distinct()).count, repeat
+    ))
+    with mock.patch.object(
+        TitleViewSet, 'pagination_class', PageSizePagination
+    ):
+        report(stdout, f'GET {TITLES_URL}: PageNumberPagination', measure(
+            lambda: client.get(TITLES_URL), repeat
+        ))
+    report(stdout, f'GET {TITLES_URL}: без кеша количества', measure(
+        cold_request, repeat
+    ))
+    report(stdout, f'GET {TITLES_URL}: количество из кеша', measure(
+        lambda: client.get(TITLES_URL), repeat
+    ))
+    report(stdout, f'GET {TITLES_URL}?genre=genre-1: без кеша', measure(
+        lambda: cold_request(genre='genre-1'), repeat
+    ))
+    report(stdout, f'GET {TITLES_URL}?count=false', measure(
+        lambda: client.get(TITLES_URL, {'count': 'false'}), repeat
+    ))
@@ -0,0 +1,32 @@
+from django.db.models import Avg
+from django.test import Client
+
+from reviews.models import Title
+from reviews.rankings import refresh_rankings
+
+from . import measure, report
+from .data import populate
+
+
+TOP_URL = '/api/v1/titles/top/'
+
+
+def run(stdout, size, repeat):
+    populate(titles=size)
+    client = Client()
+    report(stdout, 'Сортировка всех произведений по Avg, первые 50', measure(
+        lambda: list(Title.objects.annotate(
+            rating=Avg('reviews__score')
+        ).order_by('-rating').values_list('pk', flat=True)[:50]),
+        repeat
+    ))
+    report(stdout, 'refresh_rankings: полный пересчёт', measure(
+        lambda: refresh_rankings(), 1
+    ))
+    report(stdout, 'refresh_rankings: без изменений', measure(
+        refresh_rankings, repeat
+    ))
+    for params in ({}, {'by': 'reviews'}, {'genre': 'genre-1'}):
+        report(stdout, f'GET {TOP_URL} {params}', measure(
+            lambda: client.get(TOP_URL, params), repeat
+        ))
@@ -0,0 +1,26 @@
+from django.test import Client
+
+from reviews.stats import compute_title_stats
+
+from . import measure, report
+from .data import populate
+
+
+STATS_URL_TEMPLATE = '/api/v1/titles/{title_id}/stats/'
+
+
+def run(stdout, size, repeat):
+    populate(titles=size, reviews_per_title=10)
+    client = Client()
+    title_id = size // 2
+    report(stdout, 'GROUP BY по отзывам одного произведения', measure(
+        lambda: compute_title_stats([title_id]), repeat
+    ))
+    report(stdout, 'GROUP BY по отзывам всех произведений', measure(
+        compute_title_stats, repeat
+    ))
+    for title_id in (1, size):
+        url = STATS_URL_TEMPLATE.format(title_id=title_id)
+        report(stdout, f'GET {url}', measure(
+            lambda: client.get(url), repeat
+        ))
@@ -0,0 +1,59 @@
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from reviews.models import ADMIN_ROLE, YaMDBUser
+
+from ..filters import USER_SEARCH_FIELDS, prefix_search, substring_search
+from . import measure, report
+from .data import bulk_insert
+
+
+USERS_URL = '/api/v1/users/'
+SCAN_MARKERS = ('SCAN reviews_yamdbuser', 'Seq Scan', 'type: ALL')
+PLAN_LINE = '{label:<30}{plan}'
+PLAN_INDEX = 'поиск по индексу'
+PLAN_SCAN = 'полный просмотр таблицы'
+SEARCHES = (
+    ('префикс', prefix_search),
+    ('подстрока', substring_search),
+)
+
+
+def uses_scan(search, term):
+    plan = search(
+        YaMDBUser.objects.all(), USER_SEARCH_FIELDS, term
+    ).explain()
+    return any(marker in plan for marker in SCAN_MARKERS)
+
+
+def run(stdout, size, repeat):
+    bulk_insert(YaMDBUser, (
+        YaMDBUser(
+            id=i, username=f'member-{i}', email=f'member-{i}@yamdb.fake'
+        )
+        for i in range(1, size + 1)
+    ))
+    admin = YaMDBUser.objects.create(
+        username='benchmark-admin', email='admin@yamdb.fake',
+        role=ADMIN_ROLE
+    )
+    client = Client(
+        HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(admin)}'
+    )
+    term = f'member-{size // 2}'
+    for label, search in SEARCHES:
+        stdout.write(PLAN_LINE.format(
+            label=label,
+            plan=PLAN_SCAN if uses_scan(search, term) else PLAN_INDEX
+        ))
+    for label, search in SEARCHES:
+        report(stdout, f'{label}: {term}', measure(
+            lambda: list(search(
+                YaMDBUser.objects.all(), USER_SEARCH_FIELDS, term
+            )[:10]),
+            repeat
+        ))
+    for search_term in (term, term[-4:]):
+        report(stdout, f'GET {USERS_URL}?search={search_term}', measure(
+            lambda: client.get(USERS_URL, {'search': search_term}), repeat
+        ))
@@ -0,0 +1,44 @@
+import re
+
+from django.core.exceptions import ValidationError
+
+from api_yamdb.settings import SELF_ENDPOINT
+from reviews.validators import (
+    MESSAGE_RESTRICTED_USERNAME, MESSAGE_WRONG_SYMBOLS, validate_username
+)
+
+from . import measure, report
+
+
+def findall_validate_username(value):
+    wrong_symbols = re.findall(r'[^\w.@+-]', value)
+    if len(wrong_symbols):
+        raise ValidationError(MESSAGE_WRONG_SYMBOLS.format(
+            wrong_symbols=''.join(set(wrong_symbols))
+        ))
+    if value == SELF_ENDPOINT:
+        raise ValidationError(
+            MESSAGE_RESTRICTED_USERNAME.format(username=SELF_ENDPOINT)
+        )
+    return value
+
+
+VALIDATORS = (
+    ('re.findall и множества', findall_validate_username),
+    ('скомпилированный fullmatch', validate_username),
+)
+
+
+def validate_all(validator, usernames):
+    def validate():
+        for username in usernames:
+            validator(username)
+    return validate
+
+
+def run(stdout, size, repeat):
+    usernames = [f'user.name-{number}@yamdb' for number in range(size)]
+    for label, validator in VALIDATORS:
+        report(stdout, f'{size} корректных имён: {label}', measure(
+            validate_all(validator, usernames), repeat
+        ))
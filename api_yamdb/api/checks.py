@@ -0,0 +1,137 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+
+PERFORMANCE_TAG = 'performance'
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+DEBUG_IN_PRODUCTION = (
+    'DEBUG включён в production: Django хранит каждый SQL-запрос в '
+    'connection.queries, и память процесса растёт под нагрузкой.'
+)
+CONN_MAX_AGE_ZERO = (
+    'CONN_MAX_AGE = 0 для базы {alias}: соединение открывается и '
+    'закрывается на каждый запрос.'
+)
+LOCAL_CACHE = (
+    'Кеш {backend} не общий для процессов: счётчики, слаги и привязка '
+    'чтения к основной базе расходятся между воркерами.'
+)
+SQLITE_NOT_WAL = (
+    'SQLite без journal_mode=WAL: чтения блокируются на время записи.'
+)
+BROWSABLE_API = (
+    'BrowsableAPIRenderer включён в production: HTML-ответы дороже JSON.'
+)
+ALLOWED_HOSTS_ANY = (
+    'ALLOWED_HOSTS пуст или содержит "*": в production список хостов '
+    'нужно задать явно.'
+)
+ADMIN_MIDDLEWARE = (
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+)
+ADMIN_MIDDLEWARE_MISSING = (
+    'Админка подключена, но {middleware} нет ни в MIDDLEWARE, ни в '
+    'ADMIN_ONLY_MIDDLEWARE.'
+)
+POOL_NOT_SUPPORTED = (
+    'DB_POOL_SIZE задан, но пул соединений для {engine} не реализован: '
+    'настройка игнорируется.'
+)
+POOL_HINT = 'Пул поддерживается только для {engines}.'
+DEFAULT_SECRET_KEY = 'Используется SECRET_KEY по умолчанию из репозитория.'
+SET_ENV_HINT = 'Задайте переменную окружения {name}.'
+
+
+@register(PERFORMANCE_TAG)
+def check_production_settings(app_configs, **kwargs):
+    if not settings.PRODUCTION:
+        return []
+    warnings = []
+    if settings.DEBUG:
+        warnings.append(Warning(
+            DEBUG_IN_PRODUCTION,
+            hint=SET_ENV_HINT.format(name='DEBUG=false'),
+            id='api.W001'
+        ))
+    for alias, database in settings.DATABASES.items():
+        if not database.get('CONN_MAX_AGE'):
+            warnings.append(Warning(
+                CONN_MAX_AGE_ZERO.format(alias=alias),
+                hint=SET_ENV_HINT.format(name='DB_CONN_MAX_AGE'),
+                id='api.W002'
+            ))
+    backend = settings.CACHES['default']['BACKEND']
+    if backend in LOCAL_CACHE_BACKENDS:
+        warnings.append(Warning(
+            LOCAL_CACHE.format(backend=backend),
+            hint=SET_ENV_HINT.format(name='CACHE_BACKEND'),
+            id='api.W003'
+        ))
+    if (any(database['ENGINE'].endswith('sqlite3')
+            for database in settings.DATABASES.values())
+            and settings.SQLITE_PRAGMAS['journal_mode'].upper() != 'WAL'):
+        warnings.append(Warning(
+            SQLITE_NOT_WAL,
+            hint=SET_ENV_HINT.format(name='SQLITE_JOURNAL_MODE=WAL'),
+            id='api.W004'
+        ))
+    if any(
+        renderer.endswith('BrowsableAPIRenderer')
+        for renderer in settings.REST_FRAMEWORK.get(
+            'DEFAULT_RENDERER_CLASSES', ()
+        )
+    ):
+        warnings.append(Warning(BROWSABLE_API, id='api.W005'))
+    if settings.SECRET_KEY == settings.DEFAULT_SECRET_KEY:
+        warnings.append(Warning(
+            DEFAULT_SECRET_KEY,
+            hint=SET_ENV_HINT.format(name='SECRET_KEY'),
+            id='api.W006'
+        ))
+    if not settings.ALLOWED_HOSTS or '*' in settings.ALLOWED_HOSTS:
+        warnings.append(Warning(
+            ALLOWED_HOSTS_ANY,
+            hint=SET_ENV_HINT.format(name='ALLOWED_HOSTS'),
+            id='api.W007'
+        ))
+    return warnings
+
+
+@register(PERFORMANCE_TAG)
+def check_database_pool(app_configs, **kwargs):
+    if not settings.DB_POOL_SIZE:
+        return []
+    return [
+        Warning(
+            POOL_NOT_SUPPORTED.format(engine=database['ENGINE']),
+            hint=POOL_HINT.format(
+                engines=', '.join(settings.POOLED_DB_ENGINES)
+            ),
+            id='api.W008'
+        )
+        for database in settings.DATABASES.values()
+        if database['ENGINE'] not in settings.POOLED_DB_ENGINES
+    ]
+
+
+@register(Tags.admin)
+def check_admin_only_middleware(app_configs, **kwargs):
+    if not apps.is_installed('django.contrib.admin'):
+        return []
+    available = set(settings.MIDDLEWARE)
+    if settings.ADMIN_ONLY_MIDDLEWARE_CLASS in available:
+        available.update(settings.ADMIN_ONLY_MIDDLEWARE)
+    return [
+        Error(
+            ADMIN_MIDDLEWARE_MISSING.format(middleware=middleware),
+            id='api.E001'
+        )
+        for middleware in ADMIN_MIDDLEWARE
+        if middleware not in available
+    ]
@@ -0,0 +1,29 @@
+from django.db import connections
+
+from api_yamdb.settings import DB_CONN_HEALTH_CHECKS, SQLITE_PRAGMAS
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+
+
+def close_if_unusable(connection):
+    if (connection.connection is not None
+            and connection.settings_dict['CONN_MAX_AGE'] != 0
+            and not connection.in_atomic_block
+            and not connection.is_usable()):
+        connection.close()
+
+
+def check_connections(**kwargs):
+    if not DB_CONN_HEALTH_CHECKS:
+        return
+    for connection in connections.all():
+        if hasattr(connection, 'health_check_pending'):
+            connection.health_check_pending = True
+        else:
+            close_if_unusable(connection)
@@ -0,0 +1,69 @@
+from hashlib import md5
+
+from django.core.cache import cache
+from django.db import connections
+
+from api_yamdb.settings import COUNT_CACHE_TIMEOUT, COUNT_ESTIMATE_THRESHOLD
+
+
+COUNT_VERSION_KEY = 'count-version:{label}'
+COUNT_KEY = 'count:{label}:{version}:{digest}'
+ESTIMATE_VENDORS = ('postgresql',)
+
+
+def get_count_version(model):
+    key = COUNT_VERSION_KEY.format(label=model._meta.label_lower)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def invalidate_counts(model):
+    key = COUNT_VERSION_KEY.format(label=model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def get_count_cache_key(model, path, params):
+    digest = md5(
+        f'{path}?{sorted(params.items())}'.encode()
+    ).hexdigest()
+    return COUNT_KEY.format(
+        label=model._meta.label_lower,
+        version=get_count_version(model),
+        digest=digest
+    )
+
+
+def strip_for_count(queryset):
+    return queryset.order_by().values('pk')
+
+
+def estimate_count(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def count_queryset(queryset, threshold=COUNT_ESTIMATE_THRESHOLD):
+    if (threshold is None
+            or connections[queryset.db].vendor not in ESTIMATE_VENDORS):
+        return queryset.count(), False
+    bounded = queryset[:threshold + 1].count()
+    if bounded <= threshold:
+        return bounded, False
+    return max(estimate_count(queryset), bounded), True
+
+
+def get_cached_count(queryset, cache_key, timeout=COUNT_CACHE_TIMEOUT):
+    result = cache.get(cache_key)
+    if result is None:
+        result = count_queryset(queryset)
+        cache.set(cache_key, result, timeout)
+    return result
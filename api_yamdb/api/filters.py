@@ -1,18 +1,79 @@
+import sys
+
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django_filters import rest_framework as filter
+from rest_framework.filters import SearchFilter
 
 from reviews.models import Title
+from reviews.slug_cache import category_slugs, genre_slugs
+
+
+TITLE_ORDERINGS = {
+    'year': ('year', 'name', 'pk'),
+    'name': ('name', 'pk'),
+    'newest': ('-pk',),
+    'rating': ('-stats__rated', '-stats__average', '-stats__title_id'),
+    'weighted_rating': (
+        '-stats__rated', '-stats__weighted_rating', '-stats__title_id'
+    ),
+    'review_count': ('-stats__count', '-stats__title_id'),
+}
+USER_SEARCH_FIELDS = ('username', 'email')
+ORDERING_CHOICES = [
+    (f'{prefix}{key}', f'{prefix}{key}')
+    for key in TITLE_ORDERINGS for prefix in ('', '-')
+]
+
+
+def reverse_ordering(field):
+    return field[1:] if field.startswith('-') else f'-{field}'
+
+
+def prefix_upper_bound(prefix):
+    last = ord(prefix[-1])
+    if last == sys.maxunicode:
+        return None
+    return prefix[:-1] + chr(last + 1)
+
+
+def prefix_search(queryset, fields, prefix):
+    upper_bound = prefix_upper_bound(prefix)
+    condition = Q()
+    for field in fields:
+        lookups = {f'{field}_lower__gte': prefix}
+        if upper_bound is not None:
+            lookups[f'{field}_lower__lt'] = upper_bound
+        condition |= Q(**lookups)
+    return queryset.alias(**{
+        f'{field}_lower': Lower(field) for field in fields
+    }).filter(condition)
+
+
+def substring_search(queryset, fields, term):
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': term})
+    return queryset.filter(condition)
+
+
+class UserSearchFilter(SearchFilter):
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '').strip()
+        fields = self.get_search_fields(view, request)
+        if not term or not fields:
+            return queryset
+        substring_matches = substring_search(queryset, fields, term)
+        if not term.isascii():
+            return substring_matches
+        view.fallback_queryset = substring_matches
+        return prefix_search(queryset, fields, term.lower())
 
 
 class TitlesFilter(filter.FilterSet):
 
-    category = filter.CharFilter(
-        field_name='category__slug',
-        lookup_expr='icontains'
-    )
-    genre = filter.CharFilter(
-        field_name='genre__slug',
-        lookup_expr='icontains'
-    )
+    category = filter.CharFilter(method='filter_category')
+    genre = filter.CharFilter(method='filter_genre')
     name = filter.CharFilter(
         field_name='name',
         lookup_expr='contains'
@@ -21,7 +82,31 @@ class TitlesFilter(filter.FilterSet):
         field_name="year",
         lookup_expr='exact'
     )
+    ordering = filter.ChoiceFilter(
+        choices=ORDERING_CHOICES,
+        method='order_titles'
+    )
 
     class Meta:
         model = Title
         fields = ('category', 'genre', 'name', 'year')
+
+    def filter_category(self, queryset, name, value):
+        return queryset.filter(
+            category_id__in=category_slugs.ids_containing(value)
+        )
+
+    def filter_genre(self, queryset, name, value):
+        return queryset.filter(
+            pk__in=Title.genre.through.objects.filter(
+                genre_id__in=genre_slugs.ids_containing(value)
+            ).values('title_id')
+        )
+
+    def order_titles(self, queryset, name, value):
+        fields = TITLE_ORDERINGS[value.lstrip('-')]
+        if value.startswith('-'):
+            fields = [reverse_ordering(field) for field in fields]
+        if any(field.lstrip('-').startswith('stats__') for field in fields):
+            queryset = queryset.filter(stats__isnull=False)
+        return queryset.order_by(*fields)
@@ -0,0 +1,54 @@
+import os
+from tempfile import gettempdir
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+
+from ...benchmarks import SCENARIOS
+
+
+COMMAND_HELP = '''benchmark - замеряет время выполнения сценария на
+                  временной базе данных, заполненной тестовыми данными.
+               '''
+SCENARIO_HELP = 'Название сценария.'
+SIZE_HELP = 'Количество произведений в тестовых данных.'
+REPEAT_HELP = 'Количество повторов каждого замера.'
+SCENARIO_TITLE = 'Сценарий {scenario}, произведений: {size}'
+SQLITE_BENCHMARK_FILE = 'yamdb_benchmark.sqlite3'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'scenario', choices=sorted(SCENARIOS), help=SCENARIO_HELP
+        )
+        parser.add_argument(
+            '--size', type=int, default=20000, help=SIZE_HELP
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20, help=REPEAT_HELP
+        )
+
+    def handle(self, *args, **options):
+        run = import_string(SCENARIOS[options['scenario']])
+        self.stdout.write(SCENARIO_TITLE.format(**options))
+        old_name = connection.settings_dict['NAME']
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = os.path.join(
+                gettempdir(), SQLITE_BENCHMARK_FILE
+            )
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            with override_settings(DEBUG=False, REST_FRAMEWORK={
+                **settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}
+            }):
+                run(self.stdout, options['size'], options['repeat'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
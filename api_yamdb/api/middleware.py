@@ -0,0 +1,97 @@
+import asyncio
+from hashlib import md5
+from http import HTTPStatus
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+from rest_framework.permissions import SAFE_METHODS
+
+from api_yamdb.settings import (
+    ADMIN_ONLY_MIDDLEWARE, LEAN_PATH_PREFIX, REPLICA_STICKY_SECONDS
+)
+
+from .routers import read_from_replica, replica_configured
+
+
+STICKY_KEY = 'replica-sticky:{client}'
+
+
+def get_client_key(request):
+    authorization = request.META.get('HTTP_AUTHORIZATION')
+    if authorization:
+        return md5(authorization.encode()).hexdigest()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    def reads_from_replica(self, request):
+        if not replica_configured() or request.method not in SAFE_METHODS:
+            return False
+        key = STICKY_KEY.format(client=get_client_key(request))
+        return cache.get(key) is None
+
+    def stick_to_primary(self, request, response):
+        if (replica_configured()
+                and request.method not in SAFE_METHODS
+                and response.status_code < HTTPStatus.BAD_REQUEST):
+            key = STICKY_KEY.format(client=get_client_key(request))
+            cache.set(key, True, REPLICA_STICKY_SECONDS)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = read_from_replica.set(self.reads_from_replica(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+        self.stick_to_primary(request, response)
+        return response
+
+    async def __acall__(self, request):
+        token = read_from_replica.set(await sync_to_async(
+            self.reads_from_replica, thread_sensitive=True
+        )(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+        await sync_to_async(
+            self.stick_to_primary, thread_sensitive=True
+        )(request, response)
+        return response
+
+
+def is_lean_request(request):
+    return request.path_info.startswith(LEAN_PATH_PREFIX)
+
+
+class AdminOnlyMiddleware(MiddlewareMixin):
+    def __init__(self, get_response, middleware_paths=ADMIN_ONLY_MIDDLEWARE):
+        super().__init__(get_response)
+        self.full_response = get_response
+        self.middleware = []
+        for path in reversed(middleware_paths):
+            middleware = import_string(path)(self.full_response)
+            self.middleware.insert(0, middleware)
+            self.full_response = convert_exception_to_response(middleware)
+
+    def __call__(self, request):
+        if is_lean_request(request):
+            return self.get_response(request)
+        return self.full_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if is_lean_request(request):
+            return None
+        for middleware in self.middleware:
+            if hasattr(middleware, 'process_view'):
+                response = middleware.process_view(
+                    request, view_func, view_args, view_kwargs
+                )
+                if response is not None:
+                    return response
+        return None
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+
+from django.core.paginator import (
+    EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+)
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+from api_yamdb.settings import MAX_PAGE_SIZE
+
+from .counts import get_cached_count, get_count_cache_key, strip_for_count
+
+
+COUNT_DISABLED_VALUES = ('0', 'false', 'no', 'off')
+PAGE_NOT_INTEGER = 'Номер страницы должен быть целым числом'
+PAGE_LESS_THAN_ONE = 'Номер страницы меньше 1'
+PAGE_EMPTY = 'На этой странице нет результатов'
+
+
+class CountlessPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class CountlessPaginator(Paginator):
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(PAGE_NOT_INTEGER)
+        if number < 1:
+            raise EmptyPage(PAGE_LESS_THAN_ONE)
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(
+            self.object_list[bottom:bottom + self.per_page + 1]
+        )
+        if not object_list and number > 1:
+            raise EmptyPage(PAGE_EMPTY)
+        return CountlessPage(
+            object_list[:self.per_page],
+            number,
+            self,
+            has_next=len(object_list) > self.per_page
+        )
+
+
+class FallbackPaginator(Paginator):
+    def __init__(self, object_list, per_page, fallback=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.fallback = fallback
+
+    @cached_property
+    def count(self):
+        count = self.object_list.count()
+        if count or self.fallback is None:
+            return count
+        self.object_list = self.fallback
+        return self.object_list.count()
+
+
+class PageSizePagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+
+
+class FallbackPagination(PageSizePagination):
+    def paginate_queryset(self, queryset, request, view=None):
+        self.fallback = getattr(view, 'fallback_queryset', None)
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        return FallbackPaginator(object_list, per_page, self.fallback)
+
+
+class OptionalCountPagination(PageSizePagination):
+    count_query_param = 'count'
+    uncounted_query_params = ('page', 'page_size', 'count')
+
+    def count_requested(self, request):
+        return request.query_params.get(
+            self.count_query_param, ''
+        ).lower() not in COUNT_DISABLED_VALUES
+
+    def get_count(self, queryset, request, view=None):
+        get_count_queryset = getattr(view, 'get_count_queryset', None)
+        if get_count_queryset is not None:
+            queryset = get_count_queryset()
+        params = {
+            key: value for key, value in request.query_params.items()
+            if key not in self.uncounted_query_params
+        }
+        return get_cached_count(
+            strip_for_count(queryset),
+            get_count_cache_key(queryset.model, request.path, params)
+        )
+
+    def get_page_number(self, request, paginator):
+        if isinstance(paginator, CountlessPaginator):
+            return request.query_params.get(self.page_query_param, 1)
+        return super().get_page_number(request, paginator)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        self.count = None
+        estimated = False
+        if self.count_requested(request):
+            self.count, estimated = self.get_count(queryset, request, view)
+        if self.count is None or estimated:
+            paginator = CountlessPaginator(queryset, page_size)
+        else:
+            paginator = self.django_paginator_class(queryset, page_size)
+            paginator.count = self.count
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            ))
+        self.request = request
+        return list(self.page)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
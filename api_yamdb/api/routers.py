@@ -0,0 +1,35 @@
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from api_yamdb.settings import REPLICA_APPS, REPLICA_DB_ALIAS
+
+
+read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if (read_from_replica.get()
+                and model._meta.app_label in REPLICA_APPS
+                and replica_configured()):
+            return REPLICA_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = (DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS)
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
@@ -1,12 +1,112 @@
+from collections import defaultdict
+
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
 
+from api_yamdb.settings import BULK_MAX_ITEMS
 from reviews.models import (
     Category, Comment, Genre,
-    MAX_EMAILFIELD_LENGTH, MAX_CONFCODE_LENGTH, MAX_USERNAME_LENGTH,
-    MIN_SCORE, MAX_SCORE,
-    Review, Title, YaMDBUser
+    MAX_EMAILFIELD_LENGTH, MAX_CONFCODE_LENGTH, MAX_SLUG_LENGTH,
+    MAX_USERNAME_LENGTH, MIN_SCORE, MAX_SCORE,
+    SCORES, Review, Title, TitleStats, YaMDBUser
+)
+from reviews.slug_cache import category_slugs, genre_slugs
+from reviews.user_import import (
+    EMAIL_EXISTS, USERNAME_EXISTS, find_existing_users
 )
-from reviews.validators import validate_username, year_validator
+from reviews.validators import (
+    slug_validator, validate_username, year_validator
+)
+
+from .counts import invalidate_counts
+
+
+FIELDS_QUERY_PARAM = 'fields'
+BULK_NOT_A_LIST = 'Ожидается список объектов.'
+BULK_WRONG_SIZE = 'Передайте от 1 до {limit} объектов.'
+REQUIRED_FIELD = 'Обязательное поле.'
+DUPLICATED_IN_REQUEST = 'Значение {value} повторяется в запросе.'
+SLUG_EXISTS = 'Объект со слагом {slug} уже существует.'
+SLUG_NOT_FOUND = 'Объект со слагом {slug} не существует.'
+TITLE_NOT_FOUND = 'Произведение с id {id} не существует.'
+USER_NOT_FOUND = 'Пользователь с username {username} не существует.'
+
+
+def get_requested_fields(request):
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    value = request.query_params.get(FIELDS_QUERY_PARAM)
+    if not value:
+        return None
+    return {field.strip() for field in value.split(',') if field.strip()}
+
+
+class RequestedFieldsMixin():
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested_fields = get_requested_fields(self.context.get('request'))
+        if requested_fields is None:
+            return
+        for field in set(self.fields) - requested_fields:
+            self.fields.pop(field)
+
+
+def add_item_error(errors, index, field, message):
+    errors[index].setdefault(field, []).append(message)
+
+
+def insert_titles(titles):
+    features = connections[Title.objects.db].features
+    if features.can_return_rows_from_bulk_insert:
+        Title.objects.bulk_create(titles)
+    else:
+        for title in titles:
+            title.skip_stats = True
+            title.save(force_insert=True)
+    TitleStats.objects.bulk_create(
+        TitleStats(title=title) for title in titles
+    )
+    return titles
+
+
+def set_prefetched_genres(title, genres):
+    cache = title.__dict__.setdefault('_prefetched_objects_cache', {})
+    cache.pop('genre', None)
+    queryset = title.genre.all()
+    queryset._result_cache = list(genres)
+    queryset._prefetch_done = True
+    cache['genre'] = queryset
+
+
+def set_title_genres(genres_by_title, current=None):
+    through = Title.genre.through
+    if current is None:
+        current = defaultdict(set)
+        for title_id, genre_id in through.objects.filter(
+            title_id__in=genres_by_title
+        ).values_list('title_id', 'genre_id'):
+            current[title_id].add(genre_id)
+    removed = Q()
+    added = []
+    for title_id, genres in genres_by_title.items():
+        genre_ids = {genre.pk for genre in genres}
+        current_ids = current.get(title_id, set())
+        if current_ids - genre_ids:
+            removed |= Q(
+                title_id=title_id, genre_id__in=current_ids - genre_ids
+            )
+        added.extend(
+            through(title_id=title_id, genre_id=genre_id)
+            for genre_id in genre_ids - current_ids
+        )
+    if removed:
+        through.objects.filter(removed).delete()
+    if added:
+        through.objects.bulk_create(added)
 
 
 class VerifyUsernameMixin():
@@ -44,6 +144,15 @@ class TokenSerialiser(serializers.Serializer, VerifyUsernameMixin):
     )
 
 
+class RefreshTokenSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=True)
+
+
+class RevokeTokenSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=False)
+    all = serializers.BooleanField(default=False)
+
+
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
@@ -56,28 +165,63 @@ class GenreSerializer(serializers.ModelSerializer):
         fields = ('name', 'slug')
 
 
-class TitleReadSerializer(serializers.ModelSerializer):
+class TitleReadSerializer(RequestedFieldsMixin,
+                          serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     genre = GenreSerializer(many=True, read_only=True)
-    rating = serializers.IntegerField(read_only=True)
+    rating = serializers.IntegerField(
+        source='stats.average', read_only=True
+    )
+    weighted_rating = serializers.FloatField(
+        source='stats.weighted_rating', read_only=True
+    )
 
     class Meta:
         model = Title
         fields = (
-            'id', 'name', 'year', 'description', 'genre', 'category', 'rating'
+            'id', 'name', 'year', 'description', 'genre', 'category',
+            'rating', 'weighted_rating'
         )
         read_only_fields = fields
 
 
+class TitleStatsSerializer(serializers.ModelSerializer):
+    mean = serializers.FloatField(source='average', read_only=True)
+    median = serializers.FloatField(read_only=True)
+    histogram = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TitleStats
+        fields = ('count', 'mean', 'median', 'weighted_rating', 'histogram')
+        read_only_fields = fields
+
+    def get_histogram(self, stats):
+        return dict(zip(
+            (str(score) for score in SCORES), stats.histogram
+        ))
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    def __init__(self, slug_cache, **kwargs):
+        self.slug_cache = slug_cache
+        super().__init__(
+            slug_field='slug', queryset=slug_cache.model.objects.all(),
+            **kwargs
+        )
+
+    def to_internal_value(self, data):
+        obj = self.slug_cache.get(str(data))
+        if obj is None:
+            self.fail(
+                'does_not_exist', slug_name=self.slug_field, value=data
+            )
+        return obj
+
+
 class TitleRecordSerializer(serializers.ModelSerializer):
-    category = serializers.SlugRelatedField(
-        slug_field='slug',
-        queryset=Category.objects.all()
-    )
-    genre = serializers.SlugRelatedField(
-        slug_field='slug',
-        queryset=Genre.objects.all(),
-        many=True
+    category = CachedSlugRelatedField(slug_cache=category_slugs)
+    genre = serializers.ListField(
+        child=serializers.SlugField(max_length=MAX_SLUG_LENGTH)
     )
 
     class Meta:
@@ -92,8 +236,41 @@ class TitleRecordSerializer(serializers.ModelSerializer):
     def validate_year(self, year):
         return year_validator(year)
 
+    def validate_genre(self, slugs):
+        slugs = list(dict.fromkeys(slugs))
+        genres = genre_slugs.resolve(slugs)
+        missing = [slug for slug in slugs if slug not in genres]
+        if missing:
+            raise serializers.ValidationError(
+                [SLUG_NOT_FOUND.format(slug=slug) for slug in missing]
+            )
+        return [genres[slug] for slug in slugs]
 
-class ReviewSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        genres = validated_data.pop('genre')
+        with transaction.atomic():
+            title = super().create(validated_data)
+            set_title_genres({title.pk: genres}, current={})
+        set_prefetched_genres(title, genres)
+        return title
+
+    def update(self, instance, validated_data):
+        genres = validated_data.pop('genre', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if genres is not None:
+                set_title_genres(
+                    {instance.pk: genres},
+                    current={instance.pk: {
+                        genre.pk for genre in instance.genre.all()
+                    }}
+                )
+        if genres is not None:
+            set_prefetched_genres(instance, genres)
+        return instance
+
+
+class ReviewSerializer(RequestedFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field='username'
@@ -123,7 +300,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         return data
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(RequestedFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field='username'
@@ -132,3 +309,323 @@ class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ('id', 'text', 'author', 'pub_date')
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [BULK_NOT_A_LIST]
+            })
+        if not 0 < len(data) <= BULK_MAX_ITEMS:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    BULK_WRONG_SIZE.format(limit=BULK_MAX_ITEMS)
+                ]
+            })
+        items = []
+        errors = []
+        for item in data:
+            try:
+                items.append(self.child.run_validation(item))
+                errors.append({})
+            except serializers.ValidationError as exc:
+                items.append(None)
+                errors.append(exc.detail)
+        self.validate_items(items, errors)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def validate_items(self, items, errors):
+        pass
+
+    def save(self, **kwargs):
+        if self.partial:
+            self.instance = self.bulk_update(self.validated_data)
+        else:
+            self.instance = self.create(self.validated_data)
+        return self.instance
+
+
+class SlugNameBulkListSerializer(BulkListSerializer):
+    def validate_items(self, items, errors):
+        model = self.child.Meta.model
+        self.existing = model.objects.in_bulk(
+            {item['slug'] for item in items if item},
+            field_name='slug'
+        )
+        seen = set()
+        for index, item in enumerate(items):
+            if item is None:
+                continue
+            slug = item['slug']
+            if slug in seen:
+                add_item_error(
+                    errors, index, 'slug',
+                    DUPLICATED_IN_REQUEST.format(value=slug)
+                )
+            seen.add(slug)
+            if self.partial and slug not in self.existing:
+                add_item_error(
+                    errors, index, 'slug', SLUG_NOT_FOUND.format(slug=slug)
+                )
+            elif not self.partial and slug in self.existing:
+                add_item_error(
+                    errors, index, 'slug', SLUG_EXISTS.format(slug=slug)
+                )
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objects = model.objects.bulk_create(
+            model(**item) for item in validated_data
+        )
+        self.child.slug_cache.invalidate()
+        return objects
+
+    def bulk_update(self, validated_data):
+        objects = []
+        for item in validated_data:
+            obj = self.existing[item['slug']]
+            if 'name' in item:
+                obj.name = item['name']
+                objects.append(obj)
+        if objects:
+            self.child.Meta.model.objects.bulk_update(objects, ('name',))
+            self.child.slug_cache.invalidate()
+        return [self.existing[item['slug']] for item in validated_data]
+
+
+class SlugNameBulkSerializer(serializers.ModelSerializer):
+    slug = serializers.SlugField(
+        max_length=MAX_SLUG_LENGTH, validators=(slug_validator,)
+    )
+
+    class Meta:
+        fields = ('name', 'slug')
+        list_serializer_class = SlugNameBulkListSerializer
+
+    def validate(self, data):
+        if 'slug' not in data:
+            raise serializers.ValidationError({'slug': [REQUIRED_FIELD]})
+        return data
+
+
+class CategoryBulkSerializer(SlugNameBulkSerializer):
+    slug_cache = category_slugs
+
+    class Meta(SlugNameBulkSerializer.Meta):
+        model = Category
+
+
+class GenreBulkSerializer(SlugNameBulkSerializer):
+    slug_cache = genre_slugs
+
+    class Meta(SlugNameBulkSerializer.Meta):
+        model = Genre
+
+
+class TitleBulkListSerializer(BulkListSerializer):
+    def validate_items(self, items, errors):
+        valid_items = [item for item in items if item]
+        categories = category_slugs.resolve(
+            {item['category'] for item in valid_items if 'category' in item}
+        )
+        genres = genre_slugs.resolve(
+            {slug for item in valid_items for slug in item.get('genre', ())}
+        )
+        self.titles = Title.objects.in_bulk(
+            {item['id'] for item in valid_items if 'id' in item}
+        ) if self.partial else {}
+        seen_ids = set()
+        for index, item in enumerate(items):
+            if item is None:
+                continue
+            if self.partial:
+                self.validate_title_id(item, index, errors, seen_ids)
+            else:
+                item.pop('id', None)
+            if 'category' in item:
+                slug = item['category']
+                if slug in categories:
+                    item['category'] = categories[slug]
+                else:
+                    add_item_error(
+                        errors, index, 'category',
+                        SLUG_NOT_FOUND.format(slug=slug)
+                    )
+            if 'genre' in item:
+                for slug in item['genre']:
+                    if slug not in genres:
+                        add_item_error(
+                            errors, index, 'genre',
+                            SLUG_NOT_FOUND.format(slug=slug)
+                        )
+                item['genre'] = [
+                    genres[slug] for slug in dict.fromkeys(item['genre'])
+                    if slug in genres
+                ]
+
+    def validate_title_id(self, item, index, errors, seen_ids):
+        if 'id' not in item:
+            add_item_error(errors, index, 'id', REQUIRED_FIELD)
+            return
+        title_id = item['id']
+        if title_id in seen_ids:
+            add_item_error(
+                errors, index, 'id',
+                DUPLICATED_IN_REQUEST.format(value=title_id)
+            )
+        seen_ids.add(title_id)
+        if title_id not in self.titles:
+            add_item_error(
+                errors, index, 'id', TITLE_NOT_FOUND.format(id=title_id)
+            )
+
+    def create(self, validated_data):
+        titles = [
+            Title(**{
+                field: value for field, value in item.items()
+                if field != 'genre'
+            })
+            for item in validated_data
+        ]
+        with transaction.atomic():
+            insert_titles(titles)
+            set_title_genres({
+                title.pk: item['genre']
+                for title, item in zip(titles, validated_data)
+            }, current={})
+        invalidate_counts(Title)
+        return titles
+
+    def bulk_update(self, validated_data):
+        titles = []
+        fields = set()
+        genres_by_title = {}
+        for item in validated_data:
+            title = self.titles[item.pop('id')]
+            if 'genre' in item:
+                genres_by_title[title.pk] = item.pop('genre')
+            for field, value in item.items():
+                setattr(title, field, value)
+                fields.add(field)
+            titles.append(title)
+        with transaction.atomic():
+            if fields:
+                Title.objects.bulk_update(titles, fields)
+            if genres_by_title:
+                set_title_genres(genres_by_title)
+        invalidate_counts(Title)
+        return titles
+
+
+class TitleBulkSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+    category = serializers.SlugField(max_length=MAX_SLUG_LENGTH)
+    genre = serializers.ListField(
+        child=serializers.SlugField(max_length=MAX_SLUG_LENGTH)
+    )
+
+    class Meta:
+        model = Title
+        fields = ('id', 'name', 'year', 'description', 'genre', 'category')
+        list_serializer_class = TitleBulkListSerializer
+
+
+class YaMDBUserBulkListSerializer(BulkListSerializer):
+    def validate_items(self, items, errors):
+        valid_items = [item for item in items if item]
+        emails = {item['email'] for item in valid_items if 'email' in item}
+        if self.partial:
+            self.users = YaMDBUser.objects.in_bulk(
+                {item['username'] for item in valid_items},
+                field_name='username'
+            )
+            existing = find_existing_users(emails=emails)
+        else:
+            existing = find_existing_users(
+                {item['username'] for item in valid_items}, emails
+            )
+        seen = {'username': set(), 'email': set()}
+        for index, item in enumerate(items):
+            if item is None:
+                continue
+            for field, values in seen.items():
+                if field not in item:
+                    continue
+                if item[field] in values:
+                    add_item_error(
+                        errors, index, field,
+                        DUPLICATED_IN_REQUEST.format(value=item[field])
+                    )
+                values.add(item[field])
+            if self.partial:
+                self.validate_user(item, index, errors, existing)
+                continue
+            for field, message in (
+                ('username', USERNAME_EXISTS), ('email', EMAIL_EXISTS)
+            ):
+                if item[field] in existing[field]:
+                    add_item_error(
+                        errors, index, field,
+                        message.format(**{field: item[field]})
+                    )
+
+    def validate_user(self, item, index, errors, existing):
+        username = item['username']
+        user = self.users.get(username)
+        if user is None:
+            add_item_error(
+                errors, index, 'username',
+                USER_NOT_FOUND.format(username=username)
+            )
+            return
+        email = item.get('email')
+        if email is not None and existing['email'].get(
+            email, user.pk
+        ) != user.pk:
+            add_item_error(
+                errors, index, 'email', EMAIL_EXISTS.format(email=email)
+            )
+
+    def create(self, validated_data):
+        return YaMDBUser.objects.bulk_create(
+            YaMDBUser(**item) for item in validated_data
+        )
+
+    def bulk_update(self, validated_data):
+        users = []
+        fields = set()
+        now = timezone.now()
+        for item in validated_data:
+            user = self.users[item.pop('username')]
+            for field, value in item.items():
+                setattr(user, field, value)
+                fields.add(field)
+            if user.access_changed():
+                user.tokens_valid_after = now
+                fields.add('tokens_valid_after')
+            users.append(user)
+        if fields:
+            YaMDBUser.objects.bulk_update(users, fields)
+        return users
+
+
+class YaMDBUserBulkSerializer(serializers.ModelSerializer,
+                              VerifyUsernameMixin):
+    username = serializers.CharField(max_length=MAX_USERNAME_LENGTH)
+    email = serializers.EmailField(max_length=MAX_EMAILFIELD_LENGTH)
+
+    class Meta:
+        model = YaMDBUser
+        fields = (
+            'username', 'email', 'first_name', 'last_name', 'bio', 'role',
+            'is_active',
+        )
+        list_serializer_class = YaMDBUserBulkListSerializer
+
+    def validate(self, data):
+        if 'username' not in data:
+            raise serializers.ValidationError({'username': [REQUIRED_FIELD]})
+        return data
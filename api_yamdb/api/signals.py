@@ -0,0 +1,43 @@
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from reviews.models import Category, Comment, Genre, Review, Title
+
+from .connections import check_connections, configure_sqlite
+from .counts import invalidate_counts
+
+
+COUNTED_MODELS = {
+    Title: Title,
+    Title.genre.through: Title,
+    Category: Title,
+    Genre: Title,
+    Review: Review,
+    Comment: Comment,
+}
+
+
+def invalidate_counts_handler(sender, action='post_', **kwargs):
+    if action.startswith('post_'):
+        invalidate_counts(COUNTED_MODELS[sender])
+
+
+def connect_signals():
+    for sender in COUNTED_MODELS:
+        signals = (
+            (m2m_changed,) if sender._meta.auto_created
+            else (post_save, post_delete)
+        )
+        for signal in signals:
+            signal.connect(
+                invalidate_counts_handler,
+                sender=sender,
+                dispatch_uid=f'counts-{sender._meta.label_lower}'
+            )
+    connection_created.connect(
+        configure_sqlite, dispatch_uid='configure-sqlite'
+    )
+    request_started.connect(
+        check_connections, dispatch_uid='check-connections'
+    )
@@ -0,0 +1,158 @@
+from collections.abc import Mapping
+from contextlib import suppress
+from hashlib import md5
+from math import ceil, floor
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import SimpleRateThrottle
+
+from reviews.models import ADMIN_ROLE, MODERATOR_ROLE
+
+
+MILLISECONDS = 1000
+USER_IDENT_FIELDS = ('username', 'email')
+ANONYMOUS_ROLE = 'anon'
+ROLE_SCOPE = '{role}_{access}'
+WINDOW_KEY = '{key}_{window}'
+RATE_LIMIT_HEADER = 'X-RateLimit-Limit'
+RATE_REMAINING_HEADER = 'X-RateLimit-Remaining'
+RATE_RESET_HEADER = 'X-RateLimit-Reset'
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    def get_idents(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return (request.user.pk,)
+        return (self.get_ident(request),)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.now = int(self.timer() * MILLISECONDS)
+        self.interval = self.duration * MILLISECONDS // self.num_requests
+        self.tolerance = self.interval * (self.num_requests - 1)
+        self.timeout = ceil((self.tolerance + self.interval) / MILLISECONDS)
+        self.retry_after = 0
+        for ident in self.get_idents(request, view):
+            self.retry_after = self.consume(
+                self.cache_format % {'scope': self.scope, 'ident': ident}
+            )
+            if self.retry_after:
+                return False
+        return True
+
+    def consume(self, key):
+        arrival = self.now + self.interval
+        if self.cache.add(key, arrival, self.timeout):
+            return 0
+        try:
+            arrival = self.cache.incr(key, self.interval)
+        except ValueError:
+            self.cache.set(key, arrival, self.timeout)
+            return 0
+        previous = arrival - self.interval
+        if previous < self.now:
+            self.cache.set(key, self.now + self.interval, self.timeout)
+            return 0
+        if previous - self.now > self.tolerance:
+            with suppress(ValueError):
+                self.cache.decr(key, self.interval)
+            return previous - self.tolerance - self.now
+        self.cache.touch(key, self.timeout)
+        return 0
+
+    def wait(self):
+        return self.retry_after / MILLISECONDS
+
+
+class AuthIPThrottle(TokenBucketThrottle):
+    scope = 'auth_ip'
+
+    def get_idents(self, request, view):
+        return (self.get_ident(request),)
+
+
+class AuthUserThrottle(TokenBucketThrottle):
+    scope = 'auth_user'
+
+    def get_idents(self, request, view):
+        if not isinstance(request.data, Mapping):
+            return ()
+        return [
+            f'{field}_{md5(str(value).lower().encode()).hexdigest()}'
+            for field, value in (
+                (field, request.data.get(field))
+                for field in USER_IDENT_FIELDS
+            )
+            if value
+        ]
+
+
+def get_role(user):
+    if not user.is_authenticated:
+        return ANONYMOUS_ROLE
+    if user.is_admin:
+        return ADMIN_ROLE
+    if user.is_moderator:
+        return MODERATOR_ROLE
+    return user.role
+
+
+class RoleRateThrottle(SimpleRateThrottle):
+    def get_rate(self):
+        return settings.REST_FRAMEWORK.get(
+            'DEFAULT_THROTTLE_RATES', {}
+        ).get(self.scope)
+
+    def get_cache_key(self, request, view):
+        ident = (
+            request.user.pk if request.user.is_authenticated
+            else self.get_ident(request)
+        )
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def allow_request(self, request, view):
+        self.scope = ROLE_SCOPE.format(
+            role=get_role(request.user),
+            access='read' if request.method in SAFE_METHODS else 'write'
+        )
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self.now = self.timer()
+        window, offset = divmod(self.now, self.duration)
+        self.elapsed = offset / self.duration
+        key = self.get_cache_key(request, view)
+        current_key = WINDOW_KEY.format(key=key, window=int(window))
+        self.cache.add(current_key, 0, 2 * self.duration)
+        try:
+            self.current = self.cache.incr(current_key)
+        except ValueError:
+            self.cache.set(current_key, 1, 2 * self.duration)
+            self.current = 1
+        self.previous = self.cache.get(
+            WINDOW_KEY.format(key=key, window=int(window) - 1), 0
+        )
+        estimate = self.previous * (1 - self.elapsed) + self.current
+        allowed = estimate <= self.num_requests
+        if not allowed:
+            self.current -= 1
+            with suppress(ValueError):
+                self.cache.decr(current_key)
+            estimate -= 1
+        view.headers.update({
+            RATE_LIMIT_HEADER: self.num_requests,
+            RATE_REMAINING_HEADER: max(0, floor(self.num_requests - estimate)),
+            RATE_RESET_HEADER: ceil((1 - self.elapsed) * self.duration),
+        })
+        return allowed
+
+    def wait(self):
+        free = self.num_requests - self.current - 1
+        if free >= 0:
+            return (1 - free / self.previous - self.elapsed) * self.duration
+        return (
+            2 - self.elapsed - (self.num_requests - 1) / self.current
+        ) * self.duration
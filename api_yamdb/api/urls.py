@@ -1,14 +1,19 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from api_yamdb.settings import ASYNC_READ_VIEWS
+
+from .async_views import with_async_reads
 from .views import (CategoryViewSet, CommentViewSet, GenreViewSet,
                     ReviewViewSet, TitleViewSet, YaMDBUserViewSet, get_token,
-                    signup)
+                    refresh_token, revoke_token, signup)
 
 
 auth_urls = [
     path('auth/signup/', signup),
     path('auth/token/', get_token),
+    path('auth/token/refresh/', refresh_token),
+    path('auth/token/revoke/', revoke_token),
 ]
 router_v1 = DefaultRouter()
 router_v1.register(
@@ -41,7 +46,10 @@ router_v1.register(
     YaMDBUserViewSet,
     basename='users'
 )
+v1_urls = router_v1.urls
+if ASYNC_READ_VIEWS:
+    v1_urls = with_async_reads(v1_urls)
 urlpatterns = [
-    path('v1/', include(router_v1.urls)),
+    path('v1/', include(v1_urls)),
     path('v1/', include(auth_urls)),
 ]
@@ -1,52 +1,127 @@
 from http import HTTPStatus
 
 from django.core.mail import send_mail
-from django.db import IntegrityError
-from django.db.models import Avg
+from django.db.models import F, Q, Window
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.utils import crypto
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, serializers, viewsets
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import (
+    action, api_view, permission_classes, throttle_classes
+)
 from rest_framework.permissions import SAFE_METHODS, AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
-from api_yamdb.settings import EMAIL_NOREPLY
+from api_yamdb.settings import (
+    BATCH_MAX_IDS, EMAIL_NOREPLY, INCLUDE_COMMENTS_LIMIT,
+    INCLUDE_REVIEWS_LIMIT
+)
+from reviews.confirmation_codes import issue_code, redeem_code
 from reviews.models import (
-    MAX_CONFCODE_LENGTH, Category, Genre, Review, Title, YaMDBUser
+    RANKING_KINDS, RANKING_RATING, Category, Comment, Genre, Ranking, Review,
+    Title, TitleStats, YaMDBUser
 )
-from reviews.validators import SELF_ENDPOINT
+from reviews.rankings import CATEGORY_SCOPE, GENRE_SCOPE, OVERALL_SCOPE
+from reviews.revoked_tokens import revoked_tokens
+from reviews.slug_cache import category_slugs, genre_slugs
+from reviews.validators import BULK_ENDPOINT, SELF_ENDPOINT
 
-from .filters import TitlesFilter
+from .authentication import TOKEN_REVOKED, RevocableJWTAuthentication
+from .filters import USER_SEARCH_FIELDS, TitlesFilter, UserSearchFilter
+from .pagination import FallbackPagination, OptionalCountPagination
 from .permissions import (
     IsAdminOnly, IsAdminOrReadOnly, IsAuthorIsAdminIsModeratorOrReadOnly
 )
 from .serializers import (
-    CategorySerializer, CommentSerializer, GenreSerializer,
-    ReviewSerializer, SingupSerializer, TitleRecordSerializer,
-    TitleReadSerializer, TokenSerialiser, YaMDBUserSerializer
+    FIELDS_QUERY_PARAM, CategoryBulkSerializer, CategorySerializer,
+    CommentSerializer, GenreBulkSerializer, GenreSerializer,
+    RefreshTokenSerializer, ReviewSerializer, RevokeTokenSerializer,
+    SingupSerializer, TitleBulkSerializer, TitleRecordSerializer,
+    TitleReadSerializer, TitleStatsSerializer, TokenSerialiser,
+    YaMDBUserBulkSerializer, YaMDBUserSerializer, get_requested_fields
 )
+from .throttling import AuthIPThrottle, AuthUserThrottle
 
 
 ENAIL_CODE_SUBJECT = 'YaMDB: код подтвержжения в системе'
 ENAIL_CODE_MESSAGE = 'Ваш код для входа: {code}'
 ACCESS_CODE_ERROR = 'Невереный код подтверждения'
+FOREIGN_TOKEN = 'Токен выдан другому пользователю.'
 EMAIL_EXISTS = 'Пользователь с почтой {email} уже существует.'
 USERNAME_EXISTS = 'Пользователь с юзернеймом {username} уже существует.'
+INCLUDE_QUERY_PARAM = 'include'
+INCLUDE_REVIEWS = 'reviews'
+INCLUDE_COMMENTS = 'reviews.comments'
+BATCH_IDS_QUERY_PARAM = 'ids'
+BATCH_IDS_ERROR = 'Передайте от 1 до {limit} целых id через запятую.'
+RANKING_QUERY_PARAM = 'by'
+RANKING_KIND_ERROR = (
+    'Недопустимое значение {value}. Допустимые значения: {choices}.'
+)
+RANKING_SCOPE_ERROR = (
+    'Укажите не больше одного из параметров: category, genre.'
+)
+RANKING_SCOPE_NOT_FOUND = 'Объект со слагом {slug} не существует.'
+RANKING_SCOPES = (
+    ('category', category_slugs, CATEGORY_SCOPE),
+    ('genre', genre_slugs, GENRE_SCOPE),
+)
+FIELDS_ERROR = 'Недопустимые поля: {values}. Допустимые поля: {choices}.'
+INCLUDE_ERROR = (
+    'Недопустимые значения: {values}. Допустимые значения: {choices}.'
+)
+
+
+class BulkWriteMixin():
+    bulk_serializer_class = None
 
+    def get_bulk_response_data(self, serializer):
+        return serializer.data
 
-class YaMDBUserViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=('post', 'patch'), url_path=BULK_ENDPOINT)
+    def bulk(self, request):
+        serializer = self.bulk_serializer_class(
+            data=request.data,
+            many=True,
+            partial=request.method == 'PATCH',
+            context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(
+            self.get_bulk_response_data(serializer),
+            status=(
+                HTTPStatus.CREATED if request.method == 'POST'
+                else HTTPStatus.OK
+            )
+        )
+
+
+class YaMDBUserViewSet(BulkWriteMixin, viewsets.ModelViewSet):
     queryset = YaMDBUser.objects.all()
     serializer_class = YaMDBUserSerializer
+    bulk_serializer_class = YaMDBUserBulkSerializer
     lookup_field = 'username'
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['username']
+    filter_backends = [UserSearchFilter]
+    search_fields = USER_SEARCH_FIELDS
+    pagination_class = FallbackPagination
     permission_classes = (IsAdminOnly,)
     http_method_names = [
         'get', 'post', 'patch', 'delete', 'options',
     ]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method in SAFE_METHODS:
+            return queryset.only('pk', *YaMDBUserSerializer.Meta.fields)
+        return queryset
+
     @action(detail=False,
             methods=('get', 'patch'),
             url_path=SELF_ENDPOINT,
@@ -68,30 +143,52 @@ class YaMDBUserViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=HTTPStatus.OK)
 
 
+def latest_comment_ids(reviews, limit):
+    ranked = Comment.objects.filter(review__in=reviews).annotate(
+        position=Window(
+            RowNumber(),
+            partition_by=[F('review')],
+            order_by=F('pub_date').desc()
+        )
+    ).order_by().values('pk', 'position')
+    sql, params = ranked.query.sql_with_params()
+    return RawSQL(
+        f'SELECT id FROM ({sql}) ranked WHERE position <= %s',
+        (*params, limit)
+    )
+
+
+def get_or_create_signup_user(username, email):
+    YaMDBUser.objects.bulk_create(
+        [YaMDBUser(username=username, email=email)], ignore_conflicts=True
+    )
+    users = list(YaMDBUser.objects.filter(
+        Q(username=username) | Q(email=email)
+    ).only('pk', 'username', 'email'))
+    for user in users:
+        if user.username == username and user.email == email:
+            return user
+    if any(user.username == username for user in users):
+        raise serializers.ValidationError({
+            'username': [USERNAME_EXISTS.format(username=username)]
+        })
+    raise serializers.ValidationError({
+        'email': [EMAIL_EXISTS.format(email=email)]
+    })
+
+
 @api_view(('POST',))
 @permission_classes((AllowAny,))
+@throttle_classes((AuthIPThrottle, AuthUserThrottle))
 def signup(request):
     serializer = SingupSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     email = serializer.validated_data['email']
     username = serializer.validated_data['username']
-    try:
-        user, _ = YaMDBUser.objects.get_or_create(
-            username=username,
-            email=email,
-        )
-    except IntegrityError:
-        error_message = {
-            'username': [USERNAME_EXISTS.format(username=username)]
-        } if YaMDBUser.objects.filter(username=username).exists() else {
-            'email': [EMAIL_EXISTS.format(email=email)]
-        }
-        raise serializers.ValidationError(error_message)
-    user.confirmation_code = crypto.get_random_string(MAX_CONFCODE_LENGTH)
-    user.save()
+    user = get_or_create_signup_user(username, email)
     send_mail(
         subject=ENAIL_CODE_SUBJECT,
-        message=ENAIL_CODE_MESSAGE.format(code=user.confirmation_code),
+        message=ENAIL_CODE_MESSAGE.format(code=issue_code(user)),
         from_email=EMAIL_NOREPLY,
         recipient_list=(email,),
         fail_silently=True,
@@ -104,6 +201,7 @@ def signup(request):
 
 @api_view(('POST',))
 @permission_classes((AllowAny,))
+@throttle_classes((AuthIPThrottle, AuthUserThrottle))
 def get_token(request):
     serializer = TokenSerialiser(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -113,16 +211,88 @@ def get_token(request):
         YaMDBUser,
         username=username
     )
-    user_confirmation_code = user.confirmation_code
-    if user_confirmation_code != '':
-        user.confirmation_code = ''
-        user.save()
-        if user_confirmation_code == confirmation_code:
-            return Response(
-                data={'token': str(AccessToken.for_user(user))},
-                status=HTTPStatus.OK
-            )
+    if not redeem_code(user, confirmation_code):
         raise serializers.ValidationError({'error': ACCESS_CODE_ERROR})
+    return Response(data=issue_tokens(user), status=HTTPStatus.OK)
+
+
+def issue_tokens(user):
+    refresh = RefreshToken.for_user(user)
+    return {'token': str(refresh.access_token), 'refresh': str(refresh)}
+
+
+def get_refresh_token(raw_token):
+    try:
+        return RefreshToken(raw_token)
+    except TokenError as error:
+        raise InvalidToken(error.args[0])
+
+
+@api_view(('POST',))
+@permission_classes((AllowAny,))
+@throttle_classes((AuthIPThrottle,))
+def refresh_token(request):
+    serializer = RefreshTokenSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    refresh = get_refresh_token(serializer.validated_data['refresh'])
+    user = RevocableJWTAuthentication().get_user(refresh)
+    if not revoked_tokens.revoke(refresh):
+        raise InvalidToken(TOKEN_REVOKED)
+    return Response(data=issue_tokens(user), status=HTTPStatus.OK)
+
+
+@api_view(('POST',))
+def revoke_token(request):
+    serializer = RevokeTokenSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    if 'refresh' in serializer.validated_data:
+        refresh = get_refresh_token(serializer.validated_data['refresh'])
+        if refresh[jwt_settings.USER_ID_CLAIM] != request.user.pk:
+            raise serializers.ValidationError({'refresh': [FOREIGN_TOKEN]})
+        revoked_tokens.revoke(refresh)
+    revoked_tokens.revoke(request.auth)
+    if serializer.validated_data['all']:
+        YaMDBUser.objects.filter(pk=request.user.pk).update(
+            tokens_valid_after=timezone.now()
+        )
+    return Response(status=HTTPStatus.NO_CONTENT)
+
+
+class RequestedFieldsViewMixin():
+    related_columns = {}
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        requested_fields = get_requested_fields(request)
+        if requested_fields is None:
+            return
+        choices = self.get_serializer_class()().fields
+        unknown = requested_fields - set(choices)
+        if unknown:
+            raise serializers.ValidationError({
+                FIELDS_QUERY_PARAM: [FIELDS_ERROR.format(
+                    values=', '.join(sorted(unknown)),
+                    choices=', '.join(choices)
+                )]
+            })
+
+    def is_requested(self, field):
+        requested_fields = get_requested_fields(self.request)
+        return requested_fields is None or field in requested_fields
+
+    def only_requested(self, queryset):
+        requested_fields = get_requested_fields(self.request)
+        if requested_fields is None:
+            return queryset
+        concrete_fields = {
+            field.name for field in queryset.model._meta.concrete_fields
+        }
+        columns = ['pk']
+        for field in requested_fields:
+            if field in concrete_fields:
+                columns.append(field)
+            columns.extend(self.related_columns.get(field, ()))
+        return queryset.only(*columns)
 
 
 class ListCreateDestroyGenericViewSet(
@@ -133,33 +303,200 @@ class ListCreateDestroyGenericViewSet(
     search_fields = ('name',)
     lookup_field = 'slug'
     permission_classes = (IsAdminOrReadOnly,)
+    slug_cache = None
 
+    def get_object(self):
+        obj = self.slug_cache.get(self.kwargs[self.lookup_field])
+        if obj is None:
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
 
-class CategoryViewSet(ListCreateDestroyGenericViewSet):
+
+class CategoryViewSet(BulkWriteMixin, ListCreateDestroyGenericViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    bulk_serializer_class = CategoryBulkSerializer
+    slug_cache = category_slugs
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.all().annotate(
-        rating=Avg('reviews__score')
-    ).order_by(*Title._meta.ordering)
+class TitleViewSet(RequestedFieldsViewMixin, BulkWriteMixin,
+                   viewsets.ModelViewSet):
+    queryset = Title.objects.all()
+    lookup_value_regex = r'\d+'
+    bulk_serializer_class = TitleBulkSerializer
+    related_columns = {
+        'rating': ('stats__average',),
+        'weighted_rating': ('stats__weighted_rating',),
+    }
     permission_classes = (IsAdminOrReadOnly,)
+    pagination_class = OptionalCountPagination
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitlesFilter
     http_method_names = [
         'get', 'post', 'patch', 'delete', 'options',
     ]
 
+    def get_queryset(self):
+        queryset = self.only_requested(super().get_queryset())
+        if self.is_requested('category'):
+            queryset = queryset.select_related('category')
+        if self.is_requested('genre'):
+            queryset = queryset.prefetch_related('genre')
+        if (self.is_requested('rating')
+                or self.is_requested('weighted_rating')):
+            queryset = queryset.select_related('stats')
+        return queryset.order_by(*Title._meta.ordering)
+
+    def get_count_queryset(self):
+        return self.filter_queryset(super().get_queryset())
+
+    def get_includes(self):
+        value = self.request.query_params.get(INCLUDE_QUERY_PARAM, '')
+        includes = {item.strip() for item in value.split(',') if item.strip()}
+        unknown = includes - {INCLUDE_REVIEWS, INCLUDE_COMMENTS}
+        if unknown:
+            raise serializers.ValidationError({
+                INCLUDE_QUERY_PARAM: [INCLUDE_ERROR.format(
+                    values=', '.join(sorted(unknown)),
+                    choices=', '.join((INCLUDE_REVIEWS, INCLUDE_COMMENTS))
+                )]
+            })
+        if INCLUDE_COMMENTS in includes:
+            includes.add(INCLUDE_REVIEWS)
+        return includes
+
+    def get_included_reviews(self, title, with_comments):
+        reviews = list(
+            title.reviews.select_related('author')[:INCLUDE_REVIEWS_LIMIT]
+        )
+        data = ReviewSerializer(reviews, many=True).data
+        if not with_comments or not reviews:
+            return data
+        comments = {review.pk: [] for review in reviews}
+        for comment in Comment.objects.filter(
+            pk__in=latest_comment_ids(reviews, INCLUDE_COMMENTS_LIMIT)
+        ).select_related('author'):
+            comments[comment.review_id].append(comment)
+        for review, review_data in zip(reviews, data):
+            review_data['comments'] = CommentSerializer(
+                comments[review.pk], many=True
+            ).data
+        return data
+
+    def get_bulk_response_data(self, serializer):
+        titles = self.get_queryset().in_bulk(
+            [title.pk for title in serializer.instance]
+        )
+        return TitleReadSerializer(
+            [titles[title.pk] for title in serializer.instance],
+            many=True,
+            context=self.get_serializer_context()
+        ).data
+
+    def get_batch_ids(self):
+        value = self.request.query_params.get(BATCH_IDS_QUERY_PARAM, '')
+        try:
+            ids = list(dict.fromkeys(
+                int(item) for item in value.split(',') if item.strip()
+            ))
+        except ValueError:
+            ids = []
+        if not 0 < len(ids) <= BATCH_MAX_IDS:
+            raise serializers.ValidationError({
+                BATCH_IDS_QUERY_PARAM: [
+                    BATCH_IDS_ERROR.format(limit=BATCH_MAX_IDS)
+                ]
+            })
+        return ids
+
+    @action(detail=False, methods=('get',), url_path='batch')
+    def batch(self, request):
+        ids = self.get_batch_ids()
+        titles = self.get_queryset().in_bulk(ids)
+        serializer = self.get_serializer(
+            [titles[pk] for pk in ids if pk in titles], many=True
+        )
+        return Response({
+            'results': serializer.data,
+            'missing': [pk for pk in ids if pk not in titles],
+        })
+
+    def get_ranking_kind(self):
+        kind = self.request.query_params.get(
+            RANKING_QUERY_PARAM, RANKING_RATING
+        )
+        choices = [choice for choice, _ in RANKING_KINDS]
+        if kind not in choices:
+            raise serializers.ValidationError({
+                RANKING_QUERY_PARAM: [RANKING_KIND_ERROR.format(
+                    value=kind, choices=', '.join(choices)
+                )]
+            })
+        return kind
+
+    def get_ranking_scope(self):
+        params = self.request.query_params
+        requested = [scope for scope in RANKING_SCOPES if scope[0] in params]
+        if len(requested) > 1:
+            raise serializers.ValidationError(RANKING_SCOPE_ERROR)
+        if not requested:
+            return OVERALL_SCOPE
+        param, slug_cache, scope = requested[0]
+        obj = slug_cache.get(params[param])
+        if obj is None:
+            raise serializers.ValidationError({
+                param: [RANKING_SCOPE_NOT_FOUND.format(slug=params[param])]
+            })
+        return scope.format(id=obj.pk)
+
+    @action(detail=False, methods=('get',), url_path='top')
+    def top(self, request):
+        kind = self.get_ranking_kind()
+        rankings = list(Ranking.objects.filter(
+            kind=kind, scope=self.get_ranking_scope()
+        ).values_list('position', 'title_id', 'value'))
+        titles = self.get_queryset().in_bulk(
+            [title_id for _, title_id, _ in rankings]
+        )
+        rankings = [row for row in rankings if row[1] in titles]
+        results = self.get_serializer(
+            [titles[title_id] for _, title_id, _ in rankings], many=True
+        ).data
+        for data, (position, _, value) in zip(results, rankings):
+            data['position'] = position
+            data['value'] = value
+        return Response({RANKING_QUERY_PARAM: kind, 'results': results})
+
+    @action(detail=True, methods=('get',), url_path='stats')
+    def stats(self, request, pk=None):
+        stats = TitleStats.objects.filter(title_id=pk).first()
+        if stats is None:
+            title = get_object_or_404(Title.objects.only('pk'), pk=pk)
+            stats = TitleStats(title=title)
+        return Response(TitleStatsSerializer(stats).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        includes = self.get_includes()
+        instance = self.get_object()
+        data = self.get_serializer(instance).data
+        if INCLUDE_REVIEWS in includes:
+            data['reviews'] = self.get_included_reviews(
+                instance, with_comments=INCLUDE_COMMENTS in includes
+            )
+        return Response(data)
+
     def get_serializer_class(self):
         if self.request.method in SAFE_METHODS:
             return TitleReadSerializer
         return TitleRecordSerializer
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(RequestedFieldsViewMixin, viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
+    related_columns = {'author': ('author__username',)}
     permission_classes = (IsAuthorIsAdminIsModeratorOrReadOnly,)
+    pagination_class = OptionalCountPagination
     http_method_names = [
         'get', 'post', 'patch', 'delete', 'options',
     ]
@@ -171,12 +508,17 @@ class ReviewViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user, title=self.get_title())
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        queryset = self.only_requested(self.get_title().reviews.all())
+        if self.is_requested('author'):
+            queryset = queryset.select_related('author')
+        return queryset
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(RequestedFieldsViewMixin, viewsets.ModelViewSet):
     serializer_class = CommentSerializer
+    related_columns = {'author': ('author__username',)}
     permission_classes = (IsAuthorIsAdminIsModeratorOrReadOnly,)
+    pagination_class = OptionalCountPagination
     http_method_names = [
         'get', 'post', 'patch', 'delete', 'options',
     ]
@@ -188,9 +530,14 @@ class CommentViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user, review=self.get_review())
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        queryset = self.only_requested(self.get_review().comments.all())
+        if self.is_requested('author'):
+            queryset = queryset.select_related('author')
+        return queryset
 
 
-class GenreViewSet(ListCreateDestroyGenericViewSet):
+class GenreViewSet(BulkWriteMixin, ListCreateDestroyGenericViewSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    bulk_serializer_class = GenreBulkSerializer
+    slug_cache = genre_slugs
@@ -0,0 +1,11 @@
+from api.connections import close_if_unusable
+
+
+class HealthCheckMixin():
+    health_check_pending = False
+
+    def ensure_connection(self):
+        if self.health_check_pending:
+            self.health_check_pending = False
+            close_if_unusable(self)
+        super().ensure_connection()
@@ -0,0 +1,50 @@
+from queue import Empty, Full, LifoQueue
+from threading import Lock
+
+from django.db.backends.sqlite3 import base
+
+from api_yamdb.settings import DB_POOL_SIZE
+
+from ..mixins import HealthCheckMixin
+
+
+DEFAULT_POOL_SIZE = 10
+
+
+class DatabaseWrapper(HealthCheckMixin, base.DatabaseWrapper):
+    pool_size = DB_POOL_SIZE or DEFAULT_POOL_SIZE
+    pools = {}
+    pools_lock = Lock()
+
+    def get_pool(self):
+        key = str(self.settings_dict['NAME'])
+        with self.pools_lock:
+            if key not in self.pools:
+                self.pools[key] = LifoQueue(maxsize=self.pool_size)
+            return self.pools[key]
+
+    def get_new_connection(self, conn_params):
+        if not self.is_in_memory_db():
+            try:
+                return self.get_pool().get_nowait()
+            except Empty:
+                pass
+        return super().get_new_connection(conn_params)
+
+    def _close(self):
+        if self.connection is None or self.is_in_memory_db():
+            return super()._close()
+        try:
+            self.connection.rollback()
+        except base.Database.Error:
+            return self.discard_connection()
+        try:
+            self.get_pool().put_nowait(self.connection)
+        except Full:
+            super()._close()
+
+    def discard_connection(self):
+        try:
+            super()._close()
+        except base.Database.Error:
+            pass
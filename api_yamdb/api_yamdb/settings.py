@@ -1,19 +1,47 @@
+import os
 from datetime import timedelta
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+
+def get_env_flag(name, default):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+# DJANGO_ENV=production switches the defaults below to the production profile
+PRODUCTION = os.getenv('DJANGO_ENV', 'development') == 'production'
+
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'p&l%385148kslhtyn^##a1)ilz@4zqj=rq&agdol^##zgl9(vs'
+DEFAULT_SECRET_KEY = 'p&l%385148kslhtyn^##a1)ilz@4zqj=rq&agdol^##zgl9(vs'
+SECRET_KEY = os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = get_env_flag('DEBUG', not PRODUCTION)
 
-ALLOWED_HOSTS = ['*']
+ALLOWED_HOSTS = [
+    host for host in os.getenv(
+        'ALLOWED_HOSTS', '' if PRODUCTION else '*'
+    ).split(',') if host
+]
+
+ADMIN_ENABLED = get_env_flag('ADMIN_ENABLED', True)
+
+# Enabled by asgi.py: hot read views then run in a thread pool instead of the
+# single thread Django gives sync views under ASGI
+ASYNC_READ_VIEWS = get_env_flag('ASYNC_READ_VIEWS', False)
+
+# Enabled by wsgi.py and asgi.py: slug caches load on the first request of a
+# server process instead of on the first request that needs them
+WARM_SLUG_CACHES = get_env_flag('WARM_SLUG_CACHES', False)
 
 EMAIL_NOREPLY = 'noreply@yamdb.ru'
 
 SELF_ENDPOINT = 'me'
+BULK_ENDPOINT = 'bulk'
 
 
 # Application definition
@@ -33,13 +61,38 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'api.middleware.ReplicaRoutingMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'api.middleware.AdminOnlyMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+# Only the admin needs sessions, messages and CSRF: the API uses JWT.
+# AdminOnlyMiddleware runs these for every path except LEAN_PATH_PREFIX
+ADMIN_ONLY_APPS = (
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+)
+ADMIN_ONLY_MIDDLEWARE = (
+    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-]
+)
+LEAN_PATH_PREFIX = '/api/'
+ADMIN_ONLY_MIDDLEWARE_CLASS = 'api.middleware.AdminOnlyMiddleware'
+if not ADMIN_ENABLED:
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS if app not in ADMIN_ONLY_APPS
+    ]
+    MIDDLEWARE.remove(ADMIN_ONLY_MIDDLEWARE_CLASS)
+# The admin checks look for these middleware in MIDDLEWARE directly;
+# api.E001 looks for them in ADMIN_ONLY_MIDDLEWARE instead
+SILENCED_SYSTEM_CHECKS = (
+    ['admin.E408', 'admin.E409', 'admin.E410']
+    if ADMIN_ONLY_MIDDLEWARE_CLASS in MIDDLEWARE else []
+)
 
 ROOT_URLCONF = 'api_yamdb.urls'
 
@@ -65,13 +118,64 @@ WSGI_APPLICATION = 'api_yamdb.wsgi.application'
 
 # Database
 
+# Only the SQLite backend pools connections, other engines ignore
+# DB_POOL_SIZE (api.W008). For PostgreSQL set
+# DB_ENGINE=api_yamdb.db_backends.postgresql to health-check lazily
+POOLED_DB_ENGINES = ('api_yamdb.db_backends.sqlite3',)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 0))
+DB_CONN_HEALTH_CHECKS = get_env_flag('DB_CONN_HEALTH_CHECKS', True)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': os.getenv(
+            'DB_ENGINE',
+            'api_yamdb.db_backends.sqlite3' if DB_POOL_SIZE
+            else 'django.db.backends.sqlite3'
+        ),
+        'NAME': os.getenv('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        'USER': os.getenv('DB_USER', ''),
+        'PASSWORD': os.getenv('DB_PASSWORD', ''),
+        'HOST': os.getenv('DB_HOST', ''),
+        'PORT': os.getenv('DB_PORT', ''),
+        'CONN_MAX_AGE': int(
+            os.getenv('DB_CONN_MAX_AGE', 60 if PRODUCTION else 0)
+        ),
+    }
+}
+
+REPLICA_DB_ALIAS = 'replica'
+REPLICA_APPS = ('reviews',)
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', 10))
+
+if os.getenv('DB_REPLICA_NAME'):
+    DATABASES[REPLICA_DB_ALIAS] = {
+        **DATABASES['default'],
+        'NAME': os.getenv('DB_REPLICA_NAME'),
+        'HOST': os.getenv('DB_REPLICA_HOST', DATABASES['default']['HOST']),
+        'PORT': os.getenv('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['api.routers.PrimaryReplicaRouter']
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'yamdb'),
+        'TIMEOUT': int(os.getenv('CACHE_TIMEOUT', 300)),
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'yamdb'),
     }
 }
 
+SQLITE_PRAGMAS = {
+    'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+    'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+}
+
 # Custom user model
 
 AUTH_USER_MODEL = 'reviews.YaMDBUser'
@@ -95,18 +199,55 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.RevocableJWTAuthentication',
     ),
 
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
 
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10
+    'DEFAULT_THROTTLE_CLASSES': (
+        'api.throttling.RoleRateThrottle',
+    ),
+    # Roles and methods without a rate here are not throttled
+    'DEFAULT_THROTTLE_RATES': {
+        'auth_ip': '20/minute',
+        'auth_user': '5/minute',
+        'anon_read': '120/minute',
+        'user_read': '600/minute',
+        'user_write': '60/minute',
+        'moderator_read': '600/minute',
+        'moderator_write': '120/minute',
+    },
+
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.PageSizePagination',
+    'PAGE_SIZE': 10,
+
+    'DEFAULT_RENDERER_CLASSES': (
+        ('rest_framework.renderers.JSONRenderer',)
+        + (('rest_framework.renderers.BrowsableAPIRenderer',) if DEBUG else ())
+    ),
 }
+MAX_PAGE_SIZE = 100
+COUNT_CACHE_TIMEOUT = 60
+COUNT_ESTIMATE_THRESHOLD = 100000
+INCLUDE_REVIEWS_LIMIT = 10
+INCLUDE_COMMENTS_LIMIT = 3
+BATCH_MAX_IDS = 100
+BULK_MAX_ITEMS = 100
+RANKING_SIZE = 50
+TRENDING_DAYS = 7
+CONFIRMATION_CODE_LIFETIME = timedelta(hours=1)
+REVOKED_TOKENS_SYNC_SECONDS = 5
+# Revocations committed late or stamped by a lagging clock are picked up
+# if they fall within this window before the previous sync
+REVOKED_TOKENS_SYNC_OVERLAP = timedelta(minutes=1)
+WEIGHTED_RATING_PRIOR_MEAN = 6.0
+WEIGHTED_RATING_MIN_VOTES = 10
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
@@ -1,9 +1,9 @@
-from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import TemplateView
 
+from api_yamdb.settings import ADMIN_ENABLED
+
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path(
         'redoc/',
         TemplateView.as_view(template_name='redoc.html'),
@@ -11,3 +11,8 @@ urlpatterns = [
     ),
     path('api/', include('api.urls')),
 ]
+
+if ADMIN_ENABLED:
+    from django.contrib import admin
+
+    urlpatterns.append(path('admin/', admin.site.urls))
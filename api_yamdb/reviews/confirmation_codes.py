@@ -0,0 +1,52 @@
+from django.db import IntegrityError, transaction
+from django.utils import crypto, timezone
+
+from api_yamdb.settings import CONFIRMATION_CODE_LIFETIME
+
+from .models import MAX_CONFCODE_LENGTH, ConfirmationCode
+
+
+HASH_SALT = 'reviews.confirmation_codes'
+
+
+def hash_code(code):
+    return crypto.salted_hmac(
+        HASH_SALT, str(code), algorithm='sha256'
+    ).hexdigest()
+
+
+def issue_code(user):
+    code = crypto.get_random_string(MAX_CONFCODE_LENGTH)
+    values = {
+        'code_hash': hash_code(code),
+        'expires_at': timezone.now() + CONFIRMATION_CODE_LIFETIME,
+    }
+    codes = ConfirmationCode.objects.filter(user=user)
+    if not codes.update(**values):
+        try:
+            with transaction.atomic():
+                ConfirmationCode.objects.create(user=user, **values)
+        except IntegrityError:
+            codes.update(**values)
+    return code
+
+
+def redeem_code(user, code):
+    deleted, _ = ConfirmationCode.objects.filter(
+        user=user, code_hash=hash_code(code), expires_at__gt=timezone.now()
+    ).delete()
+    if deleted:
+        return True
+    ConfirmationCode.objects.filter(user=user).delete()
+    return False
+
+
+def purge_expired_codes(batch_size):
+    purged = 0
+    while True:
+        batch = list(ConfirmationCode.objects.filter(
+            expires_at__lte=timezone.now()
+        ).values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            return purged
+        purged += ConfirmationCode.objects.filter(pk__in=batch).delete()[0]
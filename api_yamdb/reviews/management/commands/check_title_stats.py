@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...models import SCORE_FIELDS, Title
+from ...stats import find_stats_mismatches, fix_stats_mismatches
+
+
+COMMAND_HELP = '''check_title_stats - сверяет сохранённую статистику оценок
+                   произведений с отзывами в базе данных.
+                '''
+FIX_HELP = 'Исправить найденные расхождения.'
+BATCH_SIZE_HELP = 'Количество произведений, проверяемых за один проход.'
+MISMATCH_LINE = (
+    'Произведение {title_id}: сохранено {stored}, ожидается {expected}'
+)
+SUMMARY = 'Проверено произведений: {checked}, расхождений: {mismatches}'
+FIXED = 'Исправлено расхождений: {fixed}'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix', action='store_true', help=FIX_HELP
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000, help=BATCH_SIZE_HELP
+        )
+
+    def handle(self, *args, **options):
+        title_ids = list(
+            Title.objects.order_by('pk').values_list('pk', flat=True)
+        )
+        checked = 0
+        found = 0
+        for start in range(0, len(title_ids), options['batch_size']):
+            batch = title_ids[start:start + options['batch_size']]
+            with transaction.atomic():
+                mismatches = find_stats_mismatches(batch)
+                if options['fix']:
+                    fix_stats_mismatches(mismatches)
+            for title_id, (stats, values) in mismatches.items():
+                self.stdout.write(MISMATCH_LINE.format(
+                    title_id=title_id,
+                    stored=stats.histogram if stats else None,
+                    expected=[values[field] for field in SCORE_FIELDS]
+                ))
+            checked += len(batch)
+            found += len(mismatches)
+        self.stdout.write(SUMMARY.format(checked=checked, mismatches=found))
+        if options['fix']:
+            self.stdout.write(FIXED.format(fixed=found))
@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand
 from ...models import (
     Category, Comment, Genre, Review, Title, YaMDBUser
 )
+from ...user_import import import_users, write_import_report
 
 
 COMMAND_HELP = '''fill_db_from_csv - заполняет базу данных из csv-файлов
@@ -14,12 +15,8 @@ COMMAND_HELP = '''fill_db_from_csv - заполняет базу данных и
 DATA_HELP = 'Директория с csv-файлами для заполнения базы данных.'
 
 
+USERS_FILE = 'users.csv'
 CSV_PARAMS = (
-    (
-        YaMDBUser,
-        'users.csv',
-        None
-    ),
     (
         Category,
         'category.csv',
@@ -88,6 +85,12 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **kwargs):
+        with open(
+            f'{kwargs["dir"]}{USERS_FILE}', 'r', encoding='utf-8'
+        ) as file:
+            write_import_report(
+                self.stdout, import_users(csv.DictReader(file))
+            )
         for model, file_name, related_fields in CSV_PARAMS:
             self.fill_model_table(
                 model, file_name, related_fields=related_fields, **kwargs
@@ -0,0 +1,33 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from ...user_import import (
+    INSERT_BATCH_SIZE, import_users, write_import_report
+)
+
+
+COMMAND_HELP = '''import_users - загружает пользователей из csv-файла.
+                 Строки проверяются целиком до записи в базу данных,
+                 ошибки выводятся построчно.
+              '''
+FILE_HELP = 'Путь к csv-файлу с пользователями.'
+BATCH_SIZE_HELP = 'Количество пользователей, добавляемых за один запрос.'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', type=str, help=FILE_HELP)
+        parser.add_argument(
+            '--batch-size', type=int, default=INSERT_BATCH_SIZE,
+            help=BATCH_SIZE_HELP
+        )
+
+    def handle(self, *args, **options):
+        with open(options['file'], 'r', encoding='utf-8') as file:
+            report = import_users(
+                csv.DictReader(file), batch_size=options['batch_size']
+            )
+        write_import_report(self.stdout, report)
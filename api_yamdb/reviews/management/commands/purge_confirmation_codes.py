@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from ...confirmation_codes import purge_expired_codes
+
+
+COMMAND_HELP = '''purge_confirmation_codes - удаляет просроченные коды
+                  подтверждения. Запускайте по расписанию.
+               '''
+BATCH_SIZE_HELP = 'Количество кодов, удаляемых за один запрос.'
+SUMMARY = 'Удалено просроченных кодов: {purged}'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000, help=BATCH_SIZE_HELP
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(SUMMARY.format(
+            purged=purge_expired_codes(options['batch_size'])
+        ))
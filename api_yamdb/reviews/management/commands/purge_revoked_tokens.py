@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from ...revoked_tokens import purge_expired_tokens
+
+
+COMMAND_HELP = '''purge_revoked_tokens - удаляет записи об отозванных
+                  токенах, срок действия которых истёк. Запускайте по
+                  расписанию.
+               '''
+BATCH_SIZE_HELP = 'Количество записей, удаляемых за один запрос.'
+SUMMARY = 'Удалено записей об отозванных токенах: {purged}'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000, help=BATCH_SIZE_HELP
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(SUMMARY.format(
+            purged=purge_expired_tokens(options['batch_size'])
+        ))
@@ -0,0 +1,31 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from api_yamdb.settings import RANKING_SIZE
+
+from ...rankings import refresh_rankings
+
+
+COMMAND_HELP = '''refresh_rankings - пересчитывает списки лучших произведений
+                  по рейтингу, числу отзывов и популярности за последние дни.
+                  Предназначена для периодического запуска (cron).
+               '''
+SIZE_HELP = 'Количество мест в каждом списке.'
+REFRESHED = 'Обновлено списков: {changed} за {elapsed:.3f} с'
+
+
+class Command(BaseCommand):
+    help = COMMAND_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size', type=int, default=RANKING_SIZE, help=SIZE_HELP
+        )
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        changed = refresh_rankings(options['size'])
+        self.stdout.write(REFRESHED.format(
+            changed=changed, elapsed=perf_counter() - start
+        ))
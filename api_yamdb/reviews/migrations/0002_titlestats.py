@@ -0,0 +1,55 @@
+# Generated by Django 3.2 on 2026-10-19 09:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_title_stats(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    TitleStats = apps.get_model('reviews', 'TitleStats')
+    stats = {
+        title_id: TitleStats(title_id=title_id)
+        for title_id in Title.objects.values_list('pk', flat=True)
+    }
+    for row in Review.objects.order_by().values('title_id', 'score').annotate(
+        score_count=models.Count('pk')
+    ):
+        title_stats = stats[row['title_id']]
+        setattr(title_stats, f'score_{row["score"]}', row['score_count'])
+        title_stats.count += row['score_count']
+        title_stats.total += row['score'] * row['score_count']
+    TitleStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TitleStats',
+            fields=[
+                ('title', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='reviews.title')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Количество оценок')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Сумма оценок')),
+                ('score_1', models.PositiveIntegerField(default=0, verbose_name='Оценок 1')),
+                ('score_2', models.PositiveIntegerField(default=0, verbose_name='Оценок 2')),
+                ('score_3', models.PositiveIntegerField(default=0, verbose_name='Оценок 3')),
+                ('score_4', models.PositiveIntegerField(default=0, verbose_name='Оценок 4')),
+                ('score_5', models.PositiveIntegerField(default=0, verbose_name='Оценок 5')),
+                ('score_6', models.PositiveIntegerField(default=0, verbose_name='Оценок 6')),
+                ('score_7', models.PositiveIntegerField(default=0, verbose_name='Оценок 7')),
+                ('score_8', models.PositiveIntegerField(default=0, verbose_name='Оценок 8')),
+                ('score_9', models.PositiveIntegerField(default=0, verbose_name='Оценок 9')),
+                ('score_10', models.PositiveIntegerField(default=0, verbose_name='Оценок 10')),
+            ],
+            options={
+                'verbose_name': 'статистика оценок',
+                'verbose_name_plural': 'Статистика оценок',
+            },
+        ),
+        migrations.RunPython(fill_title_stats, migrations.RunPython.noop),
+    ]
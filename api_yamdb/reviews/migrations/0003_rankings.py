@@ -0,0 +1,42 @@
+# Generated by Django 3.2 on 2026-10-19 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_titlestats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ranking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('rating', 'Лучшие по рейтингу'), ('reviews', 'Больше всего отзывов'), ('trending', 'Популярные за последние дни')], max_length=16, verbose_name='Рейтинг')),
+                ('scope', models.CharField(blank=True, help_text='Пусто для всех произведений, category:id или genre:id', max_length=32, verbose_name='Раздел')),
+                ('position', models.PositiveSmallIntegerField(verbose_name='Место')),
+                ('value', models.FloatField(verbose_name='Значение')),
+            ],
+            options={
+                'verbose_name': 'место в рейтинге',
+                'verbose_name_plural': 'Рейтинги',
+                'ordering': ('kind', 'scope', 'position'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['pub_date', 'title'], name='review_pub_date_title_idx'),
+        ),
+        migrations.AddField(
+            model_name='ranking',
+            name='title',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='reviews.title'),
+        ),
+        migrations.AddConstraint(
+            model_name='ranking',
+            constraint=models.UniqueConstraint(fields=('kind', 'scope', 'position'), name='unique_ranking_position'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.2 on 2026-10-19 10:04
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+def fill_title_ratings(apps, schema_editor):
+    TitleStats = apps.get_model('reviews', 'TitleStats')
+    count = Cast('count', models.FloatField())
+    total = Cast('total', models.FloatField())
+    min_votes = settings.WEIGHTED_RATING_MIN_VOTES
+    prior = min_votes * settings.WEIGHTED_RATING_PRIOR_MEAN
+    TitleStats.objects.filter(count__gt=0).update(
+        average=models.ExpressionWrapper(
+            total / count, output_field=models.FloatField()
+        ),
+        weighted_rating=models.ExpressionWrapper(
+            (total + prior) / (count + min_votes),
+            output_field=models.FloatField()
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_rankings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='titlestats',
+            name='average',
+            field=models.FloatField(blank=True, null=True, verbose_name='Средняя оценка'),
+        ),
+        migrations.AddField(
+            model_name='titlestats',
+            name='weighted_rating',
+            field=models.FloatField(blank=True, help_text='Средняя оценка, сглаженная к априорному среднему', null=True, verbose_name='Взвешенный рейтинг'),
+        ),
+        migrations.AlterField(
+            model_name='ranking',
+            name='kind',
+            field=models.CharField(choices=[('rating', 'Лучшие по рейтингу'), ('weighted_rating', 'Лучшие по взвешенному рейтингу'), ('reviews', 'Больше всего отзывов'), ('trending', 'Популярные за последние дни')], max_length=16, verbose_name='Рейтинг'),
+        ),
+        migrations.RunPython(fill_title_ratings, migrations.RunPython.noop),
+    ]
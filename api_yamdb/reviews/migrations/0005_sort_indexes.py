@@ -0,0 +1,33 @@
+# Generated by Django 3.2 on 2026-10-19 10:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_title_ratings'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['year', 'name'], name='title_year_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['name'], name='title_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titlestats',
+            index=models.Index(fields=['average', 'title'], name='stats_average_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titlestats',
+            index=models.Index(fields=['weighted_rating', 'title'], name='stats_weighted_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titlestats',
+            index=models.Index(fields=['count', 'title'], name='stats_count_idx'),
+        ),
+    ]
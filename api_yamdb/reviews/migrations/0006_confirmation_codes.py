@@ -0,0 +1,34 @@
+# Generated by Django 3.2 on 2026-10-19 10:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='yamdbuser',
+            name='confirmation_code',
+        ),
+        migrations.CreateModel(
+            name='ConfirmationCode',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='confirmation_code', serialize=False, to='reviews.yamdbuser')),
+                ('code_hash', models.CharField(max_length=64, verbose_name='Хеш кода подтверждения')),
+                ('expires_at', models.DateTimeField(verbose_name='Действует до')),
+            ],
+            options={
+                'verbose_name': 'код подтверждения',
+                'verbose_name_plural': 'Коды подтверждения',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='confirmationcode',
+            index=models.Index(fields=['expires_at'], name='confcode_expires_idx'),
+        ),
+    ]
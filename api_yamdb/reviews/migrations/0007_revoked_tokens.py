@@ -0,0 +1,34 @@
+# Generated by Django 3.2 on 2026-10-19 10:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_confirmation_codes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.CharField(max_length=64, unique=True, verbose_name='Идентификатор токена')),
+                ('expires_at', models.DateTimeField(verbose_name='Действует до')),
+            ],
+            options={
+                'verbose_name': 'отозванный токен',
+                'verbose_name_plural': 'Отозванные токены',
+            },
+        ),
+        migrations.AddField(
+            model_name='yamdbuser',
+            name='tokens_valid_after',
+            field=models.DateTimeField(blank=True, help_text='Токены, выданные раньше, отклоняются', null=True, verbose_name='Токены действуют с'),
+        ),
+        migrations.AddIndex(
+            model_name='revokedtoken',
+            index=models.Index(fields=['expires_at'], name='revoked_expires_idx'),
+        ),
+    ]
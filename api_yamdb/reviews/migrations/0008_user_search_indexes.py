@@ -0,0 +1,22 @@
+# Generated by Django 3.2 on 2026-10-19 10:44
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_revoked_tokens'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='yamdbuser',
+            index=models.Index(django.db.models.functions.text.Lower('username'), name='user_username_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='yamdbuser',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='user_email_lower_idx'),
+        ),
+    ]
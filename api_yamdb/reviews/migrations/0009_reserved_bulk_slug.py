@@ -0,0 +1,24 @@
+# Generated by Django 3.2 on 2026-10-19 11:37
+
+from django.db import migrations, models
+import reviews.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_user_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='slug',
+            field=models.SlugField(help_text='Введите уникальный слаг', unique=True, validators=[reviews.validators.slug_validator], verbose_name='Слаг'),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='slug',
+            field=models.SlugField(help_text='Введите уникальный слаг', unique=True, validators=[reviews.validators.slug_validator], verbose_name='Слаг'),
+        ),
+    ]
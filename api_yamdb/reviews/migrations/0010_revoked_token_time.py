@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-19 11:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0009_reserved_bulk_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='revokedtoken',
+            name='revoked_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Отозван'),
+        ),
+        migrations.AddIndex(
+            model_name='revokedtoken',
+            index=models.Index(fields=['revoked_at'], name='revoked_at_idx'),
+        ),
+    ]
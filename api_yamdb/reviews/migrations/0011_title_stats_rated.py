@@ -0,0 +1,40 @@
+# Generated by Django 3.2 on 2026-10-19 11:42
+
+from django.db import migrations, models
+
+
+def fill_rated(apps, schema_editor):
+    TitleStats = apps.get_model('reviews', 'TitleStats')
+    TitleStats.objects.filter(count__gt=0).update(rated=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_revoked_token_time'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='titlestats',
+            name='stats_average_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='titlestats',
+            name='stats_weighted_rating_idx',
+        ),
+        migrations.AddField(
+            model_name='titlestats',
+            name='rated',
+            field=models.BooleanField(default=False, help_text='Ключ сортировки, отделяющий произведения без оценок', verbose_name='Есть оценки'),
+        ),
+        migrations.AddIndex(
+            model_name='titlestats',
+            index=models.Index(fields=['rated', 'average', 'title'], name='stats_rated_average_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='titlestats',
+            index=models.Index(fields=['rated', 'weighted_rating', 'title'], name='stats_rated_weighted_idx'),
+        ),
+        migrations.RunPython(fill_rated, migrations.RunPython.noop),
+    ]
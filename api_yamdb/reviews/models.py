@@ -1,8 +1,10 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db.models.functions import Lower
+from django.utils import timezone
 
-from .validators import validate_username, year_validator
+from .validators import slug_validator, validate_username, year_validator
 
 
 USER_ROLE = 'user'
@@ -15,21 +17,40 @@ ROLES = (
 )
 MAX_USERNAME_LENGTH = 150
 MAX_CONFCODE_LENGTH = 16
+MAX_CONFCODE_HASH_LENGTH = 64
+MAX_JTI_LENGTH = 64
 MAX_EMAILFIELD_LENGTH = 254
+MAX_NAME_LENGTH = 256
+MAX_SLUG_LENGTH = 50
 MIN_SCORE = 1
 MAX_SCORE = 10
+SCORES = range(MIN_SCORE, MAX_SCORE + 1)
+SCORE_FIELDS = tuple(f'score_{score}' for score in SCORES)
+RANKING_RATING = 'rating'
+RANKING_REVIEWS = 'reviews'
+RANKING_TRENDING = 'trending'
+RANKING_WEIGHTED = 'weighted_rating'
+RANKING_KINDS = (
+    (RANKING_RATING, 'Лучшие по рейтингу'),
+    (RANKING_WEIGHTED, 'Лучшие по взвешенному рейтингу'),
+    (RANKING_REVIEWS, 'Больше всего отзывов'),
+    (RANKING_TRENDING, 'Популярные за последние дни'),
+)
+MAX_RANKING_KIND_LENGTH = 16
+MAX_RANKING_SCOPE_LENGTH = 32
 
 
 class SlugNameFieldsBaseModel(models.Model):
     name = models.CharField(
         'Название',
-        max_length=256,
+        max_length=MAX_NAME_LENGTH,
         help_text='Введите название'
     )
     slug = models.SlugField(
         'Слаг',
-        max_length=50,
+        max_length=MAX_SLUG_LENGTH,
         unique=True,
+        validators=(slug_validator,),
         help_text='Введите уникальный слаг'
     )
 
@@ -79,19 +100,18 @@ class YaMDBUser(AbstractUser):
         null=True,
         help_text='Введите фамилию'
     )
-    confirmation_code = models.CharField(
-        verbose_name='Код поддтверждения',
-        max_length=MAX_CONFCODE_LENGTH,
-        blank=True,
-        null=True,
-        help_text='Введите код подтверждения',
-    )
     bio = models.TextField(
         verbose_name='Биография',
         blank=True,
         null=True,
         help_text='Введите краткую биографию или описание'
     )
+    tokens_valid_after = models.DateTimeField(
+        verbose_name='Токены действуют с',
+        blank=True,
+        null=True,
+        help_text='Токены, выданные раньше, отклоняются'
+    )
 
     USERNAME_FIELD = "username"
     EMAIL_FIELD = "email"
@@ -108,10 +128,72 @@ class YaMDBUser(AbstractUser):
     def __str__(self):
         return self.username
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_access()
+        return instance
+
+    def remember_access(self):
+        self._loaded_access = (
+            self.__dict__.get('role'), self.__dict__.get('is_active')
+        )
+
+    def access_changed(self):
+        loaded = getattr(self, '_loaded_access', None)
+        return loaded is not None and loaded != (self.role, self.is_active)
+
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
         ordering = ('username',)
+        indexes = [
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
+
+class ConfirmationCode(models.Model):
+    user = models.OneToOneField(
+        YaMDBUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='confirmation_code'
+    )
+    code_hash = models.CharField(
+        'Хеш кода подтверждения',
+        max_length=MAX_CONFCODE_HASH_LENGTH
+    )
+    expires_at = models.DateTimeField('Действует до')
+
+    class Meta:
+        verbose_name = 'код подтверждения'
+        verbose_name_plural = 'Коды подтверждения'
+        indexes = [
+            models.Index(fields=('expires_at',), name='confcode_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id}: {self.expires_at}'
+
+
+class RevokedToken(models.Model):
+    jti = models.CharField(
+        'Идентификатор токена', max_length=MAX_JTI_LENGTH, unique=True
+    )
+    expires_at = models.DateTimeField('Действует до')
+    revoked_at = models.DateTimeField('Отозван', default=timezone.now)
+
+    class Meta:
+        verbose_name = 'отозванный токен'
+        verbose_name_plural = 'Отозванные токены'
+        indexes = [
+            models.Index(fields=('expires_at',), name='revoked_expires_idx'),
+            models.Index(fields=('revoked_at',), name='revoked_at_idx'),
+        ]
+
+    def __str__(self):
+        return self.jti
 
 
 class Category(SlugNameFieldsBaseModel):
@@ -123,7 +205,7 @@ class Category(SlugNameFieldsBaseModel):
 class Title(models.Model):
     name = models.CharField(
         'Название произведения',
-        max_length=256,
+        max_length=MAX_NAME_LENGTH,
         help_text='Введите название произведения'
     )
     year = models.IntegerField(
@@ -149,11 +231,118 @@ class Title(models.Model):
         verbose_name_plural = 'Произведения'
         ordering = ('year', 'name')
         default_related_name = 'titles'
+        indexes = [
+            models.Index(fields=('year', 'name'), name='title_year_name_idx'),
+            models.Index(fields=('name',), name='title_name_idx'),
+        ]
 
     def __str__(self):
         return self.name[:30]
 
 
+class TitleStats(models.Model):
+    title = models.OneToOneField(
+        Title,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    count = models.PositiveIntegerField('Количество оценок', default=0)
+    total = models.PositiveIntegerField('Сумма оценок', default=0)
+    average = models.FloatField('Средняя оценка', null=True, blank=True)
+    weighted_rating = models.FloatField(
+        'Взвешенный рейтинг',
+        null=True,
+        blank=True,
+        help_text='Средняя оценка, сглаженная к априорному среднему'
+    )
+    rated = models.BooleanField(
+        'Есть оценки',
+        default=False,
+        help_text='Ключ сортировки, отделяющий произведения без оценок'
+    )
+    score_1 = models.PositiveIntegerField('Оценок 1', default=0)
+    score_2 = models.PositiveIntegerField('Оценок 2', default=0)
+    score_3 = models.PositiveIntegerField('Оценок 3', default=0)
+    score_4 = models.PositiveIntegerField('Оценок 4', default=0)
+    score_5 = models.PositiveIntegerField('Оценок 5', default=0)
+    score_6 = models.PositiveIntegerField('Оценок 6', default=0)
+    score_7 = models.PositiveIntegerField('Оценок 7', default=0)
+    score_8 = models.PositiveIntegerField('Оценок 8', default=0)
+    score_9 = models.PositiveIntegerField('Оценок 9', default=0)
+    score_10 = models.PositiveIntegerField('Оценок 10', default=0)
+
+    class Meta:
+        verbose_name = 'статистика оценок'
+        verbose_name_plural = 'Статистика оценок'
+        indexes = [
+            models.Index(
+                fields=('rated', 'average', 'title'),
+                name='stats_rated_average_idx'
+            ),
+            models.Index(
+                fields=('rated', 'weighted_rating', 'title'),
+                name='stats_rated_weighted_idx'
+            ),
+            models.Index(fields=('count', 'title'), name='stats_count_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.title_id}: {self.count}'
+
+    @property
+    def histogram(self):
+        return [getattr(self, field) for field in SCORE_FIELDS]
+
+    @property
+    def median(self):
+        if not self.count:
+            return None
+        middle = ((self.count + 1) // 2, self.count // 2 + 1)
+        values = []
+        seen = 0
+        for score, score_count in zip(SCORES, self.histogram):
+            seen += score_count
+            while len(values) < 2 and seen >= middle[len(values)]:
+                values.append(score)
+        return sum(values) / 2
+
+
+class Ranking(models.Model):
+    kind = models.CharField(
+        'Рейтинг',
+        max_length=MAX_RANKING_KIND_LENGTH,
+        choices=RANKING_KINDS
+    )
+    scope = models.CharField(
+        'Раздел',
+        max_length=MAX_RANKING_SCOPE_LENGTH,
+        blank=True,
+        help_text='Пусто для всех произведений, category:id или genre:id'
+    )
+    position = models.PositiveSmallIntegerField('Место')
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='rankings'
+    )
+    value = models.FloatField('Значение')
+
+    class Meta:
+        verbose_name = 'место в рейтинге'
+        verbose_name_plural = 'Рейтинги'
+        ordering = ('kind', 'scope', 'position')
+        constraints = [
+            models.UniqueConstraint(
+                fields=('kind', 'scope', 'position'),
+                name='unique_ranking_position'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.kind} {self.scope} {self.position}: {self.title_id}'
+
+
 class TextAuthorFieldsBaseModel(models.Model):
     text = models.TextField()
     author = models.ForeignKey(
@@ -200,6 +389,16 @@ class Review(TextAuthorFieldsBaseModel):
                 name='unique_author_title'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('pub_date', 'title'),
+                name='review_pub_date_title_idx'
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
 
 class Comment(TextAuthorFieldsBaseModel):
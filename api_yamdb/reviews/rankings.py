@@ -0,0 +1,123 @@
+import heapq
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from api_yamdb.settings import RANKING_SIZE, TRENDING_DAYS
+
+from .models import (
+    RANKING_RATING, RANKING_REVIEWS, RANKING_TRENDING, RANKING_WEIGHTED,
+    Ranking, Review, Title, TitleStats
+)
+
+
+OVERALL_SCOPE = ''
+CATEGORY_SCOPE = 'category:{id}'
+GENRE_SCOPE = 'genre:{id}'
+
+
+def get_title_scopes():
+    scopes = defaultdict(lambda: [OVERALL_SCOPE])
+    for title_id, category_id in Title.objects.order_by().values_list(
+        'pk', 'category_id'
+    ):
+        if category_id is not None:
+            scopes[title_id].append(CATEGORY_SCOPE.format(id=category_id))
+    for title_id, genre_id in Title.genre.through.objects.values_list(
+        'title_id', 'genre_id'
+    ):
+        scopes[title_id].append(GENRE_SCOPE.format(id=genre_id))
+    return scopes
+
+
+def rank(items, scopes, size):
+    heaps = defaultdict(list)
+    for title_id, value, tiebreak in items:
+        item = (value, tiebreak, -title_id)
+        for scope in scopes[title_id]:
+            heap = heaps[scope]
+            if len(heap) < size:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+    return {
+        scope: [
+            (-title_id, value)
+            for value, _, title_id in sorted(heap, reverse=True)
+        ]
+        for scope, heap in heaps.items()
+    }
+
+
+def stats_items(value_field, tiebreak_field):
+    def items():
+        return TitleStats.objects.filter(count__gt=0).values_list(
+            'title_id', value_field, tiebreak_field
+        )
+    return items
+
+
+def trending_items():
+    since = timezone.now() - timedelta(days=TRENDING_DAYS)
+    for row in Review.objects.filter(pub_date__gte=since).order_by().values(
+        'title_id'
+    ).annotate(recent=Count('pk')):
+        yield row['title_id'], row['recent'], 0
+
+
+RANKING_ITEMS = {
+    RANKING_RATING: stats_items('average', 'count'),
+    RANKING_WEIGHTED: stats_items('weighted_rating', 'count'),
+    RANKING_REVIEWS: stats_items('count', 'average'),
+    RANKING_TRENDING: trending_items,
+}
+
+
+def compute_rankings(size=RANKING_SIZE):
+    scopes = get_title_scopes()
+    return {
+        (kind, scope): ranked
+        for kind, items in RANKING_ITEMS.items()
+        for scope, ranked in rank(items(), scopes, size).items()
+    }
+
+
+def get_stored_rankings():
+    stored = defaultdict(list)
+    for kind, scope, title_id, value in Ranking.objects.values_list(
+        'kind', 'scope', 'title_id', 'value'
+    ):
+        stored[kind, scope].append((title_id, value))
+    return stored
+
+
+def refresh_rankings(size=RANKING_SIZE):
+    rankings = compute_rankings(size)
+    with transaction.atomic():
+        stored = get_stored_rankings()
+        changed = {
+            key for key in rankings.keys() | stored.keys()
+            if rankings.get(key) != stored.get(key)
+        }
+        scopes_by_kind = defaultdict(list)
+        for kind, scope in changed:
+            scopes_by_kind[kind].append(scope)
+        for kind, scopes in scopes_by_kind.items():
+            Ranking.objects.filter(kind=kind, scope__in=scopes).delete()
+        Ranking.objects.bulk_create(
+            Ranking(
+                kind=kind,
+                scope=scope,
+                position=position,
+                title_id=title_id,
+                value=value
+            )
+            for kind, scope in changed
+            for position, (title_id, value) in enumerate(
+                rankings.get((kind, scope), ()), 1
+            )
+        )
+    return len(changed)
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone as dt_timezone
+from threading import Lock
+from time import monotonic
+
+from django.utils import timezone
+
+from api_yamdb.settings import (
+    REVOKED_TOKENS_SYNC_OVERLAP, REVOKED_TOKENS_SYNC_SECONDS
+)
+
+from .models import RevokedToken
+
+
+class RevokedTokenSet:
+    def __init__(self):
+        self.jtis = {}
+        self.synced_since = None
+        self.synced_at = None
+        self.lock = Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def is_stale(self):
+        return (
+            self.synced_at is None
+            or monotonic() - self.synced_at >= REVOKED_TOKENS_SYNC_SECONDS
+        )
+
+    def sync(self):
+        with self.lock:
+            if not self.is_stale():
+                return
+            now = timezone.now()
+            self.jtis = {
+                jti: expires_at for jti, expires_at in self.jtis.items()
+                if expires_at > now
+            }
+            revoked = RevokedToken.objects.filter(expires_at__gt=now)
+            if self.synced_since is not None:
+                revoked = revoked.filter(revoked_at__gte=self.synced_since)
+            self.jtis.update(revoked.values_list('jti', 'expires_at'))
+            self.synced_since = now - REVOKED_TOKENS_SYNC_OVERLAP
+            self.synced_at = monotonic()
+
+    def is_revoked(self, jti):
+        if self.is_stale():
+            self.sync()
+        return jti in self.jtis
+
+    def revoke(self, token):
+        expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+        _, created = RevokedToken.objects.get_or_create(
+            jti=token['jti'], defaults={'expires_at': expires_at}
+        )
+        with self.lock:
+            self.jtis[token['jti']] = expires_at
+        return created
+
+    def reset(self):
+        with self.lock:
+            self.jtis = {}
+            self.synced_since = None
+            self.synced_at = None
+
+
+revoked_tokens = RevokedTokenSet()
+
+
+def purge_expired_tokens(batch_size):
+    purged = 0
+    while True:
+        batch = list(RevokedToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            return purged
+        purged += RevokedToken.objects.filter(pk__in=batch).delete()[0]
@@ -0,0 +1,81 @@
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from api_yamdb.settings import WARM_SLUG_CACHES
+
+from .models import Category, Genre, Review, Title, TitleStats, YaMDBUser
+from .slug_cache import category_slugs, genre_slugs, warm_slug_caches
+from .stats import lock_stored_score, review_deleted, review_saved
+
+
+SLUG_CACHES = {
+    Category: category_slugs,
+    Genre: genre_slugs,
+}
+
+
+def invalidate_slug_cache(sender, **kwargs):
+    SLUG_CACHES[sender].invalidate()
+
+
+def warm_slug_caches_once(sender, **kwargs):
+    request_started.disconnect(dispatch_uid='slug-cache-warm')
+    warm_slug_caches()
+
+
+def create_title_stats(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and not getattr(instance, 'skip_stats', False):
+        TitleStats.objects.create(title=instance)
+
+
+def lock_review_score(sender, instance, raw=False, **kwargs):
+    if not raw:
+        lock_stored_score(instance)
+
+
+def update_title_stats(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        review_saved(instance, created)
+
+
+def remove_from_title_stats(sender, instance, **kwargs):
+    review_deleted(instance)
+
+
+def revoke_tokens_on_access_change(sender, instance, raw=False, **kwargs):
+    if not raw and instance.access_changed():
+        instance.tokens_valid_after = timezone.now()
+
+
+def connect_signals():
+    if WARM_SLUG_CACHES:
+        request_started.connect(
+            warm_slug_caches_once, dispatch_uid='slug-cache-warm'
+        )
+    for sender in SLUG_CACHES:
+        for signal in (post_save, post_delete):
+            signal.connect(
+                invalidate_slug_cache,
+                sender=sender,
+                dispatch_uid=f'slug-cache-{sender._meta.label_lower}'
+            )
+    post_save.connect(
+        create_title_stats, sender=Title, dispatch_uid='title-stats-create'
+    )
+    pre_save.connect(
+        lock_review_score, sender=Review, dispatch_uid='title-stats-lock'
+    )
+    post_save.connect(
+        update_title_stats, sender=Review, dispatch_uid='title-stats-save'
+    )
+    post_delete.connect(
+        remove_from_title_stats,
+        sender=Review,
+        dispatch_uid='title-stats-delete'
+    )
+    pre_save.connect(
+        revoke_tokens_on_access_change,
+        sender=YaMDBUser,
+        dispatch_uid='user-tokens-revoke'
+    )
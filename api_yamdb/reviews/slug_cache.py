@@ -0,0 +1,89 @@
+from threading import Lock
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, transaction
+
+from .models import Category, Genre
+
+
+VERSION_KEY = 'slug-cache-version:{label}'
+
+
+class SlugCache:
+    def __init__(self, model):
+        self.model = model
+        self.version_key = VERSION_KEY.format(label=model._meta.label_lower)
+        self.version = None
+        self.slugs = {}
+        self.lock = Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def get_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid4().hex, timeout=None)
+            version = cache.get(self.version_key)
+        return version
+
+    def load(self, version):
+        with self.lock:
+            if version == self.version:
+                return
+            self.slugs = {
+                slug: (pk, name)
+                for pk, slug, name in self.model.objects.db_manager(
+                    DEFAULT_DB_ALIAS
+                ).order_by().values_list('pk', 'slug', 'name')
+            }
+            self.version = version
+
+    def get_slugs(self):
+        version = self.get_version()
+        if version != self.version:
+            self.load(version)
+        return self.slugs
+
+    def invalidate(self):
+        transaction.on_commit(
+            lambda: cache.set(self.version_key, uuid4().hex, timeout=None)
+        )
+
+    def build(self, slug, pk, name):
+        return self.model.from_db(
+            DEFAULT_DB_ALIAS, ('id', 'name', 'slug'), (pk, name, slug)
+        )
+
+    def get(self, slug):
+        value = self.get_slugs().get(slug)
+        if value is None:
+            return None
+        return self.build(slug, *value)
+
+    def resolve(self, slugs):
+        known = self.get_slugs()
+        return {
+            slug: self.build(slug, *known[slug])
+            for slug in slugs if slug in known
+        }
+
+    def ids_containing(self, value):
+        value = value.lower()
+        return [
+            pk for slug, (pk, _) in self.get_slugs().items()
+            if value in slug.lower()
+        ]
+
+
+category_slugs = SlugCache(Category)
+genre_slugs = SlugCache(Genre)
+
+
+def warm_slug_caches():
+    try:
+        for slug_cache in (category_slugs, genre_slugs):
+            slug_cache.get_slugs()
+    except DatabaseError:
+        pass
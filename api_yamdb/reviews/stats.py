@@ -0,0 +1,182 @@
+from collections import Counter, defaultdict
+from math import isclose
+
+from django.db.models import (
+    BooleanField, Case, Count, ExpressionWrapper, F, FloatField, Value, When
+)
+from django.db.models.functions import Cast
+
+from api_yamdb.settings import (
+    WEIGHTED_RATING_MIN_VOTES, WEIGHTED_RATING_PRIOR_MEAN
+)
+
+from .models import SCORE_FIELDS, Review, TitleStats
+
+
+RATING_FIELDS = ('average', 'weighted_rating')
+STATS_FIELDS = ('count', 'total', 'rated') + RATING_FIELDS + SCORE_FIELDS
+
+
+def score_field(score):
+    return SCORE_FIELDS[score - 1]
+
+
+def get_average(count, total):
+    if not count:
+        return None
+    return total / count
+
+
+def get_weighted_rating(count, total):
+    if not count:
+        return None
+    return (
+        (total + WEIGHTED_RATING_MIN_VOTES * WEIGHTED_RATING_PRIOR_MEAN)
+        / (count + WEIGHTED_RATING_MIN_VOTES)
+    )
+
+
+def rating_expressions(count_delta, total_delta):
+    count = Cast(F('count') + count_delta, FloatField())
+    total = Cast(F('total') + total_delta, FloatField())
+    prior = WEIGHTED_RATING_MIN_VOTES * WEIGHTED_RATING_PRIOR_MEAN
+    expressions = {
+        'average': total / count,
+        'weighted_rating': (
+            (total + prior) / (count + WEIGHTED_RATING_MIN_VOTES)
+        ),
+    }
+    changes = {
+        field: Case(
+            When(count=-count_delta, then=Value(None)),
+            default=ExpressionWrapper(expression, output_field=FloatField()),
+            output_field=FloatField()
+        )
+        for field, expression in expressions.items()
+    }
+    changes['rated'] = Case(
+        When(count=-count_delta, then=Value(False)),
+        default=Value(True),
+        output_field=BooleanField()
+    )
+    return changes
+
+
+def apply_score_changes(title_id, added=None, removed=None):
+    deltas = Counter()
+    if added is not None:
+        deltas[score_field(added)] += 1
+        deltas['count'] += 1
+        deltas['total'] += added
+    if removed is not None:
+        deltas[score_field(removed)] -= 1
+        deltas['count'] -= 1
+        deltas['total'] -= removed
+    changes = {
+        field: F(field) + delta for field, delta in deltas.items() if delta
+    }
+    if not changes:
+        return
+    changes.update(rating_expressions(deltas['count'], deltas['total']))
+    updated = TitleStats.objects.filter(title_id=title_id).update(**changes)
+    if not updated and added is not None:
+        TitleStats.objects.get_or_create(title_id=title_id)
+        TitleStats.objects.filter(title_id=title_id).update(**changes)
+
+
+def lock_stored_score(review):
+    review._stored_score = None
+    if review.pk is not None:
+        review._stored_score = Review.objects.select_for_update().filter(
+            pk=review.pk
+        ).values_list('title_id', 'score').first()
+
+
+def review_saved(review, created):
+    stored = None if created else review.__dict__.pop('_stored_score', None)
+    if stored is None:
+        apply_score_changes(review.title_id, added=review.score)
+        return
+    stored_title_id, stored_score = stored
+    if stored_title_id != review.title_id:
+        apply_score_changes(stored_title_id, removed=stored_score)
+        apply_score_changes(review.title_id, added=review.score)
+    elif stored_score != review.score:
+        apply_score_changes(
+            review.title_id, added=review.score, removed=stored_score
+        )
+
+
+def review_deleted(review):
+    apply_score_changes(review.title_id, removed=review.score)
+
+
+def compute_title_stats(title_ids=None):
+    reviews = Review.objects.order_by()
+    if title_ids is not None:
+        reviews = reviews.filter(title_id__in=title_ids)
+    stats = defaultdict(dict)
+    for row in reviews.values('title_id', 'score').annotate(
+        score_count=Count('pk')
+    ):
+        stats[row['title_id']][score_field(row['score'])] = row['score_count']
+    return {
+        title_id: build_stats_values(counters)
+        for title_id, counters in stats.items()
+    }
+
+
+def build_stats_values(counters):
+    values = {field: counters.get(field, 0) for field in SCORE_FIELDS}
+    values['count'] = sum(values.values())
+    values['total'] = sum(
+        score * values[field]
+        for score, field in enumerate(SCORE_FIELDS, 1)
+    )
+    values['rated'] = values['count'] > 0
+    values['average'] = get_average(values['count'], values['total'])
+    values['weighted_rating'] = get_weighted_rating(
+        values['count'], values['total']
+    )
+    return values
+
+
+def stats_value_differs(stored, expected):
+    if stored is None or expected is None:
+        return stored != expected
+    return not isclose(stored, expected)
+
+
+def find_stats_mismatches(title_ids):
+    expected = compute_title_stats(title_ids)
+    stored = TitleStats.objects.filter(title_id__in=title_ids).in_bulk()
+    empty = build_stats_values({})
+    mismatches = {}
+    for title_id in title_ids:
+        values = expected.get(title_id, empty)
+        stats = stored.get(title_id)
+        if stats is None or any(
+            stats_value_differs(getattr(stats, field), value)
+            for field, value in values.items()
+        ):
+            mismatches[title_id] = (stats, values)
+    return mismatches
+
+
+def fix_stats_mismatches(mismatches):
+    created = []
+    updated = []
+    for title_id, (stats, values) in mismatches.items():
+        if stats is None:
+            created.append(TitleStats(title_id=title_id, **values))
+            continue
+        for field, value in values.items():
+            setattr(stats, field, value)
+        updated.append(stats)
+    TitleStats.objects.bulk_create(created)
+    if updated:
+        TitleStats.objects.bulk_update(updated, STATS_FIELDS)
+
+
+def rebuild_title_stats(title_ids):
+    fix_stats_mismatches(find_stats_mismatches(title_ids))
@@ -0,0 +1,188 @@
+from time import perf_counter
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+
+from .models import (
+    MAX_EMAILFIELD_LENGTH, MAX_USERNAME_LENGTH, ROLES, USER_ROLE, YaMDBUser
+)
+from .validators import validate_username
+
+
+REQUIRED_FIELD = 'Обязательное поле.'
+TOO_LONG = 'Значение длиннее {limit} символов.'
+WRONG_ID = 'Идентификатор должен быть положительным целым числом.'
+WRONG_ROLE = 'Недопустимая роль {role}.'
+DUPLICATED_IN_FILE = 'Значение {value} уже встречалось в строке {line}.'
+USERNAME_EXISTS = 'Пользователь с username {username} уже существует.'
+EMAIL_EXISTS = 'Пользователь с email {email} уже существует.'
+ID_EXISTS = 'Пользователь с id {id} уже существует.'
+USER_FIELDS = ('id', 'username', 'email', 'role', 'bio', 'first_name',
+               'last_name')
+UNIQUE_FIELDS = ('id', 'username', 'email')
+ROLE_NAMES = {role for role, _ in ROLES}
+LOOKUP_BATCH_SIZE = 300
+ERROR_LINE = 'Строка {line}: {field}: {message}'
+SUMMARY = (
+    'Обработано строк: {total}, добавлено пользователей: {created}, '
+    'пропущено: {skipped}, ошибок: {errors}, скорость: {rate:.0f} строк/с'
+)
+INSERT_BATCH_SIZE = 500
+
+
+def chunked(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def find_existing_users(usernames=(), emails=(), ids=()):
+    existing = {field: {} for field in UNIQUE_FIELDS}
+    batches = [
+        list(chunked(values, LOOKUP_BATCH_SIZE))
+        for values in (usernames, emails, ids)
+    ]
+    for index in range(max(len(values) for values in batches)):
+        usernames, emails, ids = (
+            values[index] if index < len(values) else ()
+            for values in batches
+        )
+        rows = YaMDBUser.objects.filter(
+            Q(username__in=usernames) | Q(email__in=emails) | Q(pk__in=ids)
+        ).values_list('pk', 'username', 'email')
+        for pk, username, email in rows:
+            existing['id'][pk] = pk
+            existing['username'][username] = pk
+            existing['email'][email] = pk
+    return existing
+
+
+def clean_user_id(fields, errors):
+    if not fields['id']:
+        del fields['id']
+    elif not fields['id'].isdigit() or not int(fields['id']):
+        errors['id'] = WRONG_ID
+    else:
+        fields['id'] = int(fields['id'])
+
+
+def clean_user_row(row):
+    fields = {
+        field: (row.get(field) or '').strip() for field in USER_FIELDS
+    }
+    errors = {}
+    for field, limit in (
+        ('username', MAX_USERNAME_LENGTH), ('email', MAX_EMAILFIELD_LENGTH)
+    ):
+        if not fields[field]:
+            errors[field] = REQUIRED_FIELD
+        elif len(fields[field]) > limit:
+            errors[field] = TOO_LONG.format(limit=limit)
+    validators = (
+        ('username', validate_username), ('email', validate_email)
+    )
+    for field, validator in validators:
+        if field in errors:
+            continue
+        try:
+            validator(fields[field])
+        except ValidationError as error:
+            errors[field] = ' '.join(error.messages)
+    clean_user_id(fields, errors)
+    fields['role'] = fields['role'] or USER_ROLE
+    if fields['role'] not in ROLE_NAMES:
+        errors['role'] = WRONG_ROLE.format(role=fields['role'])
+    return fields, errors
+
+
+def is_imported(fields, existing):
+    pk = existing['username'].get(fields['username'])
+    return (
+        pk is not None
+        and existing['email'].get(fields['email']) == pk
+        and fields.get('id', pk) == pk
+    )
+
+
+def import_users(rows, batch_size=INSERT_BATCH_SIZE):
+    started = perf_counter()
+    errors = []
+    candidates = []
+    seen = {field: {} for field in UNIQUE_FIELDS}
+    total = 0
+    for line, row in enumerate(rows, start=2):
+        total += 1
+        fields, row_errors = clean_user_row(row)
+        for field in UNIQUE_FIELDS:
+            value = fields.get(field)
+            if field in row_errors or value is None:
+                continue
+            if value in seen[field]:
+                row_errors[field] = DUPLICATED_IN_FILE.format(
+                    value=value, line=seen[field][value]
+                )
+            else:
+                seen[field][value] = line
+        if row_errors:
+            errors.extend(
+                (line, field, message)
+                for field, message in row_errors.items()
+            )
+        else:
+            candidates.append((line, fields))
+    existing = find_existing_users(
+        seen['username'], seen['email'], seen['id']
+    )
+    users = []
+    skipped = 0
+    for line, fields in candidates:
+        if is_imported(fields, existing):
+            skipped += 1
+            continue
+        row_errors = [
+            (line, field, message.format(**{field: fields[field]}))
+            for field, message in (
+                ('id', ID_EXISTS),
+                ('username', USERNAME_EXISTS),
+                ('email', EMAIL_EXISTS),
+            )
+            if fields.get(field) in existing[field]
+        ]
+        if row_errors:
+            errors.extend(row_errors)
+        else:
+            users.append(YaMDBUser(**fields))
+    with transaction.atomic():
+        YaMDBUser.objects.bulk_create(users, batch_size=batch_size)
+    return ImportReport(
+        total, len(users), skipped, errors, perf_counter() - started
+    )
+
+
+def write_import_report(stdout, report):
+    for line, field, message in report.errors:
+        stdout.write(ERROR_LINE.format(
+            line=line, field=field, message=message
+        ))
+    stdout.write(SUMMARY.format(
+        total=report.total,
+        created=report.created,
+        skipped=report.skipped,
+        errors=len(report.errors),
+        rate=report.rows_per_second
+    ))
+
+
+class ImportReport():
+    def __init__(self, total, created, skipped, errors, elapsed):
+        self.total = total
+        self.created = created
+        self.skipped = skipped
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def rows_per_second(self):
+        return self.total / self.elapsed if self.elapsed else 0
@@ -3,7 +3,7 @@ from datetime import datetime
 
 from django.core.exceptions import ValidationError
 
-from api_yamdb.settings import SELF_ENDPOINT
+from api_yamdb.settings import BULK_ENDPOINT, SELF_ENDPOINT
 
 
 MESSAGE_WRONG_SYMBOLS = (
@@ -11,26 +11,35 @@ MESSAGE_WRONG_SYMBOLS = (
     ' Обнаружено: {wrong_symbols}'
 )
 MESSAGE_RESTRICTED_USERNAME = '"Имя {username} недопустимо'
+MESSAGE_RESTRICTED_SLUG = 'Слаг {slug} недопустим'
 MESSAGE_YEAR_VALIDATION_ERROR = (
     'Убедитесь, что введённое значение года {year} не превышает '
     'текущее значение года {current_year}'
 )
 
 
+USERNAME_PATTERN = re.compile(r'[\w.@+-]*')
+WRONG_SYMBOLS_PATTERN = re.compile(r'[^\w.@+-]')
+RESTRICTED_USERNAMES = (SELF_ENDPOINT, BULK_ENDPOINT)
+
+
 def validate_username(value) -> str:
-    wrong_symbols = re.findall(r'[^\w.@+-]', value)
-    if len(wrong_symbols):
-        wrong_symbols = set(wrong_symbols)
-        symbols_for_message = ''.join(set(wrong_symbols))
+    if USERNAME_PATTERN.fullmatch(value) and value not in RESTRICTED_USERNAMES:
+        return value
+    if value in RESTRICTED_USERNAMES:
         raise ValidationError(
-            MESSAGE_WRONG_SYMBOLS.format(
-                wrong_symbols=symbols_for_message
-            )
-        )
-    if value == SELF_ENDPOINT:
-        raise ValidationError(
-            MESSAGE_RESTRICTED_USERNAME.format(username=SELF_ENDPOINT)
+            MESSAGE_RESTRICTED_USERNAME.format(username=value)
         )
+    raise ValidationError(MESSAGE_WRONG_SYMBOLS.format(
+        wrong_symbols=''.join(dict.fromkeys(
+            WRONG_SYMBOLS_PATTERN.findall(value)
+        ))
+    ))
+
+
+def slug_validator(value):
+    if value == BULK_ENDPOINT:
+        raise ValidationError(MESSAGE_RESTRICTED_SLUG.format(slug=value))
     return value
 
 
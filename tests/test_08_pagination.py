@@ -0,0 +1,132 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08PaginationAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+    CATEGORIES_URL = '/api/v1/categories/'
+
+    def test_01_page_size_param(self, admin_client, client):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, {'page_size': 1})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`page_size` возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert len(data['results']) == 1 and data['count'] == 2, (
+            f'Проверьте, что эндпоинт `{self.TITLES_URL}` учитывает '
+            'параметр `page_size` и возвращает указанное число объектов.'
+        )
+        assert data['next'] is not None, (
+            f'Проверьте, что при GET-запросе к `{self.TITLES_URL}` с '
+            '`page_size` меньше числа объектов в ответе есть ссылка `next`.'
+        )
+
+    def test_02_max_page_size(self, admin_client, client, settings):
+        create_titles(admin_client)
+        response = client.get(self.CATEGORIES_URL, {'page_size': 10 ** 6})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.CATEGORIES_URL}` со '
+            'слишком большим `page_size` возвращает ответ со статусом 200.'
+        )
+        assert len(response.json()['results']) <= settings.MAX_PAGE_SIZE, (
+            'Проверьте, что размер страницы ограничен настройкой '
+            '`MAX_PAGE_SIZE`.'
+        )
+
+    def test_03_countless_pages(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get(
+            self.TITLES_URL, {'page_size': 1, 'count': 'false'}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`count=false` возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert 'count' not in data, (
+            f'Проверьте, что при GET-запросе к `{self.TITLES_URL}` с '
+            'параметром `count=false` общее число объектов не считается.'
+        )
+        assert data['next'] is not None and data['previous'] is None, (
+            'Проверьте, что ссылки `next` и `previous` формируются и без '
+            'подсчёта общего числа объектов.'
+        )
+        response = client.get(data['next'])
+        data = response.json()
+        assert [title['id'] for title in data['results']] == [
+            titles[1]['id']
+        ], (
+            'Проверьте, что по ссылке `next` возвращается следующая страница.'
+        )
+        assert data['next'] is None and data['previous'] is not None, (
+            'Проверьте, что на последней странице без подсчёта объектов '
+            'ссылка `next` отсутствует.'
+        )
+        response = client.get(
+            self.TITLES_URL, {'page': 3, 'page_size': 1, 'count': 'false'}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что запрос несуществующей страницы без подсчёта '
+            'объектов возвращает ответ со статусом 404.'
+        )
+
+    def test_04_count_cached_and_invalidated(self, admin_client, client):
+        titles, categories, genres = create_titles(admin_client)
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == len(titles)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.TITLES_URL)
+        assert not any(
+            'COUNT(' in query['sql'] for query in context.captured_queries
+        ), (
+            f'Проверьте, что повторный GET-запрос к `{self.TITLES_URL}` '
+            'не выполняет `COUNT(*)`.'
+        )
+        assert response.json()['count'] == len(titles), (
+            f'Проверьте, что повторный GET-запрос к `{self.TITLES_URL}` '
+            'берёт количество объектов из кеша.'
+        )
+        data = {
+            'name': 'Чужой',
+            'year': 1979,
+            'genre': [genres[0]['slug']],
+            'category': categories[0]['slug'],
+        }
+        admin_client.post(self.TITLES_URL, data=data)
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == len(titles) + 1, (
+            'Проверьте, что после создания произведения закешированное '
+            f'количество объектов для `{self.TITLES_URL}` сбрасывается.'
+        )
+
+    def test_05_count_with_filters(self, admin_client, client):
+        _, categories, genres = create_titles(admin_client)
+        data = {
+            'name': 'Чужой',
+            'year': 1979,
+            'genre': [genres[0]['slug'], genres[1]['slug']],
+            'category': categories[0]['slug'],
+        }
+        admin_client.post(self.TITLES_URL, data=data)
+        response = client.get(self.TITLES_URL, {'genre': 'o'})
+        data = response.json()
+        assert data['count'] == len(data['results']), (
+            f'Проверьте, что при фильтрации `{self.TITLES_URL}` по жанру '
+            'количество объектов не учитывает одно произведение дважды.'
+        )
+        response = client.get(
+            self.TITLES_URL, {'category': categories[1]['slug']}
+        )
+        assert response.json()['count'] == 1, (
+            f'Проверьте, что количество объектов для `{self.TITLES_URL}` '
+            'кешируется отдельно для каждого набора фильтров.'
+        )
@@ -0,0 +1,195 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09FieldsAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_title_fields(self, admin_client, client):
+        create_titles(admin_client)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                self.TITLES_URL, {'fields': 'id,name,rating'}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`fields` возвращает ответ со статусом 200.'
+        )
+        for title in response.json()['results']:
+            assert set(title) == {'id', 'name', 'rating'}, (
+                f'Проверьте, что эндпоинт `{self.TITLES_URL}` возвращает '
+                'только поля, перечисленные в параметре `fields`.'
+            )
+        sql = ' '.join(query['sql'] for query in context.captured_queries)
+        assert 'reviews_genre' not in sql, (
+            'Проверьте, что жанры не запрашиваются из базы данных, если '
+            'поле `genre` не указано в параметре `fields`.'
+        )
+        assert '"description"' not in sql, (
+            'Проверьте, что из базы данных выбираются только столбцы, '
+            'нужные для полей из параметра `fields`.'
+        )
+
+    def test_02_title_without_rating(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                self.TITLE_DETAIL_URL_TEMPLATE.format(
+                    title_id=titles[0]['id']
+                ),
+                {'fields': 'name,genre'}
+            )
+        data = response.json()
+        assert set(data) == {'name', 'genre'} and len(data['genre']) == 2, (
+            f'Проверьте, что эндпоинт `{self.TITLE_DETAIL_URL_TEMPLATE}` '
+            'учитывает параметр `fields`.'
+        )
+        sql = ' '.join(query['sql'] for query in context.captured_queries)
+        assert 'AVG(' not in sql, (
+            'Проверьте, что рейтинг не вычисляется, если поле `rating` не '
+            'указано в параметре `fields`.'
+        )
+
+    def test_03_review_and_comment_fields(self, admin_client, admin, user,
+                                          user_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        response = user_client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            {'fields': 'id,score'}
+        )
+        for review in response.json()['results']:
+            assert set(review) == {'id', 'score'}, (
+                f'Проверьте, что эндпоинт `{self.REVIEWS_URL_TEMPLATE}` '
+                'учитывает параметр `fields`.'
+            )
+        response = user_client.get(
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            ),
+            {'fields': 'text,author'}
+        )
+        results = response.json()['results']
+        assert {comment['author'] for comment in results} == {
+            comment['author'] for comment in comments
+        } and all(set(comment) == {'text', 'author'} for comment in results), (
+            f'Проверьте, что эндпоинт `{self.COMMENTS_URL_TEMPLATE}` '
+            'учитывает параметр `fields`.'
+        )
+
+    def test_04_fields_ignored_on_write(self, user_client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+            + '?fields=id',
+            data={'text': 'Отзыв', 'score': 7}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что параметр `fields` не влияет на создание отзыва.'
+        )
+        assert response.json()['score'] == 7
+
+    def test_05_title_include(self, admin_client, admin, user, user_client,
+                              moderator, moderator_client, client):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client,
+        }
+        _, reviews, titles = create_comments(admin_client, author_map)
+        url = self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, {'include': 'reviews.comments'})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` с параметром `include` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert len(data['reviews']) == len(reviews), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` с '
+            '`include=reviews` содержит отзывы на произведение.'
+        )
+        review = next(
+            review for review in data['reviews']
+            if review['id'] == reviews[0]['id']
+        )
+        assert len(review['comments']) == min(
+            len(author_map), settings.INCLUDE_COMMENTS_LIMIT
+        ), (
+            'Проверьте, что в ответ включаются последние комментарии к '
+            'отзыву в пределах `INCLUDE_COMMENTS_LIMIT`.'
+        )
+        assert len(context.captured_queries) == 4, (
+            'Проверьте, что связанные отзывы и комментарии загружаются '
+            'фиксированным числом запросов.'
+        )
+        response = client.get(url, {'include': 'ratings'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что GET-запрос к `{url}` с недопустимым значением '
+            '`include` возвращает ответ со статусом 400.'
+        )
+
+    def test_06_title_include_latest_comments(self, admin_client, admin, user,
+                                              user_client, moderator,
+                                              moderator_client, client):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client,
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        url = self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with mock.patch('api.views.INCLUDE_COMMENTS_LIMIT', 2):
+            data = client.get(url, {'include': 'reviews.comments'}).json()
+        review = next(
+            review for review in data['reviews']
+            if review['id'] == reviews[0]['id']
+        )
+        assert [comment['id'] for comment in review['comments']] == [
+            comments[2]['id'], comments[1]['id']
+        ], (
+            'Проверьте, что в ответ включаются только последние '
+            '`INCLUDE_COMMENTS_LIMIT` комментариев к отзыву.'
+        )
+
+    def test_07_include_comments_without_reviews(self, admin_client,
+                                                 client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url, {'include': 'reviews.comments'})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}?include=reviews.comments` '
+            'для произведения без отзывов возвращает ответ со статусом 200.'
+        )
+        assert response.json()['reviews'] == []
+
+    def test_08_unknown_fields(self, admin_client, client):
+        create_titles(admin_client)
+        for value in ('bogus', 'name,bogus'):
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(self.TITLES_URL, {'fields': value})
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с '
+                'неизвестным полем в `fields` возвращает ответ со статусом '
+                '400.'
+            )
+            assert 'fields' in response.json()
+            assert not context.captured_queries, (
+                'Проверьте, что параметр `fields` проверяется до запросов к '
+                'базе данных.'
+            )
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10BatchAPI:
+
+    BATCH_URL = '/api/v1/titles/batch/'
+
+    def test_01_batch_keeps_order_and_reports_missing(self, admin_client,
+                                                      client):
+        titles, _, _ = create_titles(admin_client)
+        missing_id = max(title['id'] for title in titles) + 100
+        ids = [titles[1]['id'], missing_id, titles[0]['id']]
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                self.BATCH_URL, {'ids': ','.join(map(str, ids))}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.BATCH_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data['results']] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            f'Проверьте, что эндпоинт `{self.BATCH_URL}` возвращает '
+            'произведения в порядке переданных id.'
+        )
+        assert data['missing'] == [missing_id], (
+            f'Проверьте, что эндпоинт `{self.BATCH_URL}` сообщает о '
+            'несуществующих id.'
+        )
+        assert data['results'][1]['category'] == {
+            'name': 'Фильм', 'slug': 'films'
+        } and len(data['results'][1]['genre']) == 2
+        assert len(context.captured_queries) == 2, (
+            'Проверьте, что произведения, категории, жанры и рейтинги '
+            'загружаются пакетно.'
+        )
+
+    @pytest.mark.parametrize('ids', (
+        '', 'one,two', ','.join(str(number) for number in range(1, 200))
+    ), ids=('empty', 'not-integers', 'too-many'))
+    def test_02_batch_invalid_ids(self, client, ids):
+        response = client.get(self.BATCH_URL, {'ids': ids})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что GET-запрос к `{self.BATCH_URL}` с пустым, '
+            'некорректным или слишком длинным списком id возвращает ответ '
+            'со статусом 400.'
+        )
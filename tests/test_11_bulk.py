@@ -0,0 +1,269 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from django.db.models.signals import post_save
+
+from reviews.models import Title, TitleStats
+from tests.utils import create_categories, create_genre, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11BulkAPI:
+
+    TITLES_BULK_URL = '/api/v1/titles/bulk/'
+    GENRES_BULK_URL = '/api/v1/genres/bulk/'
+    CATEGORIES_BULK_URL = '/api/v1/categories/bulk/'
+
+    def test_01_bulk_permissions(self, client, user_client):
+        data = [{'name': 'Рок', 'slug': 'rock'}]
+        for url in (self.GENRES_BULK_URL, self.CATEGORIES_BULK_URL):
+            response = client.post(
+                url, data=json.dumps(data), content_type='application/json'
+            )
+            assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+                f'Проверьте, что POST-запрос неавторизованного пользователя '
+                f'к `{url}` возвращает ответ со статусом 401.'
+            )
+            response = user_client.post(url, data=data, format='json')
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                f'Проверьте, что POST-запрос пользователя с ролью `user` к '
+                f'`{url}` возвращает ответ со статусом 403.'
+            )
+
+    def test_02_genres_bulk_create_and_update(self, admin_client, client):
+        create_genre(admin_client)
+        data = [
+            {'name': 'Рок', 'slug': 'rock'},
+            {'name': 'Джаз', 'slug': 'jazz'},
+        ]
+        response = admin_client.post(
+            self.GENRES_BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.GENRES_BULK_URL}` с корректными данными возвращает '
+            'ответ со статусом 201.'
+        )
+        assert response.json() == data
+        assert client.get('/api/v1/genres/').json()['count'] == 5
+
+        invalid_data = [
+            {'name': 'Поп', 'slug': 'pop'},
+            {'name': 'Хоррор', 'slug': 'horror'},
+            {'name': 'Поп', 'slug': 'pop'},
+            {'name': 'Без слага', 'slug': ':-)'},
+        ]
+        response = admin_client.post(
+            self.GENRES_BULK_URL, data=invalid_data, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что POST-запрос к `{self.GENRES_BULK_URL}` с '
+            'некорректными объектами возвращает ответ со статусом 400.'
+        )
+        errors = response.json()
+        assert len(errors) == len(invalid_data) and errors[0] == {} and all(
+            'slug' in error for error in errors[1:]
+        ), (
+            f'Проверьте, что эндпоинт `{self.GENRES_BULK_URL}` возвращает '
+            'ошибки для каждого объекта запроса.'
+        )
+        assert client.get('/api/v1/genres/').json()['count'] == 5, (
+            'Проверьте, что при ошибке хотя бы в одном объекте ни один '
+            'объект не создаётся.'
+        )
+
+        response = admin_client.patch(
+            self.GENRES_BULK_URL,
+            data=[{'slug': 'rock', 'name': 'Рок-н-ролл'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == [{'slug': 'rock', 'name': 'Рок-н-ролл'}]
+        response = admin_client.patch(
+            self.GENRES_BULK_URL,
+            data=[{'slug': 'unknown', 'name': 'Неизвестный'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_categories_bulk_create(self, admin_client):
+        create_categories(admin_client)
+        response = admin_client.post(
+            self.CATEGORIES_BULK_URL,
+            data=[{'name': 'Музыка', 'slug': 'music'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(
+            self.CATEGORIES_BULK_URL, data={'name': 'Музыка'}, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что POST-запрос к `{self.CATEGORIES_BULK_URL}` не со '
+            'списком объектов возвращает ответ со статусом 400.'
+        )
+
+    def test_04_titles_bulk_create(self, admin_client, client,
+                                   django_assert_max_num_queries):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        data = [
+            {
+                'name': f'Произведение {number}',
+                'year': 2000 + number,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[number % 2]['slug'],
+            }
+            for number in range(10)
+        ]
+        with django_assert_max_num_queries(len(data) + 8):
+            response = admin_client.post(
+                self.TITLES_BULK_URL, data=data, format='json'
+            )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.TITLES_BULK_URL}` с корректными данными возвращает '
+            'ответ со статусом 201.'
+        )
+        results = response.json()
+        assert [title['name'] for title in results] == [
+            title['name'] for title in data
+        ] and all(len(title['genre']) == 3 for title in results), (
+            f'Проверьте, что эндпоинт `{self.TITLES_BULK_URL}` возвращает '
+            'созданные произведения в порядке запроса.'
+        )
+        assert client.get('/api/v1/titles/').json()['count'] == len(data)
+
+        invalid_data = [
+            dict(data[0], name='Новое произведение'),
+            dict(data[0], genre=['unknown'], category='unknown'),
+            dict(data[0], year=3000),
+        ]
+        response = admin_client.post(
+            self.TITLES_BULK_URL, data=invalid_data, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {} and set(errors[1]) == {
+            'genre', 'category'
+        } and set(errors[2]) == {'year'}, (
+            f'Проверьте, что эндпоинт `{self.TITLES_BULK_URL}` возвращает '
+            'ошибки для каждого произведения.'
+        )
+
+    def test_05_titles_bulk_update(self, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        data = [
+            {'id': titles[0]['id'], 'genre': [genres[2]['slug']]},
+            {'id': titles[1]['id'], 'name': 'Крепкий орешек 2', 'year': 1990},
+        ]
+        response = admin_client.patch(
+            self.TITLES_BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что PATCH-запрос администратора к '
+            f'`{self.TITLES_BULK_URL}` с корректными данными возвращает '
+            'ответ со статусом 200.'
+        )
+        results = response.json()
+        assert results[0]['genre'] == [genres[2]] and (
+            results[0]['name'] == titles[0]['name']
+        )
+        assert results[1]['name'] == 'Крепкий орешек 2' and (
+            results[1]['year'] == 1990
+        )
+        response = admin_client.patch(
+            self.TITLES_BULK_URL,
+            data=[{'name': 'Без id'}, {'id': 10 ** 6, 'name': 'Нет такого'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert all('id' in error for error in response.json())
+
+    def test_06_title_record_queries(self, admin_client,
+                                     django_assert_max_num_queries):
+        genre_slugs = [f'genre-{number}' for number in range(10)]
+        admin_client.post(self.GENRES_BULK_URL, data=[
+            {'name': slug, 'slug': slug} for slug in genre_slugs
+        ], format='json')
+        categories = create_categories(admin_client)
+        data = {
+            'name': 'Десять жанров',
+            'year': 2000,
+            'genre': genre_slugs,
+            'category': categories[0]['slug'],
+        }
+        with django_assert_max_num_queries(7):
+            response = admin_client.post('/api/v1/titles/', data=data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что POST-запрос администратора к `/api/v1/titles/` '
+            'с корректными данными возвращает ответ со статусом 201.'
+        )
+        title = response.json()
+        assert len(title['genre']) == 10 and title['rating'] is None, (
+            'Проверьте, что ответ на создание произведения содержит все '
+            'его жанры.'
+        )
+        url = f'/api/v1/titles/{title["id"]}/'
+        with django_assert_max_num_queries(10):
+            response = admin_client.patch(
+                url, data={'genre': genre_slugs[5:] + ['horror']}
+            )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что PATCH-запрос с несуществующим жанром '
+            f'к `{url}` возвращает ответ со статусом 400.'
+        )
+        response = admin_client.patch(url, data={'genre': genre_slugs[5:]})
+        assert response.status_code == HTTPStatus.OK
+        assert [genre['slug'] for genre in response.json()['genre']] == (
+            genre_slugs[5:]
+        )
+        assert [
+            genre['slug']
+            for genre in admin_client.get(url).json()['genre']
+        ] == genre_slugs[5:], (
+            'Проверьте, что при изменении жанров произведения лишние связи '
+            'удаляются.'
+        )
+
+    def test_07_bulk_slug_reserved(self, admin_client):
+        for url in ('/api/v1/genres/', '/api/v1/categories/'):
+            response = admin_client.post(
+                url, data={'name': 'Пакет', 'slug': 'bulk'}
+            )
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что POST-запрос к `{url}` со слагом `bulk` '
+                'возвращает ответ со статусом 400: слаг совпадает с '
+                'адресом пакетной записи.'
+            )
+        response = admin_client.post(
+            self.GENRES_BULK_URL,
+            data=[{'name': 'Пакет', 'slug': 'bulk'}], format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_08_titles_bulk_create_is_not_raw(self, admin_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        saves = []
+
+        def receiver(sender, raw=False, **kwargs):
+            saves.append(raw)
+
+        post_save.connect(receiver, sender=Title)
+        try:
+            response = admin_client.post(self.TITLES_BULK_URL, data=[
+                {'name': 'Произведение', 'year': 2000,
+                 'genre': [genres[0]['slug']],
+                 'category': categories[0]['slug']}
+            ], format='json')
+        finally:
+            post_save.disconnect(receiver, sender=Title)
+        assert response.status_code == HTTPStatus.CREATED
+        assert not any(saves), (
+            'Проверьте, что пакетное создание произведений не помечает '
+            'сохранение как загрузку фикстур (`raw=True`).'
+        )
+        assert TitleStats.objects.filter(
+            title_id=response.json()[0]['id']
+        ).count() == 1
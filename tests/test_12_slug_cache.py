@@ -0,0 +1,87 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.core.signals import request_started
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.signals import warm_slug_caches_once
+from reviews.slug_cache import category_slugs, genre_slugs
+from tests.utils import create_categories, create_genre, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12SlugCache:
+
+    TITLES_URL = '/api/v1/titles/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def test_01_resolve_without_queries(self, admin_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        genre_slugs.get_slugs()
+        category_slugs.get_slugs()
+        with CaptureQueriesContext(connection) as context:
+            resolved = genre_slugs.resolve(
+                [genre['slug'] for genre in genres] + ['unknown']
+            )
+            category = category_slugs.get(categories[0]['slug'])
+        assert not context.captured_queries, (
+            'Проверьте, что слаги категорий и жанров разрешаются без '
+            'запросов к базе данных.'
+        )
+        assert sorted(resolved) == sorted(genre['slug'] for genre in genres)
+        assert category.name == categories[0]['name'] and category.pk
+
+    def test_02_invalidated_on_write(self, admin_client):
+        create_genre(admin_client)
+        genre_slugs.get_slugs()
+        admin_client.post(
+            self.GENRES_URL, data={'name': 'Рок', 'slug': 'rock'}
+        )
+        assert genre_slugs.get('rock') is not None, (
+            'Проверьте, что кеш слагов сбрасывается при создании жанра.'
+        )
+        response = admin_client.delete(f'{self.GENRES_URL}rock/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert genre_slugs.get('rock') is None, (
+            'Проверьте, что кеш слагов сбрасывается при удалении жанра.'
+        )
+        response = admin_client.delete(f'{self.GENRES_URL}rock/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_filter_by_cached_slugs(self, admin_client, client):
+        titles, categories, genres = create_titles(admin_client)
+        response = client.get(self.TITLES_URL, {'genre': 'com'})
+        assert [title['id'] for title in response.json()['results']] == [
+            titles[0]['id']
+        ], (
+            f'Проверьте, что фильтр `genre` эндпоинта `{self.TITLES_URL}` '
+            'ищет жанры по части слага.'
+        )
+        response = client.get(
+            self.TITLES_URL, {'genre': 'o', 'fields': 'id'}
+        )
+        assert len(response.json()['results']) == 1, (
+            f'Проверьте, что фильтр `genre` эндпоинта `{self.TITLES_URL}` '
+            'не дублирует произведения с несколькими подходящими жанрами.'
+        )
+        response = client.get(
+            self.TITLES_URL, {'category': categories[1]['slug'][:3]}
+        )
+        assert [title['id'] for title in response.json()['results']] == [
+            titles[1]['id']
+        ]
+
+    def test_04_warm_on_first_request(self, client):
+        request_started.connect(
+            warm_slug_caches_once, dispatch_uid='slug-cache-warm'
+        )
+        with mock.patch('reviews.signals.warm_slug_caches') as warm:
+            client.get(self.GENRES_URL)
+            client.get(self.GENRES_URL)
+        assert warm.call_count == 1, (
+            'Проверьте, что кеши слагов загружаются один раз, при первом '
+            'запросе, а не при импорте wsgi/asgi.'
+        )
@@ -0,0 +1,157 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Review, TitleStats
+from reviews.stats import find_stats_mismatches
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13StatsAPI:
+
+    STATS_URL_TEMPLATE = '/api/v1/titles/{title_id}/stats/'
+    REVIEW_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/{id}/'
+
+    def test_01_empty_stats(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.STATS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        assert data['count'] == 0 and data['mean'] is None, (
+            f'Проверьте, что для произведения без отзывов `{url}` '
+            'возвращает нулевую статистику.'
+        )
+        assert data['histogram'] == {str(score): 0 for score in range(1, 11)}
+        for title_id in (0, 'abc'):
+            response = client.get(
+                self.STATS_URL_TEMPLATE.format(title_id=title_id)
+            )
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                'Проверьте, что запрос статистики несуществующего '
+                'произведения возвращает ответ со статусом 404.'
+            )
+
+    def test_02_stats_follow_reviews(self, admin_client, user_client,
+                                     moderator_client, client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        url = self.STATS_URL_TEMPLATE.format(title_id=title_id)
+        create_single_review(admin_client, title_id, 'Отзыв', 2)
+        create_single_review(user_client, title_id, 'Отзыв', 6)
+        review = create_single_review(
+            moderator_client, title_id, 'Отзыв', 9
+        ).json()
+        data = client.get(url).json()
+        assert data['count'] == 3 and data['median'] == 6, (
+            f'Проверьте, что `{url}` учитывает созданные отзывы.'
+        )
+        assert data['mean'] == pytest.approx(17 / 3)
+        review_url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title_id, id=review['id']
+        )
+        moderator_client.patch(review_url, data={'score': 10})
+        data = client.get(url).json()
+        assert data['histogram']['9'] == 0 and data['histogram']['10'] == 1, (
+            f'Проверьте, что `{url}` учитывает изменение оценки отзыва.'
+        )
+        moderator_client.delete(review_url)
+        data = client.get(url).json()
+        assert data['count'] == 2 and data['median'] == 4, (
+            f'Проверьте, что `{url}` учитывает удаление отзыва.'
+        )
+        assert not find_stats_mismatches([title_id]), (
+            'Проверьте, что статистика, обновлённая по шагам, совпадает с '
+            'пересчитанной по отзывам.'
+        )
+
+    def test_03_check_title_stats(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Отзыв', 7)
+        TitleStats.objects.filter(title_id=title_id).update(
+            count=5, score_7=0
+        )
+        call_command('check_title_stats', '--fix')
+        data = client.get(
+            self.STATS_URL_TEMPLATE.format(title_id=title_id)
+        ).json()
+        assert data['count'] == 1 and data['histogram']['7'] == 1, (
+            'Проверьте, что команда `check_title_stats --fix` исправляет '
+            'расхождения статистики с отзывами.'
+        )
+
+    def test_04_weighted_rating(self, admin_client, user_client,
+                                moderator_client, client, settings):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'Отзыв', 10)
+        for author_client in (admin_client, user_client, moderator_client):
+            create_single_review(author_client, titles[1]['id'], 'Отзыв', 9)
+        prior = (
+            settings.WEIGHTED_RATING_MIN_VOTES
+            * settings.WEIGHTED_RATING_PRIOR_MEAN
+        )
+        expected = {
+            titles[0]['id']: (10 + prior) / (
+                1 + settings.WEIGHTED_RATING_MIN_VOTES
+            ),
+            titles[1]['id']: (27 + prior) / (
+                3 + settings.WEIGHTED_RATING_MIN_VOTES
+            ),
+        }
+        response = client.get(
+            '/api/v1/titles/', {'fields': 'id,weighted_rating'}
+        )
+        results = response.json()['results']
+        assert {
+            title['id']: title['weighted_rating'] for title in results
+        } == pytest.approx(expected), (
+            'Проверьте, что `/api/v1/titles/` возвращает взвешенный рейтинг '
+            'произведений.'
+        )
+        data = client.get(
+            self.STATS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        ).json()
+        assert data['weighted_rating'] == pytest.approx(
+            expected[titles[0]['id']]
+        )
+        call_command('refresh_rankings')
+        data = client.get(
+            '/api/v1/titles/top/', {'by': 'weighted_rating'}
+        ).json()
+        assert [title['id'] for title in data['results']] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            'Проверьте, что по взвешенному рейтингу произведение с одной '
+            'оценкой 10 не опережает произведение с несколькими оценками 9.'
+        )
+        call_command('check_title_stats')
+        assert not TitleStats.objects.filter(weighted_rating=None).exclude(
+            count=0
+        ).exists()
+
+    def test_05_stale_review_edits(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review_id = create_single_review(
+            admin_client, title_id, 'Отзыв', 5
+        ).json()['id']
+        first = Review.objects.get(pk=review_id)
+        second = Review.objects.get(pk=review_id)
+        first.score = 7
+        first.save()
+        second.score = 9
+        second.save()
+        data = client.get(
+            self.STATS_URL_TEMPLATE.format(title_id=title_id)
+        ).json()
+        assert data['count'] == 1 and data['mean'] == 9, (
+            'Проверьте, что изменение оценки учитывает сохранённое в базе '
+            'значение, а не загруженное ранее.'
+        )
+        assert not find_stats_mismatches([title_id])
@@ -0,0 +1,99 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Ranking
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14RankingsAPI:
+
+    TOP_URL = '/api/v1/titles/top/'
+
+    def create_rankings(self, admin_client, user_client, moderator_client):
+        titles, categories, genres = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'Отзыв', 4)
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 6)
+        create_single_review(moderator_client, titles[1]['id'], 'Отзыв', 9)
+        call_command('refresh_rankings')
+        return titles, categories, genres
+
+    def test_01_top_rated(self, admin_client, user_client, moderator_client,
+                          client):
+        titles, _, _ = self.create_rankings(
+            admin_client, user_client, moderator_client
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.TOP_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TOP_URL}` возвращает ответ '
+            'со статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data['results']] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            f'Проверьте, что `{self.TOP_URL}` по умолчанию возвращает '
+            'произведения по убыванию рейтинга.'
+        )
+        assert data['results'][0]['position'] == 1
+        assert data['results'][0]['value'] == 9
+        assert len(context.captured_queries) <= 3, (
+            f'Проверьте, что `{self.TOP_URL}` читает готовый список, а не '
+            'сортирует все произведения при каждом запросе.'
+        )
+
+    def test_02_most_reviewed_and_trending(self, admin_client, user_client,
+                                           moderator_client, client):
+        titles, _, _ = self.create_rankings(
+            admin_client, user_client, moderator_client
+        )
+        for kind in ('reviews', 'trending'):
+            data = client.get(self.TOP_URL, {'by': kind}).json()
+            assert [
+                (title['id'], title['value']) for title in data['results']
+            ] == [(titles[0]['id'], 2), (titles[1]['id'], 1)], (
+                f'Проверьте, что `{self.TOP_URL}?by={kind}` упорядочивает '
+                'произведения по числу отзывов.'
+            )
+        response = client.get(self.TOP_URL, {'by': 'year'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что `{self.TOP_URL}` с недопустимым значением `by` '
+            'возвращает ответ со статусом 400.'
+        )
+
+    def test_03_scoped_rankings(self, admin_client, user_client,
+                                moderator_client, client):
+        titles, categories, genres = self.create_rankings(
+            admin_client, user_client, moderator_client
+        )
+        data = client.get(
+            self.TOP_URL, {'category': categories[0]['slug']}
+        ).json()
+        assert [title['id'] for title in data['results']] == [
+            titles[0]['id']
+        ], (
+            f'Проверьте, что `{self.TOP_URL}?category=` возвращает только '
+            'произведения указанной категории.'
+        )
+        response = client.get(
+            self.TOP_URL,
+            {'category': categories[0]['slug'], 'genre': genres[0]['slug']}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = client.get(self.TOP_URL, {'genre': 'unknown'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_refresh_is_incremental(self, admin_client, user_client,
+                                       moderator_client):
+        self.create_rankings(admin_client, user_client, moderator_client)
+        ids = set(Ranking.objects.values_list('pk', flat=True))
+        call_command('refresh_rankings')
+        assert set(Ranking.objects.values_list('pk', flat=True)) == ids, (
+            'Проверьте, что `refresh_rankings` не перезаписывает списки, '
+            'которые не изменились.'
+        )
@@ -0,0 +1,74 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.benchmarks.ordering import uses_filesort
+from api.filters import TITLE_ORDERINGS
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15OrderingAPI:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_ids(self, client, ordering):
+        response = client.get(self.TITLES_URL, {'ordering': ordering})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            f'`ordering={ordering}` возвращает ответ со статусом 200.'
+        )
+        return [title['id'] for title in response.json()['results']]
+
+    def test_01_orderings(self, admin_client, user_client, client):
+        titles, _, _ = create_titles(admin_client)
+        first, second = titles[0]['id'], titles[1]['id']
+        create_single_review(admin_client, first, 'Отзыв', 3)
+        create_single_review(admin_client, second, 'Отзыв', 8)
+        create_single_review(user_client, first, 'Отзыв', 5)
+        expected = {
+            'newest': [second, first],
+            'rating': [second, first],
+            '-rating': [first, second],
+            'review_count': [first, second],
+        }
+        for ordering, ids in expected.items():
+            assert self.get_ids(client, ordering) == ids, (
+                f'Проверьте, что `{self.TITLES_URL}?ordering={ordering}` '
+                'возвращает произведения в нужном порядке.'
+            )
+        assert self.get_ids(client, 'name') == sorted(
+            (first, second),
+            key=lambda pk: next(t['name'] for t in titles if t['id'] == pk)
+        )
+
+    def test_02_unreviewed_titles_placement(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        reviewed, unreviewed = titles[0]['id'], titles[1]['id']
+        create_single_review(admin_client, reviewed, 'Отзыв', 1)
+        for key in ('rating', 'weighted_rating'):
+            assert self.get_ids(client, key) == [reviewed, unreviewed], (
+                f'Проверьте, что при `ordering={key}` произведения без '
+                'отзывов идут после оценённых на любой базе данных.'
+            )
+            assert self.get_ids(client, f'-{key}') == [
+                unreviewed, reviewed
+            ], (
+                f'Проверьте, что `ordering=-{key}` возвращает обратный '
+                'порядок.'
+            )
+
+    def test_03_invalid_ordering(self, client):
+        response = client.get(self.TITLES_URL, {'ordering': 'description'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что `{self.TITLES_URL}` с недопустимым значением '
+            '`ordering` возвращает ответ со статусом 400.'
+        )
+
+    def test_04_orderings_use_indexes(self):
+        for key in TITLE_ORDERINGS:
+            for ordering in (key, f'-{key}'):
+                assert not uses_filesort(ordering), (
+                    f'Проверьте, что сортировка `{ordering}` выполняется '
+                    'по индексу, без сортировки в памяти.'
+                )
@@ -0,0 +1,122 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db.utils import load_backend
+
+from api.connections import check_connections, close_if_unusable
+from api_yamdb.settings import SQLITE_PRAGMAS
+
+
+POOLED_BACKEND = 'api_yamdb.db_backends.sqlite3'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Connections:
+
+    def test_01_sqlite_pragmas(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            busy_timeout = cursor.fetchone()[0]
+            cursor.execute('PRAGMA synchronous')
+            synchronous = cursor.fetchone()[0]
+        assert busy_timeout == SQLITE_PRAGMAS['busy_timeout'], (
+            'Проверьте, что при подключении к SQLite устанавливается '
+            '`busy_timeout` из настроек.'
+        )
+        assert synchronous == 1, (
+            'Проверьте, что при подключении к SQLite устанавливается '
+            '`synchronous = NORMAL`.'
+        )
+
+    def test_02_pool_reuses_connections(self, tmp_path):
+        settings_dict = dict(
+            connection.settings_dict, NAME=str(tmp_path / 'pool.sqlite3')
+        )
+        wrapper = load_backend(POOLED_BACKEND).DatabaseWrapper(
+            settings_dict, alias='pool-test'
+        )
+        wrapper.ensure_connection()
+        raw_connection = wrapper.connection
+        wrapper.close()
+        assert wrapper.connection is None
+        wrapper.ensure_connection()
+        assert wrapper.connection is raw_connection, (
+            'Проверьте, что закрытое соединение возвращается в пул и '
+            'переиспользуется при следующем подключении.'
+        )
+        with wrapper.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            assert cursor.fetchone()[0].lower() == 'wal'
+        wrapper.close()
+
+    def test_03_health_check(self, tmp_path):
+        settings_dict = dict(
+            connection.settings_dict,
+            NAME=str(tmp_path / 'persistent.sqlite3'),
+            CONN_MAX_AGE=60
+        )
+        backend = load_backend(connection.settings_dict['ENGINE'])
+        wrapper = backend.DatabaseWrapper(
+            settings_dict, alias='health-check-test'
+        )
+        wrapper.ensure_connection()
+        close_if_unusable(wrapper)
+        assert wrapper.connection is not None, (
+            'Проверьте, что исправное соединение не закрывается в начале '
+            'запроса.'
+        )
+        with mock.patch.object(wrapper, 'is_usable', return_value=False):
+            close_if_unusable(wrapper)
+        assert wrapper.connection is None, (
+            'Проверьте, что неисправное постоянное соединение закрывается в '
+            'начале запроса.'
+        )
+
+    def test_04_pool_discards_broken_connections(self, tmp_path):
+        settings_dict = dict(
+            connection.settings_dict, NAME=str(tmp_path / 'broken.sqlite3')
+        )
+        wrapper = load_backend(POOLED_BACKEND).DatabaseWrapper(
+            settings_dict, alias='broken-pool-test'
+        )
+        wrapper.ensure_connection()
+        raw_connection = wrapper.connection
+        raw_connection.close()
+        wrapper.close()
+        assert wrapper.get_pool().empty(), (
+            'Проверьте, что соединение, которое не удалось откатить, не '
+            'возвращается в пул.'
+        )
+        wrapper.ensure_connection()
+        assert wrapper.connection is not raw_connection
+        wrapper.close()
+
+    def test_05_lazy_health_check(self, tmp_path):
+        settings_dict = dict(
+            connection.settings_dict,
+            NAME=str(tmp_path / 'lazy.sqlite3'),
+            CONN_MAX_AGE=60
+        )
+        wrapper = load_backend(POOLED_BACKEND).DatabaseWrapper(
+            settings_dict, alias='lazy-check-test'
+        )
+        wrapper.ensure_connection()
+        with mock.patch(
+            'api.connections.connections', mock.Mock(all=lambda: [wrapper])
+        ), mock.patch.object(
+            wrapper, 'is_usable', return_value=True
+        ) as is_usable:
+            check_connections()
+            assert not is_usable.called, (
+                'Проверьте, что соединение не проверяется в начале запроса, '
+                'который не обращается к базе данных.'
+            )
+            for _ in range(2):
+                with wrapper.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            assert is_usable.call_count == 1, (
+                'Проверьте, что соединение проверяется один раз перед '
+                'первым запросом к базе данных.'
+            )
+        wrapper.close()
@@ -0,0 +1,98 @@
+from unittest import mock
+
+import pytest
+from django.db import connections
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from api.middleware import ReplicaRoutingMiddleware
+from api.routers import PrimaryReplicaRouter, read_from_replica
+from reviews.models import Title
+from reviews.slug_cache import category_slugs
+from tests.utils import create_titles
+
+
+@pytest.fixture
+def replica():
+    settings_dict = dict(connections.settings['default'])
+    with mock.patch.dict(connections.settings, {'replica': settings_dict}):
+        yield connections['replica']
+        connections['replica'].close()
+        del connections['replica']
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17Replica:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_router(self, replica):
+        router = PrimaryReplicaRouter()
+        assert router.db_for_read(Title) == 'default', (
+            'Проверьте, что вне GET-запросов чтение идёт из основной базы.'
+        )
+        token = read_from_replica.set(True)
+        try:
+            assert router.db_for_read(Title) == 'replica', (
+                'Проверьте, что при GET-запросах модели `reviews` читаются '
+                'из реплики.'
+            )
+            assert router.db_for_write(Title) == 'default', (
+                'Проверьте, что запись всегда идёт в основную базу.'
+            )
+        finally:
+            read_from_replica.reset(token)
+        assert router.allow_migrate('replica', 'reviews') is False
+
+    def test_02_reads_go_to_replica(self, admin_client, client, replica):
+        create_titles(admin_client)
+        with CaptureQueriesContext(replica) as context:
+            response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 2
+        assert context.captured_queries, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` читает данные '
+            'из реплики.'
+        )
+
+    def test_03_reads_stick_to_primary_after_write(self, admin_client,
+                                                   client, replica):
+        create_titles(admin_client)
+        with CaptureQueriesContext(replica) as context:
+            response = admin_client.get(self.TITLES_URL)
+        assert response.json()['count'] == 2
+        assert not context.captured_queries, (
+            'Проверьте, что после записи пользователь читает данные из '
+            'основной базы в течение `REPLICA_STICKY_SECONDS`.'
+        )
+        with CaptureQueriesContext(replica) as context:
+            client.get(self.TITLES_URL)
+        assert context.captured_queries, (
+            'Проверьте, что другие клиенты продолжают читать из реплики.'
+        )
+
+    def test_04_flag_reset_after_error(self, replica):
+        def failing_view(request):
+            assert read_from_replica.get() is True
+            raise RuntimeError
+
+        middleware = ReplicaRoutingMiddleware(failing_view)
+        with pytest.raises(RuntimeError):
+            middleware(RequestFactory().get(self.TITLES_URL))
+        assert read_from_replica.get() is False, (
+            'Проверьте, что флаг чтения из реплики сбрасывается, даже если '
+            'обработка запроса завершилась ошибкой.'
+        )
+
+    def test_05_slug_caches_read_primary(self, admin_client, replica):
+        create_titles(admin_client)
+        category_slugs.version = None
+        token = read_from_replica.set(True)
+        try:
+            with CaptureQueriesContext(replica) as context:
+                slugs = category_slugs.get_slugs()
+        finally:
+            read_from_replica.reset(token)
+        assert slugs and not context.captured_queries, (
+            'Проверьте, что кэш слагов категорий и жанров загружается из '
+            'основной базы, а не из отстающей реплики.'
+        )
@@ -0,0 +1,76 @@
+from unittest import mock
+
+from django.conf import settings
+from django.test import override_settings
+
+from api.checks import check_database_pool, check_production_settings
+
+
+PRODUCTION_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/tmp/yamdb-cache',
+    }
+}
+PRODUCTION_RENDERERS = {
+    'DEFAULT_RENDERER_CLASSES': ('rest_framework.renderers.JSONRenderer',),
+}
+
+
+def get_check_ids():
+    return {warning.id for warning in check_production_settings(None)}
+
+
+class Test18ProductionChecks:
+
+    def test_01_development_is_silent(self):
+        with override_settings(PRODUCTION=False, DEBUG=True):
+            assert not get_check_ids(), (
+                'Проверьте, что предупреждения о настройках выводятся только '
+                'в production-режиме.'
+            )
+
+    def test_02_misconfigured_production(self):
+        with override_settings(
+            PRODUCTION=True, DEBUG=True, ALLOWED_HOSTS=['*']
+        ):
+            ids = get_check_ids()
+        assert {
+            'api.W001', 'api.W002', 'api.W003', 'api.W005', 'api.W006',
+            'api.W007'
+        } <= ids, (
+            'Проверьте, что в production-режиме есть предупреждения о DEBUG, '
+            'CONN_MAX_AGE, локальном кеше, BrowsableAPIRenderer, '
+            'SECRET_KEY и ALLOWED_HOSTS.'
+        )
+
+    def test_03_configured_production(self):
+        with override_settings(
+            PRODUCTION=True,
+            DEBUG=False,
+            SECRET_KEY='production-secret',
+            ALLOWED_HOSTS=['api.yamdb.ru'],
+            CACHES=PRODUCTION_CACHES,
+            REST_FRAMEWORK=PRODUCTION_RENDERERS,
+        ), mock.patch.dict(settings.DATABASES['default'], CONN_MAX_AGE=60):
+            assert not get_check_ids(), (
+                'Проверьте, что для правильно настроенного production-режима '
+                'предупреждений нет.'
+            )
+
+    def test_04_pool_ignored_by_engine(self):
+        with override_settings(DB_POOL_SIZE=5), mock.patch.dict(
+            settings.DATABASES['default'],
+            ENGINE='django.db.backends.postgresql'
+        ):
+            assert [
+                warning.id for warning in check_database_pool(None)
+            ] == ['api.W008'], (
+                'Проверьте, что есть предупреждение, если DB_POOL_SIZE задан '
+                'для базы без пула соединений.'
+            )
+        with override_settings(DB_POOL_SIZE=5), mock.patch.dict(
+            settings.DATABASES['default'],
+            ENGINE='api_yamdb.db_backends.sqlite3'
+        ):
+            assert not check_database_pool(None)
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import resolve
+
+from api.benchmarks.asgi import set_async_reads
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.fixture
+def async_reads():
+    set_async_reads(True)
+    yield
+    set_async_reads(False)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19AsyncViews:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_read_routes_are_async(self, async_reads):
+        title_url = f'{self.TITLES_URL}1/'
+        for url in (
+            self.TITLES_URL, title_url, f'{title_url}reviews/',
+            f'{title_url}reviews/1/comments/'
+        ):
+            assert asyncio.iscoroutinefunction(resolve(url).func), (
+                f'Проверьте, что при развёртывании через ASGI `{url}` '
+                'обслуживается асинхронным представлением.'
+            )
+        assert not asyncio.iscoroutinefunction(
+            resolve('/api/v1/categories/').func
+        )
+
+    def test_02_same_contract(self, admin_client, client, async_reads):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            admin_client, titles[0]['id'], 'Отзыв', 7
+        ).json()
+        async_client = AsyncClient()
+
+        async def async_get(url):
+            return await async_client.get(url)
+
+        for url in (
+            self.TITLES_URL,
+            f'{self.TITLES_URL}{titles[0]["id"]}/',
+            f'{self.TITLES_URL}{titles[0]["id"]}/reviews/',
+            f'{self.TITLES_URL}{titles[0]["id"]}/reviews/{review["id"]}/'
+            'comments/',
+        ):
+            response = async_to_sync(async_get)(url)
+            expected = client.get(url)
+            assert response.status_code == expected.status_code, (
+                f'Проверьте, что асинхронное представление `{url}` '
+                'возвращает тот же статус, что и синхронное.'
+            )
+            assert response.json() == expected.json(), (
+                f'Проверьте, что асинхронное представление `{url}` '
+                'возвращает те же данные, что и синхронное.'
+            )
+
+    def test_03_writes_still_work(self, admin_client, async_reads):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'Отзыв', 5)
+        response = admin_client.get(
+            f'{self.TITLES_URL}{titles[0]["id"]}/reviews/'
+        )
+        assert response.json()['count'] == 1, (
+            'Проверьте, что запись через асинхронные представления '
+            'сохраняет данные.'
+        )
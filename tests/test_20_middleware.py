@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.test import Client, override_settings
+
+from api.checks import check_admin_only_middleware
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20AdminOnlyMiddleware:
+
+    TITLES_URL = '/api/v1/titles/'
+    ADMIN_URL = '/admin/'
+
+    def test_01_api_skips_sessions(self, client):
+        response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert not hasattr(response.wsgi_request, 'session'), (
+            f'Проверьте, что запросы к `{self.TITLES_URL}` не проходят '
+            'через SessionMiddleware.'
+        )
+        assert not hasattr(response.wsgi_request, '_messages'), (
+            f'Проверьте, что запросы к `{self.TITLES_URL}` не проходят '
+            'через MessageMiddleware.'
+        )
+
+    def test_02_admin_keeps_full_stack(self, user_superuser):
+        client = Client()
+        client.force_login(user_superuser)
+        response = client.get(self.ADMIN_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что `{self.ADMIN_URL}` по-прежнему работает с '
+            'сессиями и авторизацией.'
+        )
+        csrf_client = Client(enforce_csrf_checks=True)
+        response = csrf_client.post(
+            f'{self.ADMIN_URL}login/',
+            {'username': 'user', 'password': 'password'}
+        )
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что формы `{self.ADMIN_URL}` по-прежнему '
+            'защищены от CSRF.'
+        )
+
+    def test_03_admin_middleware_check(self):
+        assert not check_admin_only_middleware(None), (
+            'Проверьте, что при текущих настройках проверка middleware '
+            'админки проходит.'
+        )
+        without_wrapper = [
+            middleware for middleware in settings.MIDDLEWARE
+            if middleware != settings.ADMIN_ONLY_MIDDLEWARE_CLASS
+        ]
+        with override_settings(MIDDLEWARE=without_wrapper):
+            errors = check_admin_only_middleware(None)
+        assert len(errors) == 3 and {
+            error.id for error in errors
+        } == {'api.E001'}, (
+            'Проверьте, что без AdminOnlyMiddleware проверка `api.E001` '
+            'сообщает о недостающих middleware админки.'
+        )
@@ -0,0 +1,108 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from api.benchmarks import measure
+from api.throttling import (
+    AuthIPThrottle, AuthUserThrottle, TokenBucketThrottle
+)
+
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+TOKEN_URL = '/api/v1/auth/token/'
+
+
+def signup_data(number):
+    return {'username': f'user{number}', 'email': f'user{number}@yamdb.fake'}
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21AuthThrottling:
+
+    def test_01_throttle_per_user(self, client):
+        capacity, _ = AuthUserThrottle().parse_rate(AuthUserThrottle().rate)
+        for _ in range(capacity):
+            response = client.post(SIGNUP_URL, data=signup_data(1))
+            assert response.status_code == HTTPStatus.OK
+        response = client.post(SIGNUP_URL, data=signup_data(1))
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            f'Проверьте, что частые POST-запросы к `{SIGNUP_URL}` с одним '
+            'и тем же username возвращают ответ со статусом 429.'
+        )
+        assert int(response['Retry-After']) > 0, (
+            'Проверьте, что ответ со статусом 429 содержит заголовок '
+            '`Retry-After`.'
+        )
+        response = client.post(
+            TOKEN_URL,
+            data={'username': 'user1', 'confirmation_code': 'wrong'}
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            f'Проверьте, что `{TOKEN_URL}` делит лимит по username с '
+            f'`{SIGNUP_URL}`.'
+        )
+        response = client.post(SIGNUP_URL, data=signup_data(2))
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит по username не задевает других '
+            'пользователей.'
+        )
+
+    def test_02_throttle_per_ip(self, client):
+        capacity, _ = AuthIPThrottle().parse_rate(AuthIPThrottle().rate)
+        for number in range(capacity):
+            response = client.post(TOKEN_URL, data={
+                'username': f'user{number}', 'confirmation_code': 'wrong'
+            })
+            assert response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+        response = client.post(SIGNUP_URL, data=signup_data(capacity))
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что запросы с одного IP ограничиваются независимо '
+            'от username.'
+        )
+
+    def test_03_bucket_refills(self):
+        request = APIRequestFactory().post(SIGNUP_URL)
+        throttle = AuthIPThrottle()
+        capacity, duration = throttle.num_requests, throttle.duration
+        with mock.patch.object(AuthIPThrottle, 'timer', return_value=1000.0):
+            for _ in range(capacity):
+                assert throttle.allow_request(request, None)
+            assert not throttle.allow_request(request, None)
+            assert throttle.wait() == pytest.approx(duration / capacity)
+        with mock.patch.object(
+            AuthIPThrottle, 'timer',
+            return_value=1000.0 + duration / capacity
+        ):
+            assert throttle.allow_request(request, None), (
+                'Проверьте, что корзина пополняется со временем.'
+            )
+            assert not throttle.allow_request(request, None)
+
+    def test_04_throttle_overhead(self):
+        request = APIRequestFactory().post(SIGNUP_URL)
+        throttle = AuthIPThrottle()
+        assert measure(
+            lambda: throttle.allow_request(request, None), 1000
+        ) < 1, (
+            'Проверьте, что проверка лимита занимает микросекунды, а не '
+            'миллисекунды.'
+        )
+
+    def test_05_default_idents(self, user):
+        throttle = type(
+            'ScopedThrottle', (TokenBucketThrottle,), {'scope': 'auth_ip'}
+        )()
+        factory = APIRequestFactory()
+        request = factory.get('/', REMOTE_ADDR='10.0.0.7')
+        request.user = mock.Mock(is_authenticated=False)
+        assert throttle.get_idents(request, None) == ('10.0.0.7',), (
+            'Проверьте, что по умолчанию анонимные запросы ограничиваются '
+            'по IP-адресу.'
+        )
+        request.user = user
+        assert throttle.get_idents(request, None) == (user.pk,), (
+            'Проверьте, что по умолчанию запросы авторизованного '
+            'пользователя ограничиваются по его id.'
+        )
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from api.throttling import (
+    RATE_LIMIT_HEADER, RATE_REMAINING_HEADER, RoleRateThrottle
+)
+from tests.utils import create_titles
+
+
+def throttle_rates(**rates):
+    return override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates
+    })
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22RoleThrottling:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_rate_limit_headers(self, user_client):
+        response = user_client.get(self.TITLES_URL)
+        limit, _ = RoleRateThrottle().parse_rate(
+            settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']['user_read']
+        )
+        assert response[RATE_LIMIT_HEADER] == str(limit), (
+            'Проверьте, что ответ содержит заголовок '
+            f'`{RATE_LIMIT_HEADER}` с лимитом для роли пользователя.'
+        )
+        assert response[RATE_REMAINING_HEADER] == str(limit - 1), (
+            'Проверьте, что ответ содержит заголовок '
+            f'`{RATE_REMAINING_HEADER}` с оставшимся числом запросов.'
+        )
+
+    def test_02_write_limits_by_role(self, admin_client, user_client,
+                                     moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        rates = dict(
+            settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'],
+            user_write='1/minute'
+        )
+        with throttle_rates(**rates):
+            response = user_client.post(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+                data={'text': 'Отзыв', 'score': 5}
+            )
+            assert response.status_code == HTTPStatus.CREATED
+            response = user_client.post(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id']),
+                data={'text': 'Отзыв', 'score': 5}
+            )
+            assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+                'Проверьте, что запись пользователя с ролью `user` '
+                'ограничивается отдельным лимитом.'
+            )
+            assert int(response['Retry-After']) > 0
+            assert response[RATE_REMAINING_HEADER] == '0'
+            response = moderator_client.post(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id']),
+                data={'text': 'Отзыв', 'score': 5}
+            )
+            assert response.status_code == HTTPStatus.CREATED, (
+                'Проверьте, что лимит роли `user` не задевает модераторов.'
+            )
+            response = admin_client.get(self.TITLES_URL)
+            assert RATE_LIMIT_HEADER not in response, (
+                'Проверьте, что администраторы не ограничиваются.'
+            )
+
+    def test_03_sliding_window(self):
+        request = APIRequestFactory().get(self.TITLES_URL)
+        request.user = AnonymousUser()
+        view = mock.Mock(headers={})
+
+        def allowed(now, count):
+            with throttle_rates(anon_read='4/minute'), mock.patch.object(
+                RoleRateThrottle, 'timer', return_value=now
+            ):
+                return [
+                    RoleRateThrottle().allow_request(request, view)
+                    for _ in range(count)
+                ]
+
+        assert allowed(600.0, 5) == [True] * 4 + [False]
+        assert allowed(690.0, 3) == [True, True, False], (
+            'Проверьте, что запросы предыдущего окна учитываются '
+            'пропорционально прошедшему времени.'
+        )
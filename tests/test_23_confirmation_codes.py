@@ -0,0 +1,88 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from reviews.models import ConfirmationCode
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23ConfirmationCodes:
+
+    SIGNUP_URL = '/api/v1/auth/signup/'
+    TOKEN_URL = '/api/v1/auth/token/'
+    USER_DATA = {'username': 'code_user', 'email': 'code_user@yamdb.fake'}
+
+    def signup(self, client):
+        mail.outbox.clear()
+        response = client.post(self.SIGNUP_URL, data=self.USER_DATA)
+        assert response.status_code == HTTPStatus.OK
+        return mail.outbox[-1].body.rsplit(' ', 1)[-1]
+
+    def get_token(self, client, code):
+        return client.post(self.TOKEN_URL, data={
+            'username': self.USER_DATA['username'],
+            'confirmation_code': code
+        })
+
+    def test_01_code_is_hashed_and_single_use(self, client):
+        code = self.signup(client)
+        stored = ConfirmationCode.objects.get()
+        assert code not in stored.code_hash, (
+            'Проверьте, что код подтверждения хранится в виде хеша.'
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_token(client, code)
+        assert response.status_code == HTTPStatus.OK
+        assert 'token' in response.json()
+        writes = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ]
+        assert len(writes) == 1 and writes[0].startswith('DELETE'), (
+            'Проверьте, что проверка кода выполняется одним атомарным '
+            'удалением, без сохранения пользователя.'
+        )
+        response = self.get_token(client, code)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что код подтверждения можно использовать только '
+            'один раз.'
+        )
+
+    def test_02_wrong_code_invalidates(self, client):
+        code = self.signup(client)
+        response = self.get_token(client, 'wrong')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = self.get_token(client, code)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что после неверной попытки код подтверждения '
+            'перестаёт действовать.'
+        )
+        code = self.signup(client)
+        assert self.get_token(client, code).status_code == HTTPStatus.OK, (
+            'Проверьте, что повторная регистрация выдаёт новый код.'
+        )
+
+    def test_03_expired_codes(self, client):
+        code = self.signup(client)
+        ConfirmationCode.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        response = self.get_token(client, code)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что просроченный код подтверждения не принимается.'
+        )
+        self.signup(client)
+        ConfirmationCode.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        call_command('purge_confirmation_codes')
+        assert not ConfirmationCode.objects.exists(), (
+            'Проверьте, что команда `purge_confirmation_codes` удаляет '
+            'просроченные коды.'
+        )
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.throttling import TokenBucketThrottle
+from reviews.models import ConfirmationCode, YaMDBUser
+
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+THREADS = 8
+
+
+def in_thread(func, *args):
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def post_signups(payloads):
+    def post(data):
+        return in_thread(APIClient().post, SIGNUP_URL, data)
+
+    with mock.patch.object(TokenBucketThrottle, 'THROTTLE_RATES', {
+        'auth_ip': None, 'auth_user': None
+    }):
+        with ThreadPoolExecutor(THREADS) as executor:
+            return list(executor.map(post, payloads))
+
+
+def query(func):
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(in_thread, func).result()
+
+
+@pytest.fixture
+def file_database(tmp_path):
+    # In-memory SQLite shares one cache between threads and fails with
+    # "table is locked" instead of waiting, so worker threads use a file
+    with mock.patch.dict(
+        connections.databases['default'],
+        NAME=str(tmp_path / 'signup.sqlite3')
+    ):
+        query(lambda: call_command('migrate', verbosity=0))
+        yield
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24SignupConcurrency:
+
+    def test_01_concurrent_signups_of_one_user(self, file_database):
+        data = {'username': 'racer', 'email': 'racer@yamdb.fake'}
+        responses = post_signups([data] * THREADS)
+        assert all(
+            response.status_code == HTTPStatus.OK for response in responses
+        ), (
+            'Проверьте, что одновременные регистрации одного пользователя '
+            'завершаются успешно.'
+        )
+        assert query(
+            YaMDBUser.objects.filter(username='racer').count
+        ) == 1
+        assert query(ConfirmationCode.objects.count) == 1
+
+    def test_02_concurrent_username_conflicts(self, file_database):
+        responses = post_signups([
+            {'username': 'racer', 'email': f'racer{number}@yamdb.fake'}
+            for number in range(THREADS)
+        ])
+        statuses = [response.status_code for response in responses]
+        assert statuses.count(HTTPStatus.OK) == 1, (
+            'Проверьте, что при одновременной регистрации одного username '
+            'с разными почтами создаётся ровно один пользователь.'
+        )
+        for response in responses:
+            if response.status_code != HTTPStatus.OK:
+                assert 'username' in response.json(), (
+                    'Проверьте, что конфликт по username возвращается в '
+                    'поле `username`.'
+                )
+
+    def test_03_signup_queries(self, client):
+        data = {'username': 'single', 'email': 'single@yamdb.fake'}
+        client.post(SIGNUP_URL, data=data)
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                SIGNUP_URL, data={**data, 'email': 'other@yamdb.fake'}
+            )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'username' in response.json()
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if not query['sql'].startswith(('BEGIN', 'SAVEPOINT', 'RELEASE'))
+        ]
+        assert len(statements) == 2, (
+            'Проверьте, что конфликт при регистрации определяется одним '
+            'запросом после вставки.'
+        )
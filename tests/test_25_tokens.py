@@ -0,0 +1,157 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from api_yamdb.settings import REVOKED_TOKENS_SYNC_SECONDS
+
+from reviews.confirmation_codes import issue_code
+from reviews.models import RevokedToken
+from reviews.revoked_tokens import revoked_tokens
+
+
+TOKEN_URL = '/api/v1/auth/token/'
+REFRESH_URL = '/api/v1/auth/token/refresh/'
+REVOKE_URL = '/api/v1/auth/token/revoke/'
+ME_URL = '/api/v1/users/me/'
+
+
+def bearer_client(token):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_revoked_tokens():
+    revoked_tokens.reset()
+    yield
+    revoked_tokens.reset()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Tokens:
+
+    def get_tokens(self, client, user):
+        response = client.post(TOKEN_URL, data={
+            'username': user.username,
+            'confirmation_code': issue_code(user)
+        })
+        assert response.status_code == HTTPStatus.OK
+        return response.json()
+
+    def test_01_refresh_rotates(self, client, user):
+        tokens = self.get_tokens(client, user)
+        assert {'token', 'refresh'} <= set(tokens), (
+            f'Проверьте, что `{TOKEN_URL}` возвращает access- и '
+            'refresh-токены.'
+        )
+        response = client.post(REFRESH_URL, data={
+            'refresh': tokens['refresh']
+        })
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что `{REFRESH_URL}` выдаёт новую пару токенов.'
+        )
+        new_tokens = response.json()
+        assert bearer_client(new_tokens['token']).get(ME_URL).status_code == (
+            HTTPStatus.OK
+        )
+        response = client.post(REFRESH_URL, data={
+            'refresh': tokens['refresh']
+        })
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что использованный refresh-токен нельзя применить '
+            'повторно.'
+        )
+
+    def test_02_revoke(self, client, user):
+        tokens = self.get_tokens(client, user)
+        user_client = bearer_client(tokens['token'])
+        user_client.get(ME_URL)
+        with CaptureQueriesContext(connection) as context:
+            assert user_client.get(ME_URL).status_code == HTTPStatus.OK
+        assert not any(
+            RevokedToken._meta.db_table in query['sql']
+            for query in context.captured_queries
+        ), (
+            'Проверьте, что проверка отзыва токена не обращается к базе '
+            'данных на каждом запросе.'
+        )
+        response = user_client.post(REVOKE_URL, data={
+            'refresh': tokens['refresh']
+        })
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert user_client.get(ME_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), 'Проверьте, что отозванный access-токен отклоняется.'
+        response = client.post(REFRESH_URL, data={
+            'refresh': tokens['refresh']
+        })
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что отозванный refresh-токен отклоняется.'
+        )
+
+    def test_03_revocations_sync_from_database(self, user):
+        token = AccessToken.for_user(user)
+        RevokedToken.objects.create(
+            jti=token['jti'],
+            expires_at=timezone.now() + timedelta(days=1)
+        )
+        revoked_tokens.reset()
+        response = bearer_client(token).get(ME_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что токены, отозванные в другом процессе, '
+            'подгружаются из базы данных.'
+        )
+
+    def test_04_role_change_revokes_tokens(self, admin_client, user):
+        token = AccessToken.for_user(user)
+        token['iat'] -= 10
+        user_client = bearer_client(token)
+        assert user_client.get(ME_URL).status_code == HTTPStatus.OK
+        admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'moderator'}
+        )
+        assert user_client.get(ME_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), (
+            'Проверьте, что после смены роли ранее выданные токены '
+            'отклоняются.'
+        )
+        assert bearer_client(
+            AccessToken.for_user(user)
+        ).get(ME_URL).status_code == HTTPStatus.OK
+
+    def test_05_refresh_replay_in_other_process(self, client, user):
+        tokens = self.get_tokens(client, user)
+        revoked_tokens.sync()
+        RevokedToken.objects.create(
+            jti=RefreshToken(tokens['refresh'])['jti'],
+            expires_at=timezone.now() + timedelta(days=1)
+        )
+        response = client.post(REFRESH_URL, data={
+            'refresh': tokens['refresh']
+        })
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что refresh-токен, уже использованный другим '
+            'процессом, нельзя применить повторно до синхронизации.'
+        )
+
+    def test_06_sync_picks_up_late_commits(self, user):
+        expires_at = timezone.now() + timedelta(days=1)
+        RevokedToken.objects.create(pk=1000, jti='seen', expires_at=expires_at)
+        revoked_tokens.sync()
+        token = AccessToken.for_user(user)
+        RevokedToken.objects.create(
+            pk=500, jti=token['jti'], expires_at=expires_at
+        )
+        revoked_tokens.synced_at -= REVOKED_TOKENS_SYNC_SECONDS
+        assert revoked_tokens.is_revoked(token['jti']), (
+            'Проверьте, что синхронизация подгружает отзывы, '
+            'зафиксированные позже записей с большим id.'
+        )
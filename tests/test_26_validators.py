@@ -0,0 +1,25 @@
+import pytest
+from django.core.exceptions import ValidationError
+
+from api.benchmarks.validators import findall_validate_username
+from reviews.validators import validate_username
+
+
+class Test26UsernameValidator:
+
+    @pytest.mark.parametrize('username', (
+        'user', 'user.name', 'user@yamdb', 'a+b-c_d', 'имя', 'me', 'me!', '',
+        'us er', 'bad#name#', 'semi;colon',
+    ))
+    def test_01_same_result_as_findall(self, username):
+        try:
+            expected = findall_validate_username(username)
+        except ValidationError as error:
+            with pytest.raises(ValidationError) as raised:
+                validate_username(username)
+            assert set(raised.value.messages[0]) == set(error.messages[0]), (
+                'Проверьте, что `validate_username` сообщает о тех же '
+                'недопустимых символах.'
+            )
+        else:
+            assert validate_username(username) == expected
@@ -0,0 +1,182 @@
+import os
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import YaMDBUser
+
+
+USERS_CSV_HEADER = 'id,username,email,role,bio,first_name,last_name\n'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27BulkUsers:
+
+    USERS_BULK_URL = '/api/v1/users/bulk/'
+
+    def test_01_bulk_permissions(self, moderator_client, user_client):
+        data = [{'username': 'new_user', 'email': 'new@yamdb.fake'}]
+        for client in (moderator_client, user_client):
+            response = client.post(
+                self.USERS_BULK_URL, data=data, format='json'
+            )
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                f'Проверьте, что POST-запрос не администратора к '
+                f'`{self.USERS_BULK_URL}` возвращает ответ со статусом 403.'
+            )
+
+    def test_02_bulk_create(self, admin_client, user):
+        data = [
+            {'username': f'user_{index}', 'email': f'{index}@yamdb.fake'}
+            for index in range(20)
+        ]
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.post(
+                self.USERS_BULK_URL, data=data, format='json'
+            )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.USERS_BULK_URL}` создаёт пользователей.'
+        )
+        assert YaMDBUser.objects.filter(username__startswith='user_').count(
+        ) == 20
+        inserts = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('INSERT')
+        ]
+        assert len(inserts) == 1, (
+            'Проверьте, что пользователи создаются одним запросом.'
+        )
+        assert len(context.captured_queries) <= 8, (
+            'Проверьте, что уникальность username и email проверяется одним '
+            'запросом для всего списка.'
+        )
+
+        invalid_data = [
+            {'username': 'fresh', 'email': 'fresh@yamdb.fake'},
+            {'username': 'fresh', 'email': 'other@yamdb.fake'},
+            {'username': user.username, 'email': 'third@yamdb.fake'},
+            {'username': 'bad name', 'email': 'bad@yamdb.fake'},
+            {'username': 'no_email'},
+        ]
+        response = admin_client.post(
+            self.USERS_BULK_URL, data=invalid_data, format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что POST-запрос к `{self.USERS_BULK_URL}` с '
+            'некорректными пользователями возвращает ответ со статусом 400.'
+        )
+        errors = response.json()
+        assert errors[0] == {}
+        assert set(errors[1]) == {'username'}
+        assert set(errors[2]) == {'username'}
+        assert set(errors[3]) == {'username'}
+        assert set(errors[4]) == {'email'}
+        assert not YaMDBUser.objects.filter(username='fresh').exists(), (
+            'Проверьте, что при ошибках пользователи не создаются.'
+        )
+
+    def test_03_bulk_role_change_and_deactivate(self, admin_client, user,
+                                                moderator):
+        data = [
+            {'username': user.username, 'role': 'moderator'},
+            {'username': moderator.username, 'is_active': False},
+        ]
+        response = admin_client.patch(
+            self.USERS_BULK_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что PATCH-запрос администратора к '
+            f'`{self.USERS_BULK_URL}` изменяет пользователей.'
+        )
+        user.refresh_from_db()
+        moderator.refresh_from_db()
+        assert user.role == 'moderator' and moderator.is_active is False
+        assert user.tokens_valid_after and moderator.tokens_valid_after, (
+            'Проверьте, что смена роли и деактивация отзывают токены '
+            'пользователей.'
+        )
+        response = admin_client.patch(
+            self.USERS_BULK_URL,
+            data=[{'username': 'missing', 'role': 'admin'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert set(response.json()[0]) == {'username'}
+
+    def test_04_import_users(self, tmp_path, user):
+        path = tmp_path / 'users.csv'
+        path.write_text(
+            USERS_CSV_HEADER
+            + '10000,first,first@yamdb.fake,user,,,\n'
+            + '10001,second,second@yamdb.fake,admin,,,\n'
+            + '10002,first,third@yamdb.fake,user,,,\n'
+            + f'10003,{user.username},fourth@yamdb.fake,user,,,\n'
+            + '10004,bad name,bad@yamdb.fake,user,,,\n'
+            + '10005,no_email,wrong,user,,,\n'
+            + '10006,no_role,no_role@yamdb.fake,king,,,\n',
+            encoding='utf-8'
+        )
+        with CaptureQueriesContext(connection) as context:
+            call_command('import_users', str(path))
+        assert set(YaMDBUser.objects.exclude(pk=user.pk).values_list(
+            'username', flat=True
+        )) == {'first', 'second'}, (
+            'Проверьте, что `import_users` добавляет только корректные '
+            'строки.'
+        )
+        inserts = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('INSERT')
+        ]
+        assert len(inserts) == 1, (
+            'Проверьте, что `import_users` добавляет пользователей через '
+            '`bulk_create`.'
+        )
+
+    def test_05_import_report(self, tmp_path, capsys):
+        path = tmp_path / 'users.csv'
+        path.write_text(
+            USERS_CSV_HEADER
+            + '1,first,first@yamdb.fake,user,,,\n'
+            + '2,first,second@yamdb.fake,user,,,\n',
+            encoding='utf-8'
+        )
+        call_command('import_users', str(path))
+        output = capsys.readouterr().out
+        assert 'Строка 3: username' in output, (
+            'Проверьте, что `import_users` выводит ошибки с номером строки.'
+        )
+        assert 'строк/с' in output, (
+            'Проверьте, что `import_users` выводит скорость загрузки.'
+        )
+
+    def test_06_fill_db_is_idempotent(self, capsys):
+        data_dir = os.path.join(settings.BASE_DIR, 'static', 'data', '')
+        call_command('fill_db_from_csv', data_dir)
+        users = YaMDBUser.objects.count()
+        capsys.readouterr()
+        call_command('fill_db_from_csv', data_dir)
+        output = capsys.readouterr().out
+        assert YaMDBUser.objects.count() == users and users, (
+            'Проверьте, что повторный запуск `fill_db_from_csv` не добавляет '
+            'пользователей.'
+        )
+        assert f'пропущено: {users}, ошибок: 0' in output, (
+            'Проверьте, что `fill_db_from_csv` пропускает уже загруженных '
+            'пользователей, а не считает их ошибками.'
+        )
+
+    def test_07_bulk_username_reserved(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/users/',
+            data={'username': 'bulk', 'email': 'bulk@yamdb.fake'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что username `bulk` недопустим: он совпадает с '
+            f'адресом `{self.USERS_BULK_URL}`.'
+        )
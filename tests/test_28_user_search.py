@@ -0,0 +1,91 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.benchmarks.user_search import uses_scan
+from api.filters import prefix_search
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28UserSearch:
+
+    USERS_URL = '/api/v1/users/'
+
+    def search(self, client, term):
+        response = client.get(self.USERS_URL, {'search': term})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.USERS_URL}?search={term}` '
+            'возвращает ответ со статусом 200.'
+        )
+        return [user['username'] for user in response.json()['results']]
+
+    def test_01_prefix_search(self, admin_client, admin, user, moderator):
+        assert self.search(admin_client, 'testm') == [moderator.username], (
+            f'Проверьте, что `{self.USERS_URL}?search=` ищет пользователей '
+            'по началу username без учёта регистра.'
+        )
+        assert self.search(admin_client, 'TESTUSER@') == [user.username], (
+            f'Проверьте, что `{self.USERS_URL}?search=` ищет пользователей '
+            'по началу email.'
+        )
+        assert self.search(admin_client, 'Test') == sorted(
+            (admin.username, user.username, moderator.username)
+        )
+
+    def test_02_substring_fallback(self, admin_client, admin, user):
+        assert self.search(admin_client, 'user') == [user.username], (
+            f'Проверьте, что `{self.USERS_URL}?search=` ищет по подстроке, '
+            'если по началу строки ничего не найдено.'
+        )
+        assert self.search(admin_client, 'er') == [user.username], (
+            'Проверьте, что поиск по подстроке выполняется и для коротких '
+            'запросов.'
+        )
+        with CaptureQueriesContext(connection) as context:
+            self.search(admin_client, 'testu')
+        assert not any(
+            'LIKE' in query['sql'] for query in context.captured_queries
+        ), (
+            'Проверьте, что поиск по подстроке не выполняется, если '
+            'найдены совпадения по началу строки.'
+        )
+
+    def test_03_prefix_search_uses_index(self):
+        assert not uses_scan(prefix_search, 'test'), (
+            'Проверьте, что поиск по началу username и email выполняется по '
+            'индексу, без просмотра всей таблицы.'
+        )
+
+    def test_04_reads_only_response_columns(self, admin_client, admin):
+        with CaptureQueriesContext(connection) as context:
+            self.search(admin_client, 'te')
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if 'LOWER(' in query['sql'] and 'COUNT' not in query['sql']
+        ]
+        assert len(selects) == 1 and '"password"' not in selects[0], (
+            f'Проверьте, что `{self.USERS_URL}` читает только поля, '
+            'возвращаемые в ответе.'
+        )
+
+    def test_05_non_ascii_search(self, admin_client, admin):
+        for username in ('Иван', 'Иванна'):
+            admin_client.post(self.USERS_URL, data={
+                'username': f'{username}_user',
+                'email': f'{len(username)}@yamdb.fake'
+            })
+        with CaptureQueriesContext(connection) as context:
+            found = self.search(admin_client, 'Ив')
+        assert found == ['Иван_user', 'Иванна_user'], (
+            f'Проверьте, что `{self.USERS_URL}?search=` находит '
+            'пользователей по строке не из латинских букв.'
+        )
+        assert not any(
+            query['sql'].startswith('SELECT (1)')
+            for query in context.captured_queries
+        ), (
+            'Проверьте, что поиск не делает отдельный запрос на проверку '
+            'совпадений по началу строки.'
+        )